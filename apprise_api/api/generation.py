@@ -0,0 +1,165 @@
+# Copyright (C) 2026 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import logging
+import mmap
+import os
+import struct
+import threading
+import zlib
+
+try:
+    # Not available on Microsoft Windows
+    import fcntl
+
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+# Get an instance of a logger
+logger = logging.getLogger("django")
+
+# Each slot is an unsigned 64-bit (little endian) counter
+_SLOT = struct.Struct("<Q")
+
+
+class AppriseGenerationTable:
+    """
+    A table of generation counters shared by every process (worker) that maps
+    the same file into memory.
+
+    A key is hashed onto one of the available slots; every change made to the
+    content associated with that key bumps the counter found there.  A worker
+    holding a copy of the content in memory only needs to compare the counter
+    it recorded (before it read the content) against the one currently in the
+    table to know whether or not its copy is still current.
+
+    Two keys may share a slot; this only ever results in an unnecessary reload
+    and never in stale content being used.
+
+    The table is best placed on a memory backed filesystem such as /dev/shm.
+    If the file can not be prepared, the table is disabled and evaluates to
+    False.
+    """
+
+    def __init__(self, path, slots=16384):
+        """
+        Prepare (or attach to an already existing) generation table
+        """
+        self.path = path
+        self.slots = max(1, int(slots))
+
+        # Our memory map (when enabled)
+        self._mmap = None
+
+        # Our file descriptor (used for locking)
+        self._fd = None
+
+        # POSIX locks are held per process; this prevents our own greenlets
+        # and threads from bumping the same counter concurrently
+        self._lock = threading.Lock()
+
+        if not path:
+            # Disabled
+            return
+
+        size = self.slots * _SLOT.size
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o660)
+
+        except OSError as e:
+            logger.warning("Configuration generation table %s could not be opened: %s", path, str(e))
+            return
+
+        try:
+            if os.fstat(fd).st_size < size:
+                # Newly created (or smaller than expected); a file extended
+                # with ftruncate() reads back as zeros
+                os.ftruncate(fd, size)
+
+            self._mmap = mmap.mmap(fd, size, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+
+        except (OSError, ValueError) as e:
+            logger.warning("Configuration generation table %s could not be mapped: %s", path, str(e))
+            os.close(fd)
+            return
+
+        self._fd = fd
+
+    def offset(self, key):
+        """
+        Returns the byte offset of the slot associated with the key
+        """
+        return (zlib.crc32(key.encode()) % self.slots) * _SLOT.size
+
+    def get(self, key):
+        """
+        Returns the current generation of the key, or None if the table is
+        disabled
+        """
+        if self._mmap is None:
+            return None
+
+        return _SLOT.unpack_from(self._mmap, self.offset(key))[0]
+
+    def bump(self, key):
+        """
+        Advances the generation of the key; this must be called after the
+        content associated with the key has been changed.
+
+        Returns the new generation, or None if the table is disabled
+        """
+        if self._mmap is None:
+            return None
+
+        offset = self.offset(key)
+        with self._lock:
+            if fcntl is not None:
+                fcntl.lockf(self._fd, fcntl.LOCK_EX, _SLOT.size, offset)
+
+            try:
+                generation = (_SLOT.unpack_from(self._mmap, offset)[0] + 1) & 0xFFFFFFFFFFFFFFFF
+                _SLOT.pack_into(self._mmap, offset, generation)
+
+            finally:
+                if fcntl is not None:
+                    fcntl.lockf(self._fd, fcntl.LOCK_UN, _SLOT.size, offset)
+
+        return generation
+
+    def close(self):
+        """
+        Releases our memory map
+        """
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __bool__(self):
+        """
+        Returns True if the table is available for use
+        """
+        return self._mmap is not None
@@ -0,0 +1,581 @@
+# Copyright (C) 2026 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager, suppress
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+
+import apprise
+from django.conf import settings
+
+from .utils import (
+    A_MGR,
+    AppriseLogCapture,
+    Attachment,
+    apply_global_filters,
+    log_entry,
+    send_webhook,
+    service_optional,
+    service_retry,
+)
+
+try:
+    # Not available on Microsoft Windows
+    import fcntl
+
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+# Get an instance of a logger
+logger = logging.getLogger("django")
+
+# A valid job identifier
+JOB_ID_RE = re.compile(r"^[a-f0-9]{32}$")
+
+
+class AppriseJobStatus:
+    """
+    Defines the states a queued notification (job) can be in
+    """
+
+    # Waiting to be delivered
+    QUEUED = "queued"
+
+    # Delivery is in progress
+    RUNNING = "running"
+
+    # All notifications were delivered
+    DELIVERED = "delivered"
+
+    # One or more notifications could not be delivered
+    FAILED = "failed"
+
+
+# The states a job can no longer leave
+JOB_FINAL_STATES = (AppriseJobStatus.DELIVERED, AppriseJobStatus.FAILED)
+
+# The longest we will wait (in seconds) between two delivery attempts
+JOB_RETRY_DELAY_MAX = 3600
+
+
+class AppriseJobQueue:
+    """
+    A durable on-disk queue of notifications to be delivered.
+
+    Every job resides in its own directory (named after its identifier) and
+    is made up of:
+      - job.json:    the notification itself; this never changes
+      - status.json: the state of the job (atomically replaced on update)
+      - attach/:     any attachments that accompany the notification
+
+    Jobs are assembled in a hidden directory and renamed into place, so a
+    job is either fully present or not at all.  A job being delivered holds
+    an exclusive lock on its job.json; the lock is released by the operating
+    system should the process delivering it die.
+
+    Finished jobs are moved into the done/ directory so that looking for the
+    jobs to deliver never has to read through those we are only retaining.
+    """
+
+    def __init__(self, root, retention=86400):
+        """
+        Works relative to the root; finished jobs are kept for the retention
+        period (in seconds) so that their outcome can be looked up.
+        """
+        self.root = root
+        self.retention = retention
+
+        # Where our finished jobs are retained
+        self.done = os.path.join(root, "done")
+
+        # Our in-process delivery pool (prepared on first use)
+        self._executor = None
+        self._lock = threading.Lock()
+
+        # The last time we pruned our finished jobs
+        self._pruned = 0.0
+
+    def path(self, job_id, finished=False):
+        """
+        Returns the directory associated with the job; finished identifies
+        whether the job is one we are retaining
+        """
+        return os.path.join(self.done if finished else self.root, job_id)
+
+    def enqueue(self, job, attachments=None):
+        """
+        Stores the job (a dictionary) and its attachments (apprise attachment
+        objects) on disk.
+
+        The new job identifier is returned, otherwise None is returned if the
+        job could not be written.
+        """
+        job_id = uuid.uuid4().hex
+        job = dict(job, id=job_id, created=time.time(), attachments=[])
+
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            tmp_path = tempfile.mkdtemp(prefix=".", suffix=".tmp", dir=self.root)
+
+        except OSError as e:
+            logger.error("Could not prepare job directory in %s: %s", self.root, str(e))
+            return None
+
+        try:
+            if attachments:
+                os.makedirs(os.path.join(tmp_path, "attach"))
+
+            for no, attachment in enumerate(attachments or [], start=1):
+                filename = f"{no:03d}"
+                if isinstance(attachment, Attachment):
+                    # Take ownership of the file we already wrote
+                    shutil.move(attachment.path, os.path.join(tmp_path, "attach", filename))
+
+                else:
+                    shutil.copyfile(attachment.path, os.path.join(tmp_path, "attach", filename))
+
+                job["attachments"].append(
+                    {
+                        "file": filename,
+                        "name": attachment.name,
+                        "mimetype": attachment.mimetype,
+                    }
+                )
+
+            with open(os.path.join(tmp_path, "job.json"), "w", encoding="utf-8") as f:
+                json.dump(job, f)
+
+            with open(os.path.join(tmp_path, "status.json"), "w", encoding="utf-8") as f:
+                json.dump({"status": AppriseJobStatus.QUEUED, "created": job["created"]}, f)
+
+            # Publish our job
+            os.rename(tmp_path, self.path(job_id))
+
+        except (OSError, TypeError, ValueError) as e:
+            logger.error("Could not write job %s to %s: %s", job_id, self.root, str(e))
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            return None
+
+        return job_id
+
+    def status(self, job_id):
+        """
+        Returns the status (a dictionary) of the job, or None if the job
+        does not exist
+        """
+        if not JOB_ID_RE.match(job_id):
+            return None
+
+        # A job is looked up in our queue before what we are retaining; a job
+        # is only ever moved from the first to the second
+        for finished in (False, True):
+            try:
+                with open(os.path.join(self.path(job_id, finished=finished), "status.json"), encoding="utf-8") as f:
+                    status = json.load(f)
+
+            except FileNotFoundError:
+                continue
+
+            except (OSError, ValueError):
+                return None
+
+            status["id"] = job_id
+            return status
+
+        return None
+
+    def update(self, job_id, **status):
+        """
+        Atomically replaces the status of the job with the one provided
+        """
+        path = self.path(job_id)
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=path)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(status, f)
+
+            os.replace(tmp_path, os.path.join(path, "status.json"))
+
+        except OSError:
+            with suppress(OSError):
+                os.remove(tmp_path)
+            raise
+
+    def due(self, status, now=None):
+        """
+        Returns True if the job (identified by its status) is waiting to be
+        delivered and its next attempt is due
+        """
+        return bool(
+            status
+            and status.get("status") not in JOB_FINAL_STATES
+            and status.get("next_attempt", 0) <= (time.time() if now is None else now)
+        )
+
+    def pending(self, now=None):
+        """
+        Returns the identifiers of all jobs that are due for delivery; the
+        oldest are returned first
+        """
+        try:
+            entries = os.listdir(self.root)
+
+        except OSError:
+            return []
+
+        jobs = []
+        for job_id in entries:
+            if not JOB_ID_RE.match(job_id):
+                # Our finished jobs and those still being written
+                continue
+
+            status = self.status(job_id)
+            if self.due(status, now=now):
+                jobs.append((status.get("created", 0), job_id))
+
+        return [job_id for _, job_id in sorted(jobs)]
+
+    @contextmanager
+    def claim(self, job_id):
+        """
+        Locks the job for delivery; the job (a dictionary) is yielded, or
+        None if the job does not exist, is not due, or is being delivered
+        elsewhere.
+        """
+        if not self.due(self.status(job_id)):
+            yield None
+            return
+
+        with ExitStack() as stack:
+            try:
+                f = stack.enter_context(open(os.path.join(self.path(job_id), "job.json"), encoding="utf-8"))
+
+            except OSError:
+                yield None
+                return
+
+            if fcntl is not None:
+                try:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+                except OSError:
+                    # Someone else is delivering this job
+                    yield None
+                    return
+
+            # Now that we hold our lock, make sure nobody delivered it while
+            # we were waiting for it
+            if not self.due(self.status(job_id)):
+                yield None
+                return
+
+            try:
+                job = json.load(f)
+
+            except ValueError:
+                logger.error("Job %s could not be read", job_id)
+                yield None
+                return
+
+            yield job
+
+    def deliver(self, job_id):
+        """
+        Delivers the job and records its outcome.
+
+        Services that fail are attempted again later (with an increasing
+        delay between each attempt) for as many times as their retry value
+        allows; the job is finished once there is nothing left to retry.
+
+        Returns True if the job was delivered, False if it failed, and None
+        if it was not ours to deliver or is to be attempted again.
+        """
+        with self.claim(job_id) as job:
+            if job is None:
+                return None
+
+            status = self.status(job_id)
+            status.pop("id", None)
+
+            attempt = status.get("attempts", 0) + 1
+            status.update(status=AppriseJobStatus.RUNNING, started=time.time(), attempts=attempt)
+            self.update(job_id, **status)
+
+            try:
+                result, details, pending = notify_job(
+                    job, self.path(job_id), attempt=attempt, pending=status.get("pending")
+                )
+
+            except Exception:
+                # A job that can not be delivered is never attempted again
+                logger.exception("JOB - %s - Unexpected failure delivering notification(s)", job_id)
+                result, details, pending = (False, [], [])
+
+            status["details"] = status.get("details", []) + details
+            status["ok"] = status.get("ok", True) and result
+
+            if pending:
+                # Try again later
+                delay = min(settings.APPRISE_JOB_RETRY_DELAY * 2 ** (attempt - 1), JOB_RETRY_DELAY_MAX)
+                status.update(status=AppriseJobStatus.QUEUED, pending=pending, next_attempt=time.time() + delay)
+                self.update(job_id, **status)
+
+                logger.info(
+                    "JOB - %s - %d notification(s) will be attempted again in %ds%s",
+                    job_id,
+                    len(pending),
+                    delay,
+                    "" if not job.get("key") else " using KEY: {}".format(job["key"]),
+                )
+                return None
+
+            result = status.pop("ok")
+            status.pop("pending", None)
+            status.pop("next_attempt", None)
+            status.update(
+                status=AppriseJobStatus.DELIVERED if result else AppriseJobStatus.FAILED,
+                finished=time.time(),
+            )
+            self.update(job_id, **status)
+
+            # Retain our finished job
+            os.makedirs(self.done, exist_ok=True)
+            os.rename(self.path(job_id), self.path(job_id, finished=True))
+
+        if settings.APPRISE_WEBHOOK_URL:
+            webhook_payload = {
+                "source": job.get("source"),
+                "status": 0 if result else 1,
+                "output": status["details"],
+            }
+
+            # Send our webhook (pass or fail)
+            send_webhook(webhook_payload)
+
+        logger.info(
+            "JOB - %s - %s Notification(s)%s",
+            job_id,
+            "Delivered" if result else "Failed to deliver",
+            "" if not job.get("key") else " using KEY: {}".format(job["key"]),
+        )
+        return result
+
+    def dispatch(self, job_id, delay=0):
+        """
+        Delivers the job in the background (in this process); the delivery
+        can optionally be delayed by the number of seconds specified
+        """
+        if delay > 0:
+            timer = threading.Timer(delay, self.dispatch, (job_id,))
+            timer.daemon = True
+            timer.start()
+            return timer
+
+        now = time.time()
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=settings.APPRISE_JOB_CONCURRENCY, thread_name_prefix="apprise-job"
+                )
+
+            if now - self._pruned >= 3600:
+                # Tidy up after ourselves (at most once an hour)
+                self._pruned = now
+                self._executor.submit(self.prune)
+
+        return self._executor.submit(self._deliver, job_id)
+
+    def _deliver(self, job_id):
+        """
+        Background delivery wrapper; errors have nowhere to go but our logs
+        """
+        try:
+            result = self.deliver(job_id)
+
+        except OSError as e:
+            logger.error("JOB - %s - Could not update job status: %s", job_id, str(e))
+            return None
+
+        status = self.status(job_id)
+        if result is None and status and status.get("status") == AppriseJobStatus.QUEUED and "next_attempt" in status:
+            # Schedule our next attempt
+            self.dispatch(job_id, delay=max(0.0, status["next_attempt"] - time.time()))
+
+        return result
+
+    def prune(self, now=None):
+        """
+        Removes finished jobs whose retention period has expired.
+
+        Returns the number of jobs removed.
+        """
+        now = time.time() if now is None else now
+        count = 0
+        try:
+            entries = os.listdir(self.done)
+
+        except OSError:
+            return count
+
+        for job_id in entries:
+            status = self.status(job_id)
+            if (
+                not status
+                or status.get("status") not in JOB_FINAL_STATES
+                or (now - status.get("finished", now)) < self.retention
+            ):
+                continue
+
+            shutil.rmtree(self.path(job_id, finished=True), ignore_errors=True)
+            count += 1
+
+        return count
+
+
+def notify_job(job, path, attempt=1, pending=None):
+    """
+    Performs the notification described by the job; path is the directory
+    the job was read from.
+
+    attempt identifies the delivery attempt (starting at 1) and pending
+    identifies the services (by index) to limit the delivery to, if any.
+
+    Returns a tuple of (result, details, pending) where:
+      - result is False if a (non-optional) service failed and has no retry
+        attempts left
+      - details is the list of [level, time, message] log entries captured
+        while delivering
+      - pending is the list of services (by index) to attempt again
+    """
+
+    #
+    # Apply Any Global Filters (if identified)
+    #
+    apply_global_filters()
+
+    # Prepare ourselves a default Asset
+    asset = apprise.AppriseAsset(**job.get("asset", {}))
+
+    # Prepare our apprise object
+    a_obj = apprise.Apprise(asset=asset)
+
+    if job.get("config") is not None:
+        # Create an apprise config object
+        ac_obj = apprise.AppriseConfig(asset=asset, recursion=settings.APPRISE_RECURSION_MAX)
+
+        # Load our configuration
+        ac_obj.add_config(job["config"], format=job.get("format"))
+
+        # Add our configuration
+        a_obj.add(ac_obj)
+
+    else:
+        # Add URLs
+        a_obj.add(job.get("urls"))
+
+    # Prepare the services we are delivering to on this attempt
+    d_obj = apprise.Apprise(asset=asset)
+
+    # The services we attempted (by index) along with their retry count and
+    # whether or not they are optional
+    attempted = {}
+
+    # The outcome of each service we attempted (by index)
+    outcomes = {}
+
+    for index, server in enumerate(a_obj.find(job.get("tag"))):
+        if pending is not None and index not in pending:
+            # Already delivered
+            continue
+
+        url = server.url()
+        attempted[index] = (service_retry(server, url), service_optional(server, url))
+
+        # Retries are spread out over time (and across restarts) instead of
+        # being performed back to back
+        server.retry = 0
+
+        # Track the outcome of this service
+        server.notify = _tracked(server.notify, index, outcomes)
+        d_obj.add(server)
+
+    # Prepare our attachments
+    attach = [
+        A_MGR["file"](
+            path=os.path.join(path, "attach", entry["file"]),
+            name=entry.get("name"),
+            mimetype=entry.get("mimetype"),
+        )
+        for entry in job.get("attachments", [])
+    ]
+
+    with AppriseLogCapture(level=job.get("level", logging.INFO)) as logs:
+        # Perform our notification at this point
+        result = d_obj.notify(
+            job.get("body"),
+            title=job.get("title", ""),
+            notify_type=job.get("type", apprise.NotifyType.INFO.value),
+            tag=job.get("tag"),
+            attach=attach or None,
+        )
+
+    details = [log_entry(record, "application/json") for record in logs.records]
+
+    if result:
+        # Everything was delivered
+        return (True, details, [])
+
+    if not attempted:
+        # There was nothing to deliver to
+        return (False, details, [])
+
+    # Identify the (non-optional) services that failed and those of them
+    # that may be attempted again; the failure of an optional service never
+    # fails our job
+    failed = [index for index, (_, optional) in attempted.items() if not (outcomes.get(index) or optional)]
+    pending = [index for index in failed if attempted[index][0] >= attempt]
+
+    return (len(pending) == len(failed), details, pending)
+
+
+def _tracked(notify, index, outcomes):
+    """
+    Wraps a service notify() call so that its outcome is recorded
+    """
+
+    def wrapper(*args, **kwargs):
+        outcomes[index] = bool(notify(*args, **kwargs))
+        return outcomes[index]
+
+    return wrapper
+
+
+# Initialize our singleton
+JobQueue = AppriseJobQueue(settings.APPRISE_JOB_DIR, retention=settings.APPRISE_JOB_RETENTION)
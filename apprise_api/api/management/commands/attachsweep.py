@@ -0,0 +1,59 @@
+# Copyright (C) 2026 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ...utils import sweep_attachments
+
+
+class Command(BaseCommand):
+    help = "Remove the attachments left behind by requests that are no longer being handled"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-a",
+            "--age",
+            type=int,
+            default=settings.APPRISE_ATTACH_SWEEP_AGE,
+            help="The number of seconds an attachment must be left behind for before it is removed",
+        )
+        parser.add_argument(
+            "-i",
+            "--interval",
+            type=float,
+            default=0,
+            help="The number of seconds to wait between sweeps; by default we sweep once and exit",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            removed = sweep_attachments(age=options["age"])
+            if removed or options["interval"] <= 0:
+                self.stdout.write(self.style.SUCCESS(f"Successfully reclaimed {removed} orphaned attachment(s)"))
+
+            if options["interval"] <= 0:
+                break
+
+            time.sleep(options["interval"])
@@ -0,0 +1,73 @@
+# Copyright (C) 2026 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...utils import AppriseStoreMode, ConfigCache
+
+
+class Command(BaseCommand):
+    help = "Index the configuration keys (stored in the hash mode) that can not yet be listed"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "keys",
+            nargs="*",
+            help="The configuration keys to index",
+        )
+        parser.add_argument(
+            "-f",
+            "--file",
+            help="A file (or - for stdin) containing the configuration keys to index (one per line)",
+        )
+
+    def handle(self, *args, **options):
+        if ConfigCache.mode != AppriseStoreMode.HASH:
+            self.stdout.write(self.style.SUCCESS(f"Nothing to index; keys are listed as they are ({ConfigCache.mode})"))
+            return
+
+        if ConfigCache.key_index is None:
+            raise CommandError("Keys are only indexed (and listed) when APPRISE_ADMIN is enabled")
+
+        keys = list(options["keys"])
+        if options["file"]:
+            if options["file"] == "-":
+                keys.extend(sys.stdin.read().split())
+
+            else:
+                with open(options["file"]) as f:
+                    keys.extend(f.read().split())
+
+        if keys:
+            indexed = ConfigCache.index_keys(keys)
+            self.stdout.write(self.style.SUCCESS(f"Successfully indexed {indexed} of {len(keys)} key(s)"))
+
+        unlisted = ConfigCache.unlisted()
+        if unlisted:
+            self.stdout.write(
+                self.style.WARNING(f"{unlisted} stored configuration(s) can not be listed until their key is indexed")
+            )
+
+        else:
+            self.stdout.write(self.style.SUCCESS("All of the stored configuration can be listed"))
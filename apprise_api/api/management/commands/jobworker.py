@@ -0,0 +1,101 @@
+# Copyright (C) 2026 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+from concurrent.futures import ThreadPoolExecutor, wait
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ...jobs import JobQueue
+
+
+class Command(BaseCommand):
+    help = "Deliver the notifications queued for asynchronous delivery"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-i",
+            "--interval",
+            type=float,
+            default=1.0,
+            help="The number of seconds to wait between checks for queued notifications",
+        )
+        parser.add_argument(
+            "-c",
+            "--concurrency",
+            type=int,
+            default=settings.APPRISE_JOB_CONCURRENCY,
+            help="The number of notifications to deliver at the same time",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Deliver the notifications that are due and exit",
+        )
+
+    def handle(self, *args, **options):
+        if not JobQueue.root:
+            self.stderr.write(self.style.ERROR("Asynchronous delivery is disabled (APPRISE_JOB_DIR is not set)"))
+            return
+
+        # The jobs we are currently delivering
+        active = {}
+
+        # The last time we pruned our finished jobs
+        pruned = 0.0
+
+        with ThreadPoolExecutor(max_workers=max(1, options["concurrency"])) as executor:
+            while True:
+                now = time.time()
+                if now - pruned >= 3600:
+                    # Tidy up (at most once an hour)
+                    pruned = now
+                    JobQueue.prune(now=now)
+
+                # Forget about the jobs we finished
+                active = {job_id: future for job_id, future in active.items() if not future.done()}
+
+                for job_id in JobQueue.pending(now=now):
+                    if job_id not in active:
+                        active[job_id] = executor.submit(self.deliver, job_id)
+
+                if options["once"]:
+                    break
+
+                time.sleep(options["interval"])
+
+            wait(active.values())
+
+        delivered = sum(1 for future in active.values() if future.result())
+        self.stdout.write(self.style.SUCCESS(f"Successfully delivered {delivered} of {len(active)} notification(s)"))
+
+    def deliver(self, job_id):
+        """
+        Delivers a queued notification
+        """
+        try:
+            return JobQueue.deliver(job_id)
+
+        except OSError as e:
+            self.stderr.write(self.style.ERROR(f"Job {job_id} could not be delivered: {e}"))
+            return None
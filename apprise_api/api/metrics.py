@@ -0,0 +1,183 @@
+# Copyright (C) 2026 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+from contextlib import contextmanager
+import hashlib
+import hmac
+import time
+
+from django.conf import settings
+from prometheus_client import REGISTRY, Counter, Histogram
+
+# The phases of handling a notification we time
+PHASE_CONFIG_LOAD = "config_load"
+PHASE_PARSE = "parse"
+PHASE_DELIVERY = "delivery"
+
+# The remaining phases of handling a request we time; these are only ever
+# reported back through the Server-Timing header
+PHASE_BODY = "body"
+PHASE_REMAP = "remap"
+PHASE_ATTACHMENTS = "attachments"
+PHASE_RENDER = "render"
+PHASE_CONFIG_SAVE = "config_save"
+
+# The phases we record a metric for
+NOTIFY_PHASES = (PHASE_CONFIG_LOAD, PHASE_PARSE, PHASE_DELIVERY)
+
+# Our latency buckets (in seconds); upstream services can be slow
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, float("inf"))
+
+
+def _metric(cls, name, documentation, labelnames, **kwargs):
+    """
+    Returns our metric; it is only ever registered once even if this module
+    is loaded more than once (such as under another name).
+    """
+    try:
+        return cls(
+            name,
+            documentation,
+            labelnames,
+            namespace=settings.PROMETHEUS_METRIC_NAMESPACE,
+            **kwargs,
+        )
+
+    except ValueError:
+        # Already registered
+        return REGISTRY._names_to_collectors[f"{settings.PROMETHEUS_METRIC_NAMESPACE}_{name}"]
+
+
+NOTIFY_PHASE_SECONDS = _metric(
+    Histogram,
+    "notify_phase_seconds",
+    "Time spent loading, parsing and delivering notifications",
+    ("phase", "key"),
+    buckets=LATENCY_BUCKETS,
+)
+
+NOTIFY_REQUESTS = _metric(
+    Counter,
+    "notify_requests",
+    "Notification requests handled",
+    ("key", "outcome", "attachments"),
+)
+
+SERVICE_SECONDS = _metric(
+    Histogram,
+    "notify_service_seconds",
+    "Time spent notifying each upstream service (per attempt)",
+    ("service", "outcome"),
+    buckets=LATENCY_BUCKETS,
+)
+
+SERVICE_ATTEMPTS = _metric(
+    Counter,
+    "notify_service_attempts",
+    "Attempts made to notify each upstream service",
+    ("service", "outcome"),
+)
+
+
+def key_hash(key):
+    """
+    Returns the label used to identify a configuration key; the key itself
+    is never exposed.  Stateless notifications have no key.
+
+    Our hash is keyed on our SECRET_KEY so that a key can not be recovered
+    from its label by hashing the keys one might guess.
+    """
+    if not key:
+        return ""
+
+    return hmac.new(settings.SECRET_KEY.encode("utf-8"), key.encode("utf-8"), hashlib.sha256).hexdigest()[:12]
+
+
+def outcome(result):
+    """
+    Returns the label used to identify the outcome of a notification
+    """
+    return "delivered" if result else "failed"
+
+
+def attachments(count):
+    """
+    Returns the label used to identify the number of attachments provided
+    (large counts are grouped together)
+    """
+    return str(count) if count < 5 else "5+"
+
+
+def observe_service(service, result, elapsed):
+    """
+    Records the outcome of an attempt to notify an upstream service
+    """
+    SERVICE_SECONDS.labels(service=service, outcome=outcome(result)).observe(elapsed)
+    SERVICE_ATTEMPTS.labels(service=service, outcome=outcome(result)).inc()
+
+
+def observe_request(key, result, attach=None):
+    """
+    Records the outcome of a notification request
+    """
+    NOTIFY_REQUESTS.labels(key=key_hash(key), outcome=outcome(result), attachments=attachments(len(attach or []))).inc()
+
+
+class RequestTimer:
+    """
+    Times the phases of handling a request; each phase is recorded as it
+    completes.
+    """
+
+    def __init__(self, key=None, observe=False):
+        """
+        Prepare our timer; if observe is set, the notification phases are
+        also recorded in our metrics
+        """
+        self.key = key_hash(key)
+        self.observe = observe
+
+        # The time spent in each phase (in seconds)
+        self.phases = {}
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Times the phase identified by name
+        """
+        start = time.monotonic()
+        try:
+            yield
+
+        finally:
+            elapsed = time.monotonic() - start
+            # A phase entered more than once is accumulated
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed
+            if self.observe and name in NOTIFY_PHASES:
+                NOTIFY_PHASE_SECONDS.labels(phase=name, key=self.key).observe(elapsed)
+
+    def server_timing(self):
+        """
+        Returns our phases formatted for use in a Server-Timing header
+        (durations are in milliseconds)
+        """
+        return ", ".join(f"{name};dur={elapsed * 1000:.2f}" for name, elapsed in self.phases.items())
@@ -22,23 +22,27 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 import base64
+import binascii
 from contextlib import suppress
+import ipaddress
 import os
 from os.path import dirname, getsize, join
 from shutil import rmtree
 import socket
 from tempfile import TemporaryDirectory
+import threading
+import time
 from unittest import mock
 from unittest.mock import mock_open, patch
 
 from django.conf import settings
-from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
 from django.test import SimpleTestCase
 from django.test.utils import override_settings
 from django.utils.datastructures import MultiValueDict
 import requests
 
-from .. import utils
+from .. import urlfilter, utils
 from ..urlfilter import AppriseURLFilter
 from ..utils import Attachment, HTTPAttachment, parse_attachments
 
@@ -186,6 +190,126 @@ class AttachmentTests(SimpleTestCase):
         with self.assertRaises(ValueError):
             parse_attachments(None, files_request)
 
+    def test_form_file_attachment_streaming(self):
+        """
+        Test the writing of file attachments to disk
+        """
+        content = b"content here" * 1024
+
+        def upload():
+            # An upload Django spooled to disk
+            meta = TemporaryUploadedFile("attach.txt", "text/plain", len(content), None)
+            meta.write(content)
+            meta.seek(0)
+            return meta
+
+        with override_settings(
+            FILE_UPLOAD_TEMP_DIR=self.tmp_dir.name, APPRISE_ATTACH_DIR=self.tmp_dir.name, APPRISE_ATTACH_MEMORY_SIZE=0
+        ):
+            # Uploads spooled to disk are linked into place
+            meta = upload()
+            result = parse_attachments(None, {"file1": meta})
+            assert len(result) == 1
+            assert os.path.samefile(result[0].path, meta.temporary_file_path())
+            with open(result[0].path, "rb") as f:
+                assert f.read() == content
+
+            # The upload is still tidied up by Django
+            meta.close()
+            assert os.path.exists(result[0].path)
+            assert not any(name.endswith(".link") for name in os.listdir(settings.APPRISE_ATTACH_DIR))
+
+            # Otherwise (such as across filesystems) they are copied
+            meta = upload()
+            with patch("os.link", side_effect=OSError()):
+                result = parse_attachments(None, {"file1": meta})
+            assert len(result) == 1
+            assert not os.path.samefile(result[0].path, meta.temporary_file_path())
+            with open(result[0].path, "rb") as f:
+                assert f.read() == content
+            meta.close()
+
+            # A failure to move our link into place is also handled
+            meta = upload()
+            with patch("os.replace", side_effect=OSError()):
+                result = parse_attachments(None, {"file1": meta})
+            assert len(result) == 1
+            assert not any(name.endswith(".link") for name in os.listdir(settings.APPRISE_ATTACH_DIR))
+            meta.close()
+
+        # Uploads are written a chunk at a time
+        meta = SimpleUploadedFile("attach.txt", content, content_type="text/plain")
+        with patch.object(meta, "chunks", return_value=iter((content[:1024], content[1024:]))) as mock_chunks:
+            result = parse_attachments(None, {"file1": meta})
+        assert mock_chunks.call_count == 1
+        with open(result[0].path, "rb") as f:
+            assert f.read() == content
+
+        with override_settings(APPRISE_ATTACH_SIZE=len(content) - 1):
+            # Uploads known to be too large are never written
+            m = mock_open()
+            with patch("builtins.open", m), self.assertRaises(ValueError):
+                parse_attachments(None, {"file1": meta})
+            assert m.call_count == 0
+
+            # We stop writing as soon as the upload proves too large
+            meta.size = 1
+            chunks = iter((content[:1024], content[1024:], b"never read"))
+            with patch.object(meta, "chunks", return_value=chunks), self.assertRaises(ValueError):
+                parse_attachments(None, {"file1": meta})
+            assert next(chunks) == b"never read"
+
+    def test_base64_attachment_streaming(self):
+        """
+        Test the decoding of base64 attachments a chunk at a time
+        """
+        content = os.urandom(100000)
+        encoded = base64.b64encode(content).decode("utf-8")
+
+        for chunk_size in (4, 7, 1024, 65536):
+            chunks = list(utils.decode_base64(encoded, chunk_size=chunk_size))
+            assert b"".join(chunks) == content
+            if chunk_size < len(encoded):
+                assert len(chunks) > 1
+
+        # Line breaks (and other characters outside of the alphabet) are
+        # ignored just like base64.b64decode() does
+        wrapped = "\n".join(encoded[i : i + 76] for i in range(0, len(encoded), 76))
+        assert b"".join(utils.decode_base64(wrapped, chunk_size=1000)) == content
+        assert b"".join(utils.decode_base64(wrapped.encode("utf-8"), chunk_size=1000)) == content
+
+        # Nothing to decode
+        assert b"".join(utils.decode_base64("")) == b""
+
+        # Incorrect padding is still detected
+        with self.assertRaises(binascii.Error):
+            b"".join(utils.decode_base64(encoded[:-1]))
+
+        # Non-ASCII content
+        with self.assertRaises(ValueError):
+            parse_attachments({"base64": "é" + encoded}, {})
+
+        attachment_payload = {"base64": wrapped, "filename": "test.bin"}
+        result = parse_attachments(attachment_payload, {})
+        assert len(result) == 1
+        with open(result[0].path, "rb") as f:
+            assert f.read() == content
+
+        with override_settings(APPRISE_ATTACH_SIZE=10000):
+            # We stop decoding as soon as the attachment proves too large
+            decoded = []
+            _decode_base64 = utils.decode_base64
+
+            def decode_base64(content):
+                for chunk in _decode_base64(content, chunk_size=4096):
+                    decoded.append(chunk)
+                    yield chunk
+
+            with patch("apprise_api.api.utils.decode_base64", side_effect=decode_base64), self.assertRaises(ValueError):
+                parse_attachments(attachment_payload, {})
+
+            assert sum(len(chunk) for chunk in decoded) < 20000
+
     @patch("requests.get")
     def test_direct_attachment_parsing(self, mock_get):
         """
@@ -813,3 +937,466 @@ class AttachmentTests(SimpleTestCase):
         )
         assert len(result) == 1
         assert result[0]._name == "passwd"
+
+    @patch("requests.get")
+    def test_url_attachment_concurrency(self, mock_get):
+        """parse_attachments retrieves web attachments at the same time."""
+        state = {"active": 0, "peak": 0}
+        lock = threading.Lock()
+        barrier = threading.Barrier(3, timeout=5)
+        release = threading.Event()
+
+        def get(url, *args, **kwargs):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+
+            try:
+                if "together" in url:
+                    # Only ever passes if all three are retrieved at once
+                    barrier.wait()
+
+                elif "slow" in url:
+                    release.wait(5)
+
+                else:
+                    time.sleep(0.05)
+
+            finally:
+                with lock:
+                    state["active"] -= 1
+
+            response = mock.Mock()
+            response.status_code = requests.codes.ok
+            response.raise_for_status.return_value = True
+            response.headers = {}
+            response.iter_content.return_value = iter([b"data"])
+            response.__enter__ = lambda s, *a, **kw: response
+            response.__exit__ = mock.Mock(return_value=False)
+            return response
+
+        mock_get.side_effect = get
+
+        # Our attachments are retrieved at the same time (and kept in order)
+        result = parse_attachments(
+            [
+                "https://example.com/together?name=a.jpg",
+                {"url": "https://example.com/together", "filename": "b.jpg"},
+                {"base64": base64.b64encode(b"data").decode("utf-8"), "filename": "c.txt"},
+                "https://example.com/together?name=d.jpg",
+            ],
+            {},
+        )
+        assert [a.name for a in result] == ["a.jpg", "b.jpg", "c.txt", "d.jpg"]
+
+        # The number retrieved at the same time is bounded
+        state["peak"] = 0
+        with override_settings(APPRISE_ATTACH_FETCH_CONCURRENCY=2):
+            result = parse_attachments([f"https://example.com/{no}.jpg" for no in range(5)], {})
+        assert len(result) == 5
+        assert state["peak"] == 2
+
+        # They must all be retrieved in time
+        with override_settings(APPRISE_ATTACH_FETCH_TIMEOUT=0.1), self.assertRaises(ValueError):
+            parse_attachments(["https://example.com/slow.jpg", "https://example.com/fast.jpg"], {})
+        release.set()
+
+        # The first problem found (in order) is reported
+        with self.assertRaisesRegex(ValueError, "Denied attachment 2"):
+            parse_attachments(
+                ["https://example.com/1.jpg", "https://localhost/2.jpg", "https://localhost/3.jpg"],
+                {},
+            )
+
+    @patch("requests.head")
+    @patch("requests.get")
+    def test_url_attachment_cache(self, mock_get, mock_head):
+        """parse_attachments reuses the web attachments it retrieved."""
+        content = {"url": b"snapshot"}
+
+        def get(url, *args, **kwargs):
+            response = mock.Mock()
+            response.status_code = requests.codes.ok
+            response.raise_for_status.return_value = True
+            response.headers = {"Content-Type": "image/png"}
+            response.iter_content.return_value = iter([content.get(url, content["url"])])
+            response.__enter__ = lambda s, *a, **kw: response
+            response.__exit__ = mock.Mock(return_value=False)
+            return response
+
+        mock_get.side_effect = get
+
+        def head(status_code, **headers):
+            response = mock.Mock()
+            response.status_code = status_code
+            response.headers = headers
+            return response
+
+        cache = utils.AttachmentCache(join(self.tmp_dir.name, "cache"), 60, 1024)
+        assert cache
+        assert not utils.AttachmentCache(cache.path, 0, 1024)
+
+        url = "https://example.com/dashboard/snapshot.png"
+        with patch.object(utils, "ATTACH_CACHE", cache):
+            result = parse_attachments([url], {})
+            assert mock_get.call_count == 1
+            assert len(cache) == 1
+
+            # Our second request shares what we retrieved
+            result = parse_attachments([url, {"url": url, "filename": "renamed.png"}], {})
+            assert mock_get.call_count == 1
+            assert not mock_head.called
+            assert [a.name for a in result] == ["snapshot.png", "renamed.png"]
+            assert result[0].mimetype == "image/png"
+            assert result[0].path != result[1].path
+            for attachment in result:
+                with open(attachment.path, "rb") as f:
+                    assert f.read() == b"snapshot"
+
+            # Once expired, our entry is revalidated; this one had no
+            # validators so it is retrieved again
+            cache._entries[url]["expires"] = 0
+            mock_head.return_value = head(requests.codes.ok, ETag='"v1"')
+            parse_attachments([url], {})
+            assert mock_get.call_count == 2
+            assert cache._entries[url]["etag"] == '"v1"'
+
+            # Not modified
+            cache._entries[url]["expires"] = 0
+            mock_head.return_value = head(requests.codes.not_modified)
+            parse_attachments([url], {})
+            assert mock_get.call_count == 2
+            assert mock_head.call_args[1]["headers"]["If-None-Match"] == '"v1"'
+            assert cache._entries[url]["expires"] > 0
+
+            # The same validators are also accepted
+            cache._entries[url]["expires"] = 0
+            mock_head.return_value = head(requests.codes.ok, ETag='"v1"')
+            parse_attachments([url], {})
+            assert mock_get.call_count == 2
+
+            # Changed content
+            cache._entries[url]["expires"] = 0
+            mock_head.return_value = head(requests.codes.ok, ETag='"v2"', **{"Last-Modified": "Fri, 16 Oct 2026"})
+            parse_attachments([url], {})
+            assert mock_get.call_count == 3
+            assert cache._entries[url]["modified"] == "Fri, 16 Oct 2026"
+
+            # We can not reach the server
+            cache._entries[url]["expires"] = 0
+            mock_head.side_effect = requests.RequestException()
+            parse_attachments([url], {})
+            assert mock_get.call_count == 4
+            mock_head.side_effect = None
+
+            # Our content went missing
+            os.remove(join(cache.path, cache._entries[url]["digest"]))
+            parse_attachments([url], {})
+            assert mock_get.call_count == 5
+
+            # The same content is only ever kept once
+            other = "https://example.com/other.png"
+            parse_attachments([other], {})
+            assert len(cache) == 2
+            assert len(os.listdir(cache.path)) == 1
+
+            # Keep within our budget (least recently used first)
+            cache.size = 16
+            content["https://example.com/new.png"] = b"new content"
+            parse_attachments(["https://example.com/new.png"], {})
+            assert list(cache._entries) == ["https://example.com/new.png"]
+            assert len(os.listdir(cache.path)) == 1
+
+            # Content larger than our budget is not kept
+            content["https://example.com/large.png"] = b"x" * 32
+            parse_attachments(["https://example.com/large.png"], {})
+            assert "https://example.com/large.png" not in cache._entries
+
+            # Failures to cache are handled
+            with patch("os.replace", side_effect=OSError()):
+                parse_attachments([other], {})
+            assert other not in cache._entries
+            assert len(os.listdir(cache.path)) == 1
+
+            # Failures to share our content are handled (by retrieving it)
+            parse_attachments([other], {})
+            calls = mock_get.call_count
+            with patch("os.link", side_effect=OSError()), patch("shutil.copyfile", side_effect=OSError()):
+                result = parse_attachments([other], {})
+            assert mock_get.call_count == calls + 1
+            with open(result[0].path, "rb") as f:
+                assert f.read() == b"snapshot"
+
+            # Content is copied if it can't be linked
+            parse_attachments([other], {})
+            with patch("os.link", side_effect=OSError()):
+                result = parse_attachments([other], {})
+            with open(result[0].path, "rb") as f:
+                assert f.read() == b"snapshot"
+
+            cache.discard(other)
+            cache.discard(other)
+            assert other not in cache._entries
+
+    @patch("requests.get")
+    def test_attachment_scope(self, mock_get):
+        """Attachments are removed as soon as we are done with them."""
+        response = mock.Mock()
+        response.status_code = requests.codes.ok
+        response.raise_for_status.return_value = True
+        response.headers = {}
+        response.iter_content.return_value = iter([b"data"])
+        response.__enter__ = lambda s, *a, **kw: response
+        response.__exit__ = mock.Mock(return_value=False)
+        mock_get.return_value = response
+
+        payload = {"base64": base64.b64encode(b"data").decode("utf-8")}
+
+        with utils.AttachmentScope() as scope:
+            result = parse_attachments([payload, "https://example.com/image.jpg"], {})
+
+        # Attachments prepared outside of a scope are not tracked
+        untracked = parse_attachments([payload], {})
+
+        assert scope.attachments == result
+        downloaded = result[1].path
+        paths = [result[0].path, result[1]._path, downloaded]
+        assert all(os.path.exists(path) for path in paths)
+
+        scope.close()
+        assert not scope.attachments
+        assert not any(os.path.exists(path) for path in paths)
+        assert os.path.exists(untracked[0].path)
+
+        # Closing more than once is fine
+        result[0].close()
+        result[1].close()
+
+        # Attachments prepared before an error are tracked too
+        with utils.AttachmentScope() as scope, self.assertRaises(ValueError):
+            parse_attachments([payload, {"base64": "QQ"}], {})
+
+        assert len(scope.attachments) == 2
+        scope.close()
+
+        # Streamed content holds on to its attachments until it is produced
+        with utils.AttachmentScope() as scope:
+            result = parse_attachments([payload], {})
+
+        path = result[0].path
+        content = scope.closing(iter(["a", "b"]))
+        assert next(content) == "a"
+        assert os.path.exists(path)
+        assert list(content) == ["b"]
+        assert not os.path.exists(path)
+
+        # Attachments that are held on to outlive our scope
+        with utils.AttachmentScope() as scope:
+            assert utils.AttachmentScope.current() is scope
+            result = parse_attachments([payload], {})
+        assert utils.AttachmentScope.current() is None
+
+        path = result[0].path
+        scope.hold()
+        scope.close()
+        assert os.path.exists(path)
+        scope.release()
+        assert not os.path.exists(path)
+
+        # Releasing an open scope leaves our attachments alone
+        with utils.AttachmentScope() as scope:
+            result = parse_attachments([payload], {})
+
+        path = result[0].path
+        scope.hold()
+        scope.release()
+        assert os.path.exists(path)
+        scope.close()
+        assert not os.path.exists(path)
+
+        # Web attachments retrieved at the same time (by other threads) are
+        # tracked too
+        release = threading.Event()
+
+        def get(url, *args, **kwargs):
+            if "slow" in url:
+                release.wait(5)
+
+            response = mock.Mock()
+            response.status_code = requests.codes.ok
+            response.raise_for_status.return_value = True
+            response.headers = {}
+            response.iter_content.return_value = iter([b"data"])
+            response.__enter__ = lambda s, *a, **kw: response
+            response.__exit__ = mock.Mock(return_value=False)
+            return response
+
+        mock_get.side_effect = get
+
+        with utils.AttachmentScope() as scope:
+            result = parse_attachments(["https://example.com/scope-a.jpg", "https://example.com/scope-b.jpg"], {})
+
+        assert len(result) == 2
+        assert all(attachment in scope.attachments for attachment in result)
+        paths = [attachment.path for attachment in result]
+        assert all(os.path.exists(path) for path in paths)
+
+        scope.close()
+        assert not any(os.path.exists(path) for path in paths)
+
+        # Attachments completed after we gave up on them (and closed our
+        # scope) are removed as soon as they are
+        with (
+            utils.AttachmentScope() as scope,
+            override_settings(APPRISE_ATTACH_FETCH_TIMEOUT=0.1),
+            self.assertRaises(ValueError),
+        ):
+            parse_attachments(["https://example.com/scope-slow.jpg", "https://example.com/scope-c.jpg"], {})
+
+        scope.close()
+        with patch.object(utils.HTTPAttachment, "close", autospec=True, wraps=utils.HTTPAttachment.close) as mock_close:
+            release.set()
+            deadline = time.time() + 5
+            while not mock_close.call_count and time.time() < deadline:
+                time.sleep(0.01)
+            assert mock_close.call_count >= 1
+        assert not scope.attachments
+
+    @patch("requests.get")
+    def test_url_attachment_pinning(self, mock_get):
+        """
+        Web attachments are retrieved from the addresses our filter validated
+        """
+        pins = []
+
+        def get(url, *args, **kwargs):
+            pins.append(urlfilter._PINNED_ADDRESSES.get())
+
+            response = mock.Mock()
+            response.status_code = requests.codes.ok
+            response.raise_for_status.return_value = True
+            response.headers = {}
+            response.iter_content.return_value = iter([b"data"])
+            response.__enter__ = lambda s, *a, **kw: response
+            response.__exit__ = mock.Mock(return_value=False)
+            return response
+
+        mock_get.side_effect = get
+
+        with patch.object(utils, "ATTACH_URL_FILTER", AppriseURLFilter("*", "internal")):
+            result = parse_attachments(["https://Example.com/a.jpg"], {})
+            assert len(result) == 1
+            assert pins == [{"example.com": (ipaddress.ip_address("93.184.215.14"),)}]
+
+            # Our pins do not outlive the retrieval
+            assert urlfilter._PINNED_ADDRESSES.get() is None
+
+            # Pinning can be disabled
+            with override_settings(APPRISE_ATTACH_PIN_ADDRESSES=False):
+                parse_attachments(["https://example.com/a.jpg"], {})
+            assert pins[-1] is None
+
+        # Nothing is pinned if our filter did not resolve the host
+        with patch.object(utils, "ATTACH_URL_FILTER", AppriseURLFilter("*", "")):
+            parse_attachments(["https://example.com/a.jpg"], {})
+        assert pins[-1] is None
+
+    def test_attachment_memory(self):
+        """
+        Test the keeping of small attachments in memory
+        """
+        memory_dir = join(self.tmp_dir.name, "memory")
+        attach_dir = join(self.tmp_dir.name, "attach")
+        small = b"A" * 1024
+        large = b"B" * 4096
+
+        with override_settings(
+            APPRISE_ATTACH_DIR=attach_dir, APPRISE_ATTACH_MEMORY_DIR=memory_dir, APPRISE_ATTACH_MEMORY_SIZE=2048
+        ):
+            assert utils.is_memory_attachment(2048)
+            assert not utils.is_memory_attachment(2049)
+            assert not utils.is_memory_attachment(None)
+
+            result = parse_attachments(
+                [
+                    {"base64": base64.b64encode(small).decode("utf-8")},
+                    {"base64": base64.b64encode(large).decode("utf-8")},
+                    small,
+                    large,
+                ],
+                {
+                    "file1": SimpleUploadedFile("small.txt", small, content_type="text/plain"),
+                    "file2": SimpleUploadedFile("large.txt", large, content_type="text/plain"),
+                },
+            )
+            assert len(result) == 6
+            assert [a.in_memory for a in result] == [True, False, True, False, True, False]
+            for attachment, content in zip(result, (small, large) * 3, strict=True):
+                assert dirname(attachment.path) == (memory_dir if attachment.in_memory else attach_dir)
+                with open(attachment.path, "rb") as f:
+                    assert f.read() == content
+
+            # Our attachments are still removed once we are done with them
+            paths = [a.path for a in result]
+            for attachment in result:
+                attachment.close()
+            assert not any(os.path.exists(path) for path in paths)
+
+            # Should our memory backed storage be full, we spill over to disk
+            _write_attachment = utils.write_attachment
+
+            def write_attachment(path, chunks, filename):
+                if path.startswith(memory_dir):
+                    raise ValueError("full") from OSError(28, "No space left on device")
+                return _write_attachment(path, chunks, filename)
+
+            with patch("apprise_api.api.utils.write_attachment", side_effect=write_attachment):
+                result = parse_attachments([small], {})
+            assert len(result) == 1
+            assert not result[0].in_memory
+            with open(result[0].path, "rb") as f:
+                assert f.read() == small
+            assert os.listdir(memory_dir) == []
+
+            # Other errors are not retried
+            with self.assertRaises(ValueError), override_settings(APPRISE_ATTACH_SIZE=512):
+                parse_attachments([small], {})
+            assert os.listdir(memory_dir) == []
+
+        # Our memory backed storage is not available (a file is in the way)
+        blocker = join(self.tmp_dir.name, "blocker")
+        with open(blocker, "wb"):
+            pass
+
+        with override_settings(APPRISE_ATTACH_DIR=attach_dir, APPRISE_ATTACH_MEMORY_DIR=join(blocker, "memory")):
+            result = parse_attachments([small], {})
+            assert len(result) == 1
+            assert not result[0].in_memory
+
+        # It can be disabled
+        for memory_settings in ({"APPRISE_ATTACH_MEMORY_DIR": ""}, {"APPRISE_ATTACH_MEMORY_SIZE": 0}):
+            with override_settings(APPRISE_ATTACH_DIR=attach_dir, **memory_settings):
+                result = parse_attachments([small], {})
+                assert len(result) == 1
+                assert not result[0].in_memory
+                assert dirname(result[0].path) == attach_dir
+
+    def test_attachment_sweep(self):
+        """Orphaned attachments are swept."""
+        cache_dir = join(self.tmp_dir.name, "cache")
+        os.makedirs(cache_dir)
+        with override_settings(APPRISE_ATTACH_DIR=self.tmp_dir.name, APPRISE_ATTACH_CACHE_DIR=cache_dir):
+            orphan = Attachment("orphan")
+            orphan.delete = False
+            os.utime(orphan.path, (time.time() - 7200, time.time() - 7200))
+            active = Attachment("active")
+
+            assert utils.sweep_attachments(age=3600) == 1
+            assert sorted(os.listdir(self.tmp_dir.name)) == sorted(["cache", os.path.basename(active.path)])
+
+            # Nothing further to sweep
+            assert utils.sweep_attachments(age=3600) == 0
+
+            # Entries we can not remove are skipped
+            with patch("os.remove", side_effect=PermissionError()):
+                assert utils.sweep_attachments(now=time.time() + 7200) == 0
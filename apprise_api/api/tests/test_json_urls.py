@@ -229,6 +229,6 @@ class JsonUrlsTests(SimpleTestCase):
         assert service_optional(_Notification(), "mailto://host?optional=true") is True
         assert service_optional(_Notification(), "mailto://host?optional=no") is False
         assert service_optional(_Notification(), None) is False
-        with patch("apprise_api.api.views.urlsplit", side_effect=TypeError):
+        with patch("apprise_api.api.utils.urlsplit", side_effect=TypeError):
             assert service_optional(_Notification(), "mailto://host?optional=yes") is False
         assert service_optional(_Notification(), "mailto://host") is False
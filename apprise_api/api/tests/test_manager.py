@@ -43,7 +43,7 @@ class ManagerPageTests(SimpleTestCase):
         response = self.client.get("/cfg/")
         assert response.status_code == 403
 
-        with override_settings(APPRISE_ADMIN=True, APPRISE_STATEFUL_MODE="hash"):
+        with override_settings(APPRISE_ADMIN=False, APPRISE_STATEFUL_MODE="hash"):
             response = self.client.get("/cfg/")
             assert response.status_code == 403
 
@@ -64,6 +64,14 @@ class ManagerPageTests(SimpleTestCase):
             response = self.client.get("/cfg/")
             assert response.status_code == 200
 
+        with override_settings(APPRISE_ADMIN=True, APPRISE_STATEFUL_MODE="sqlite"):
+            response = self.client.get("/cfg/")
+            assert response.status_code == 200
+
+        with override_settings(APPRISE_ADMIN=True, APPRISE_STATEFUL_MODE="hash"):
+            response = self.client.get("/cfg/")
+            assert response.status_code == 200
+
         # An invalid key was specified
         response = self.client.get("/cfg/**invalid-key**")
         assert response.status_code == 404
@@ -208,7 +216,37 @@ class ManagerPageTests(SimpleTestCase):
 
                 payload = json.loads(response.content.decode("utf-8"))
                 assert payload == ["abc", "def"]
-                m.assert_called_once_with()
+                m.assert_called_once_with(prefix="", offset=0, limit=101)
+
+    def test_manage_cfg_list_paging(self):
+        with override_settings(APPRISE_ADMIN=True, APPRISE_STATEFUL_MODE="simple"):
+            mod = resolve("/cfg/").func.__module__
+            with patch(f"{mod}.ConfigCache.keys", return_value=["abc", "abd", "abe"]) as m:
+                response = self.client.get("/cfg/?prefix=ab&offset=2&limit=2", HTTP_ACCEPT="application/json")
+                assert response.status_code == 200
+                assert json.loads(response.content.decode("utf-8")) == ["abc", "abd"]
+                m.assert_called_once_with(prefix="ab", offset=2, limit=3)
+
+                # Our page links
+                response = self.client.get("/cfg/?prefix=ab&offset=2&limit=2")
+                assert response.status_code == 200
+                assert b'id="cfg-prev"' in response.content
+                assert b"offset=0&amp;limit=2" in response.content
+                assert b'id="cfg-next"' in response.content
+                assert b"offset=4&amp;limit=2" in response.content
+
+                response = self.client.get("/cfg/?limit=3")
+                assert response.status_code == 200
+                assert b'id="cfg-prev"' not in response.content
+                assert b'id="cfg-next"' not in response.content
+
+            for query in ("offset=-1", "offset=abc", "limit=0", "limit=abc"):
+                response = self.client.get(f"/cfg/?{query}")
+                assert response.status_code == 400
+
+                response = self.client.get(f"/cfg/?{query}", HTTP_ACCEPT="application/json")
+                assert response.status_code == 400
+                assert "error" in json.loads(response.content.decode("utf-8"))
 
     @override_settings(APPRISE_API_ONLY=True)
     def test_api_only_blocks_config_list_if_present(self) -> None:
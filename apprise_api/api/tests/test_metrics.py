@@ -0,0 +1,241 @@
+#
+# Copyright (C) 2026 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+import hashlib
+import json
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.test.utils import override_settings
+
+from .. import metrics
+
+
+def sample(content, name, **labels):
+    """
+    Returns the value of the sample identified in the metrics provided
+    """
+    prefix = "{}{{{}}} ".format(name, ",".join(f'{k}="{v}"' for k, v in sorted(labels.items())))
+    for line in content.splitlines():
+        if line.startswith(prefix):
+            return float(line[len(prefix) :])
+
+    return 0.0
+
+
+class MetricsTests(SimpleTestCase):
+    """
+    Test the metrics collected while handling notifications
+    """
+
+    def test_labels(self):
+        """
+        Test the preparation of our labels
+        """
+        assert metrics.key_hash(None) == ""
+        assert metrics.key_hash("apprise") == metrics.key_hash("apprise")
+        assert "apprise" not in metrics.key_hash("apprise")
+        assert len(metrics.key_hash("apprise")) == 12
+
+        # Our hash is keyed on our secret
+        assert metrics.key_hash("apprise") != hashlib.sha256(b"apprise").hexdigest()[:12]
+        label = metrics.key_hash("apprise")
+        with override_settings(SECRET_KEY="another-secret"):
+            assert metrics.key_hash("apprise") != label
+
+        assert metrics.outcome(True) == "delivered"
+        assert metrics.outcome(None) == "failed"
+
+        assert metrics.attachments(0) == "0"
+        assert metrics.attachments(4) == "4"
+        assert metrics.attachments(42) == "5+"
+
+        # Our metrics are only ever registered once
+        assert (
+            metrics._metric(metrics.Counter, "notify_requests", "", ("key", "outcome", "attachments"))
+            is metrics.NOTIFY_REQUESTS
+        )
+
+    @mock.patch("requests.request")
+    def test_notify_metrics(self, mock_request):
+        """
+        Test the metrics collected by our notifications
+        """
+
+        def request(method, url, *args, **kwargs):
+            response = mock.Mock()
+            response.content = b""
+            response.status_code = 500 if "fail" in url else 200
+            return response
+
+        mock_request.side_effect = request
+
+        before = self.client.get("/metrics").content.decode("utf-8")
+
+        # A stateless notification
+        response = self.client.post(
+            "/notify",
+            data=json.dumps({"urls": "json://localhost/ok, json://localhost/fail", "body": "test"}),
+            content_type="application/json",
+        )
+        assert response.status_code == 424
+
+        # A stateful one
+        key = "test_notify_metrics"
+        response = self.client.post(f"/add/{key}", {"urls": "json://localhost/ok"})
+        assert response.status_code == 200
+
+        response = self.client.post(
+            f"/notify/{key}",
+            data=json.dumps({"body": "test"}),
+            content_type="application/json",
+        )
+        assert response.status_code == 200
+
+        after = self.client.get("/metrics").content.decode("utf-8")
+
+        def delta(name, **labels):
+            return sample(after, name, **labels) - sample(before, name, **labels)
+
+        assert delta("apprise_notify_service_attempts_total", service="JSON", outcome="delivered") == 2
+        assert delta("apprise_notify_service_attempts_total", service="JSON", outcome="failed") == 1
+        assert delta("apprise_notify_service_seconds_count", service="JSON", outcome="delivered") == 2
+
+        assert delta("apprise_notify_requests_total", key="", outcome="failed", attachments="0") == 1
+        assert (
+            delta(
+                "apprise_notify_requests_total",
+                key=metrics.key_hash(key),
+                outcome="delivered",
+                attachments="0",
+            )
+            == 1
+        )
+
+        for phase in ("parse", "delivery"):
+            assert delta("apprise_notify_phase_seconds_count", phase=phase, key="") == 1
+            assert delta("apprise_notify_phase_seconds_count", phase=phase, key=metrics.key_hash(key)) == 1
+
+        assert delta("apprise_notify_phase_seconds_count", phase="config_load", key=metrics.key_hash(key)) == 1
+
+    def test_request_timer(self):
+        """
+        Test the timing of the phases of a request
+        """
+        timer = metrics.RequestTimer()
+        assert timer.server_timing() == ""
+
+        with timer.phase(metrics.PHASE_BODY):
+            pass
+
+        with timer.phase(metrics.PHASE_REMAP), timer.phase(metrics.PHASE_REMAP):
+            pass
+
+        assert list(timer.phases) == ["body", "remap"]
+        entries = timer.server_timing().split(", ")
+        assert entries[0].startswith("body;dur=")
+        assert entries[1].startswith("remap;dur=")
+        float(entries[1].split("=")[1])
+
+        # Phases are still recorded if an exception is raised
+        with self.assertRaises(ValueError), timer.phase(metrics.PHASE_RENDER):
+            raise ValueError()
+
+        assert "render" in timer.phases
+
+    @mock.patch("requests.request")
+    def test_server_timing(self, mock_request):
+        """
+        Test the Server-Timing header
+        """
+        response = mock.Mock()
+        response.content = b""
+        response.status_code = 200
+        mock_request.return_value = response
+
+        key = "test_server_timing"
+
+        def phases(response):
+            return [entry.split(";")[0] for entry in response["Server-Timing"].split(", ")]
+
+        # Disabled by default
+        response = self.client.post(f"/add/{key}", {"urls": "json://localhost"})
+        assert response.status_code == 200
+        assert "Server-Timing" not in response
+
+        with override_settings(APPRISE_SERVER_TIMING=True):
+            response = self.client.post(f"/add/{key}", {"urls": "json://localhost"})
+            assert response.status_code == 200
+            assert phases(response) == ["body", "parse", "config_save"]
+
+            response = self.client.post(
+                f"/add/{key}",
+                data=json.dumps({"config": "urls:\n  - json://localhost", "format": "yaml"}),
+                content_type="application/json",
+            )
+            assert response.status_code == 200
+            assert phases(response) == ["body", "parse", "config_save"]
+
+            response = self.client.post(
+                f"/notify/{key}?:message=body",
+                data=json.dumps({"message": "test", "attach": [{"base64": "dGVzdA==", "filename": "test.txt"}]}),
+                content_type="application/json",
+            )
+            assert response.status_code == 200
+            assert phases(response) == ["body", "remap", "attachments", "config_load", "parse", "delivery", "render"]
+
+            response = self.client.post(
+                "/notify",
+                {"urls": "json://localhost", "body": "test"},
+            )
+            assert response.status_code == 200
+            assert phases(response) == ["body", "attachments", "parse", "delivery", "render"]
+
+            response = self.client.get(f"/json/urls/{key}")
+            assert response.status_code == 200
+            assert phases(response) == ["config_load", "parse"]
+
+            # Streamed responses report what was done before streaming began
+            response = self.client.post(
+                "/notify",
+                data=json.dumps({"urls": "json://localhost", "body": "test"}),
+                content_type="application/json",
+                headers={"Accept": "application/x-ndjson"},
+            )
+            assert response.status_code == 200
+            assert phases(response) == ["body", "remap", "parse"]
+            b"".join(response.streaming_content)
+
+        # A token can be used to ask for it
+        with override_settings(APPRISE_SERVER_TIMING_TOKEN="secret"):
+            response = self.client.get(f"/json/urls/{key}")
+            assert "Server-Timing" not in response
+
+            response = self.client.get(f"/json/urls/{key}", headers={"X-Apprise-Server-Timing": "invalid"})
+            assert "Server-Timing" not in response
+
+            response = self.client.get(f"/json/urls/{key}", headers={"X-Apprise-Server-Timing": "secret"})
+            assert phases(response) == ["config_load", "parse"]
+
+        # A token is required to be set for the header to be honored
+        response = self.client.get(f"/json/urls/{key}", headers={"X-Apprise-Server-Timing": ""})
+        assert "Server-Timing" not in response
@@ -21,12 +21,20 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import ipaddress
+import re
 import socket
+import threading
+import time
 from unittest import mock
 
+from apprise.utils.parse import parse_url
 from django.test import SimpleTestCase
+import requests
 
-from ..urlfilter import AppriseURLFilter
+from .. import urlfilter
+from ..urlfilter import AppriseURLFilter, pinned
 
 
 class AttachmentTests(SimpleTestCase):
@@ -484,3 +492,207 @@ class AttachmentTests(SimpleTestCase):
         for host_value in ("", None):
             with mock.patch("apprise_api.api.urlfilter.parse_url", return_value={"host": host_value}):
                 self.assertFalse(af.is_allowed("http://whatever/x"))
+
+    def test_internal_token_resolution_cache(self):
+        """
+        Hosts checked against the "internal" token are only resolved once
+        (until their entry expires)
+        """
+        public = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.215.14", 0))]
+        af = AppriseURLFilter("*", "internal", resolve_ttl=60, resolve_cache_size=2)
+
+        with mock.patch("socket.getaddrinfo", return_value=public) as mock_getaddrinfo:
+            self.assertTrue(af.is_allowed("http://example.com/a"))
+            self.assertTrue(af.is_allowed("http://EXAMPLE.com/b"))
+            assert mock_getaddrinfo.call_count == 1
+
+            # Literal addresses need no lookup (and are never cached)
+            self.assertTrue(af.is_allowed("http://8.8.8.8/x"))
+            assert mock_getaddrinfo.call_count == 1
+
+            # Our cache is bounded; the least recently used host is evicted
+            self.assertTrue(af.is_allowed("http://example.net/x"))
+            self.assertTrue(af.is_allowed("http://example.org/x"))
+            self.assertTrue(af.is_allowed("http://example.com/c"))
+            assert mock_getaddrinfo.call_count == 4
+
+        assert af.resolver.stats() == {"size": 2, "entries": 2, "hits": 1, "negative_hits": 0, "misses": 4}
+
+        # Entries expire
+        with (
+            mock.patch("socket.getaddrinfo", return_value=public) as mock_getaddrinfo,
+            mock.patch("time.monotonic", return_value=time.monotonic() + 61),
+        ):
+            self.assertTrue(af.is_allowed("http://example.com/d"))
+            assert mock_getaddrinfo.call_count == 1
+
+        # Failures are remembered too, but only briefly
+        with mock.patch("socket.getaddrinfo", side_effect=socket.gaierror("name not known")) as mock_getaddrinfo:
+            self.assertFalse(af.is_allowed("http://this-does-not-resolve.invalid/x"))
+            self.assertFalse(af.is_allowed("http://this-does-not-resolve.invalid/y"))
+            assert mock_getaddrinfo.call_count == 1
+
+            with mock.patch("time.monotonic", return_value=time.monotonic() + 6):
+                self.assertFalse(af.is_allowed("http://this-does-not-resolve.invalid/z"))
+            assert mock_getaddrinfo.call_count == 2
+
+        assert af.resolver.stats()["negative_hits"] == 1
+
+        af.resolver.clear()
+        assert af.resolver.stats()["entries"] == 0
+
+        # The cache can be disabled
+        af = AppriseURLFilter("*", "internal", resolve_ttl=0)
+        with mock.patch("socket.getaddrinfo", return_value=public) as mock_getaddrinfo:
+            self.assertTrue(af.is_allowed("http://example.com/a"))
+            self.assertTrue(af.is_allowed("http://example.com/b"))
+            assert mock_getaddrinfo.call_count == 2
+
+        assert af.resolver.stats()["entries"] == 0
+
+    def test_combined_rules_large_rule_sets(self):
+        """
+        Large allow/deny lists are checked in a single pass (and agree with
+        checking each of their rules one at a time)
+        """
+        deny = []
+        allow = []
+        for no in range(500):
+            deny.append(f"host{no}.example.com")
+            deny.append(f"*.deny{no}.example.com")
+            deny.append(f"https://files{no}.example.com/private")
+            allow.append(f"cdn{no}.example.net")
+            allow.append(f"img?{no}.example.net")
+            allow.append(f"media{no}.example.org/public/*")
+
+        af = AppriseURLFilter(" ".join(allow), ",".join(deny))
+        assert len(af.allow.hosts) == 500
+        assert len(af.deny.hosts) == 500
+
+        def is_allowed(url):
+            # Our rules checked one at a time
+            parsed = parse_url(url, strict_port=True, simple=True)
+            netloc = f"{parsed['host']}:{parsed['port']}" if parsed.get("port") else parsed["host"]
+            for rules, outcome in ((af.deny_rules, False), (af.allow_rules, True)):
+                for pattern, kind, _ in rules:
+                    if pattern.match(url if kind == "url" else netloc):
+                        return outcome
+
+            return False
+
+        urls = []
+        for no in range(0, 500, 7):
+            urls.extend(
+                (
+                    f"http://HOST{no}.example.com/x",
+                    f"http://a.b.deny{no}.example.com/x",
+                    f"https://files{no}.example.com/private/a.png",
+                    f"https://files{no}.example.com/public/a.png",
+                    f"http://files{no}.example.com/private/a.png",
+                    f"http://cdn{no}.example.net/a.png",
+                    f"http://cdn{no}.example.net:8080/a.png",
+                    f"https://imgx{no}.example.net/a.png",
+                    f"https://imgxx{no}.example.net/a.png",
+                    f"https://media{no}.example.org/public/a.png",
+                    f"https://media{no}.example.org/private/a.png",
+                    f"https://unknown{no}.example.org/",
+                )
+            )
+
+        results = [af.is_allowed(url) for url in urls]
+        assert results == [is_allowed(url) for url in urls]
+        assert any(results)
+        assert not all(results)
+
+        # Our wildcard host and URL rules were each combined into a single
+        # pattern (hosts without wildcards are looked up instead)
+        for rules in (af.allow, af.deny):
+            assert isinstance(rules.host_regex, re.Pattern)
+            assert isinstance(rules.url_regex, re.Pattern)
+            assert rules.host_regex.groups == 0
+            assert rules.url_regex.groups == 0
+        assert af.allow.host_regex.pattern.count("(?:^") == 500
+        assert af.allow.url_regex.pattern.count("(?:^") == 500
+        assert af.deny.host_regex.pattern.count("(?:^") == 500
+        assert af.deny.url_regex.pattern.count("(?:^") == 500
+
+        # Our combined matchers alone decide the outcome; the rules they
+        # were built from are never checked one at a time
+        af.allow_rules = []
+        af.deny_rules = []
+        assert [af.is_allowed(url) for url in urls] == results
+
+    def test_check_returns_validated_addresses(self):
+        """
+        check() hands back the addresses an "internal" rule validated
+        """
+        public = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.215.14", 0))]
+        with mock.patch("socket.getaddrinfo", return_value=public):
+            assert AppriseURLFilter("*", "internal").check("http://example.com/x") == (
+                True,
+                [ipaddress.ip_address("93.184.215.14")],
+            )
+
+            # Nothing was resolved
+            assert AppriseURLFilter("*", "").check("http://example.com/x") == (True, None)
+
+            # Denied URLs have no addresses
+            assert AppriseURLFilter("", "internal").check("http://example.com/x") == (False, None)
+            assert AppriseURLFilter("*", "example.com internal").check("http://example.com/x") == (False, None)
+
+        assert AppriseURLFilter("*", "internal").check("http://127.0.0.1/x") == (False, None)
+
+    def test_pinned_connections(self):
+        """
+        Connections to a pinned host are made to the addresses it was pinned
+        to (without resolving it again)
+        """
+        server = HTTPServer(("127.0.0.1", 0), _PinnedHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        port = server.server_address[1]
+        url = f"http://pinned.example:{port}/x"
+
+        with mock.patch("socket.getaddrinfo", wraps=socket.getaddrinfo) as mock_getaddrinfo:
+            # The first address refuses our connection; the next is tried
+            with pinned("pinned.example.", [ipaddress.ip_address("127.0.0.2"), ipaddress.ip_address("127.0.0.1")]):
+                response = requests.get(url, timeout=5)
+                assert response.status_code == 200
+                assert response.text == f"pinned.example:{port}"
+
+            # The host itself was never resolved
+            assert all(call.args[0] != "pinned.example" for call in mock_getaddrinfo.call_args_list)
+
+        # Outside of our context the host is resolved as usual
+        with (
+            mock.patch("socket.getaddrinfo", side_effect=socket.gaierror("name not known")),
+            self.assertRaises(requests.ConnectionError),
+        ):
+            requests.get(url, timeout=5)
+
+        # Every pinned address failing is reported
+        with (
+            pinned("pinned.example", [ipaddress.ip_address("127.0.0.2")]),
+            self.assertRaises(requests.ConnectionError),
+        ):
+            requests.get(url, timeout=5)
+
+        # Nothing to pin
+        with pinned("pinned.example", None):
+            assert not urlfilter._PINNED_ADDRESSES.get()
+
+
+class _PinnedHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        # Echo back the host we were asked for
+        body = self.headers["Host"].encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
@@ -21,7 +21,9 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
+import logging
 import os
+import queue
 import tempfile
 from unittest import mock
 
@@ -60,3 +62,54 @@ class UtilsTests(SimpleTestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir, mock.patch("os.fdopen", side_effect=OSError()):
             assert utils.touch(os.path.join(tmpdir, "tmp-file")) is False
+
+    def test_apprise_log_capture(self):
+        """
+        Test AppriseLogCapture() and the rendering of what it captures
+        """
+        apprise_logger = logging.getLogger("apprise")
+        level = apprise_logger.level
+
+        with utils.AppriseLogCapture(level=logging.DEBUG - 1) as logs:
+            # Our level is adjusted for the duration of our capture
+            assert apprise_logger.getEffectiveLevel() == logging.DEBUG - 1
+
+            # Content that used to be difficult to recover from the text
+            # produced by a capture
+            apprise_logger.info('A "quoted" <message>\nspanning lines","<!!-!ESC!-!!>  ')
+            apprise_logger.warning("A %s message", "formatted")
+            try:
+                raise ValueError("oops")
+
+            except ValueError:
+                apprise_logger.exception("An exception")
+
+        assert apprise_logger.level == level
+        assert len(logs.records) == 3
+
+        entry = utils.log_entry(logs.records[0], "application/json")
+        assert entry[0] == "INFO"
+        assert entry[2] == 'A "quoted" <message>\nspanning lines","<!!-!ESC!-!!>'
+        assert utils.log_entry(logs.records[1], "application/json")[2] == "A formatted message"
+        assert "ValueError: oops" in utils.log_entry(logs.records[2], "application/json")[2]
+
+        entry = utils.log_entry(logs.records[0], "text/html")
+        assert entry.startswith('<li class="log_INFO"><div class="log_time">')
+        assert "&quot;quoted&quot; &lt;message&gt;" in entry
+
+        entry = utils.log_entry(logs.records[1])
+        assert entry.endswith("[WARNING] apprise: A formatted message\n")
+
+        # Nothing is captured once we're done
+        apprise_logger.warning("Not captured")
+        assert len(logs.records) == 3
+
+        # Records can be handed to a queue instead
+        records = queue.Queue()
+        with utils.AppriseLogCapture(records, level=logging.INFO) as logs:
+            apprise_logger.info("Queued")
+            apprise_logger.debug("Ignored")
+
+        assert not logs.records
+        assert records.get_nowait().getMessage() == "Queued"
+        assert records.empty()
@@ -28,11 +28,12 @@ from django.test import SimpleTestCase
 from django.test.utils import override_settings
 import requests
 
+from .. import utils
 from ..utils import send_webhook
 
 
 class WebhookTests(SimpleTestCase):
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def test_webhook_testing(self, mock_post):
         """
         Test webhook handling
@@ -134,3 +135,40 @@ class WebhookTests(SimpleTestCase):
         with override_settings(APPRISE_WEBHOOK_URL="http://localhost"):
             send_webhook({})
             assert mock_post.call_count == 1
+
+    @mock.patch("requests.Session.post")
+    def test_webhook_session(self, mock_post):
+        """
+        Our webhook is only parsed once and its deliveries share a session
+        """
+        response = mock.Mock()
+        response.status_code = requests.codes.ok
+        mock_post.return_value = response
+
+        with (
+            override_settings(APPRISE_WEBHOOK_URL="https://localhost/webhook?key=value"),
+            mock.patch("apprise.URLBase.parse_url", wraps=utils.apprise.URLBase.parse_url) as mock_parse,
+        ):
+            utils.get_webhook.cache_clear()
+            for _ in range(3):
+                send_webhook({})
+
+            assert mock_post.call_count == 3
+            assert mock_parse.call_count == 1
+
+            webhook = utils.get_webhook("https://localhost/webhook?key=value")
+            assert webhook
+            assert webhook.params == {"key": "value"}
+
+            # Cookies are never kept between deliveries
+            session = webhook.session
+            assert session.cookies.get_policy().allowed_domains() == ()
+
+        # A change to our URL is picked up
+        with override_settings(APPRISE_WEBHOOK_URL="http://localhost/other"):
+            send_webhook({})
+            assert mock_post.call_args_list[-1][0][0] == "http://localhost/other"
+            assert utils.get_webhook("http://localhost/other").session is not session
+
+        # An invalid webhook has no session to deliver with
+        assert not utils.get_webhook("invalid")
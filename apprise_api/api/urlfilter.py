@@ -21,12 +21,18 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+import contextvars
 import ipaddress
 import re
 import socket
+import threading
+import time
 
 from apprise.utils.parse import parse_url
+from urllib3.util import connection as urllib3_connection
 
 # A reserved deny-list token; see the "internal" entry in the
 # AppriseURLFilter class docstring below for what it does.
@@ -35,9 +41,19 @@ INTERNAL_TOKEN = "internal"
 # Slow DNS Handling
 _RESOLVE_TIMEOUT_SEC = 5
 
+# The number of seconds a failed resolution is remembered for (capped by the
+# TTL of the AppriseResolveCache it is kept in)
+_RESOLVE_NEGATIVE_TTL_SEC = 5
+
 # A shared, bounded pool for DNS resolution
 _RESOLVE_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="apprise-urlfilter-resolve")
 
+# The addresses (keyed by host) our connections are pinned to; see pinned()
+_PINNED_ADDRESSES = contextvars.ContextVar("pinned_addresses", default=None)
+
+# Protects the installation of our _create_pinned_connection() hook
+_PIN_LOCK = threading.Lock()
+
 # 100.64.0.0/10 - RFC 6598 - Carrier-Grade NAT shared address space
 _CGN_SHARED_V4 = ipaddress.ip_network("100.64.0.0/10")
 
@@ -59,6 +75,20 @@ def _is_blocked_address(addr) -> bool:
     )
 
 
+def _literal_address(host: str):
+    """
+    Returns the ipaddress.IPv4Address/IPv6Address of a literal IP host
+    (optionally bracketed, e.g. "[::1]"), otherwise None.
+    """
+    literal = host[1:-1] if host.startswith("[") and host.endswith("]") else host
+    try:
+        return ipaddress.ip_address(literal)
+
+    except ValueError:
+        # Not a literal address
+        return None
+
+
 def _resolve_addresses(host: str):
     """
     Resolve a host to its ipaddress.IPv4Address/IPv6Address objects.
@@ -69,13 +99,11 @@ def _resolve_addresses(host: str):
     proven safe.
     """
     # A literal IP (optionally bracketed, e.g. "[::1]") needs no lookup.
-    literal = host[1:-1] if host.startswith("[") and host.endswith("]") else host
-    try:
-        return [ipaddress.ip_address(literal)]
+    address = _literal_address(host)
+    if address is not None:
+        return [address]
 
-    except ValueError:
-        # Not a literal address; fall through to DNS resolution below.
-        pass
+    literal = host[1:-1] if host.startswith("[") and host.endswith("]") else host
 
     # Use a thread pool to avoid blocking the main thread on DNS resolution. The
     # pool is shared/long-lived so that it can be reused across multiple
@@ -107,6 +135,212 @@ def _resolve_addresses(host: str):
     return addresses or None
 
 
+def _create_pinned_connection(address, *args, **kwargs):
+    """
+    Wraps urllib3's create_connection(); connections made to a pinned host
+    (see pinned()) are made to the addresses it was pinned to instead of
+    resolving it again.  Everything else is left untouched.
+    """
+    host, port = address
+    addresses = (_PINNED_ADDRESSES.get() or {}).get(host.rstrip(".").lower())
+    if not addresses:
+        return _create_pinned_connection.__wrapped__(address, *args, **kwargs)
+
+    error = None
+    for addr in addresses:
+        try:
+            return _create_pinned_connection.__wrapped__((str(addr), port), *args, **kwargs)
+
+        except OSError as e:
+            # Try our next address
+            error = e
+
+    raise error
+
+
+@contextmanager
+def pinned(host: str, addresses):
+    """
+    Connections made (by requests/urllib3) to the host provided within this
+    context are made to the addresses provided; these are the addresses
+    AppriseURLFilter.check() already validated, so the host is neither
+    resolved a second time nor able to resolve somewhere else in between.
+
+    TLS (SNI and certificate verification) still uses the host itself.
+    """
+    if not addresses:
+        # Nothing to pin
+        yield
+        return
+
+    with _PIN_LOCK:
+        if urllib3_connection.create_connection is not _create_pinned_connection:
+            # Install our hook (only ever done once)
+            _create_pinned_connection.__wrapped__ = urllib3_connection.create_connection
+            urllib3_connection.create_connection = _create_pinned_connection
+
+    literal = host[1:-1] if host.startswith("[") and host.endswith("]") else host
+    token = _PINNED_ADDRESSES.set({**(_PINNED_ADDRESSES.get() or {}), literal.rstrip(".").lower(): tuple(addresses)})
+    try:
+        yield
+
+    finally:
+        _PINNED_ADDRESSES.reset(token)
+
+
+class AppriseResolveCache:
+    """
+    A bounded (Least Recently Used) cache of the addresses our hosts resolve
+    to; repeated checks of the same host are spared a trip to the resolver.
+
+    Resolved addresses are kept for ttl seconds.  A host that could not be
+    resolved is only remembered for a short while (_RESOLVE_NEGATIVE_TTL_SEC)
+    so that a struggling resolver does not hold up every request for it.
+    """
+
+    def __init__(self, ttl=60, size=1024):
+        """
+        Initialize our cache; a ttl or size of zero (0) disables it entirely
+        """
+        self.ttl = max(0, ttl)
+        self.size = max(0, int(size))
+        self.negative_ttl = min(_RESOLVE_NEGATIVE_TTL_SEC, self.ttl)
+
+        # Our cached (expiry, addresses) entries keyed by host; ordered from
+        # least to most recently used
+        self._entries = OrderedDict()
+
+        # Protect our entries from concurrent (greenlet/thread) access; the
+        # resolution itself is always performed outside of our lock
+        self._lock = threading.Lock()
+
+        # Our cache statistics
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+
+    def resolve(self, host: str):
+        """
+        Returns the addresses the host resolves to (or None if it could not
+        be resolved); see _resolve_addresses()
+        """
+        if not (self.ttl and self.size) or _literal_address(host) is not None:
+            # Nothing to cache (literal addresses need no lookup)
+            return _resolve_addresses(host)
+
+        key = host.lower()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, addresses = entry
+                if expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    if addresses is None:
+                        self.negative_hits += 1
+
+                    else:
+                        self.hits += 1
+
+                    return addresses
+
+                # Our entry has expired
+                del self._entries[key]
+
+            self.misses += 1
+
+        addresses = _resolve_addresses(host)
+
+        ttl = self.ttl if addresses else self.negative_ttl
+        if ttl:
+            with self._lock:
+                self._entries[key] = (time.monotonic() + ttl, addresses)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.size:
+                    # Evict our least recently used entry
+                    self._entries.popitem(last=False)
+
+        return addresses
+
+    def clear(self):
+        """
+        Removes all cached entries
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Returns our cache statistics
+        """
+        with self._lock:
+            return {
+                "size": self.size,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+            }
+
+
+class AppriseURLRules:
+    """
+    A list of parsed rules (see AppriseURLFilter._parse_list()) compiled into
+    as few matchers as possible so that a URL is checked against all of them
+    at once instead of one rule at a time:
+      - Host rules without wildcards are looked up in a set.
+      - The remaining host rules are combined into a single regex.
+      - URL rules are combined into a single regex.
+      - "internal" rules are reduced to a flag (they resolve instead of match).
+    """
+
+    def __init__(self, rules):
+        hosts = set()
+        host_patterns = []
+        url_patterns = []
+
+        # Whether or not we have an "internal" rule
+        self.internal = False
+
+        for compiled, kind, token in rules:
+            if kind == "internal":
+                self.internal = True
+
+            elif kind == "url":
+                url_patterns.append(compiled.pattern)
+
+            elif "*" in token or "?" in token:
+                host_patterns.append(compiled.pattern)
+
+            else:
+                hosts.add(token)
+
+        self.hosts = frozenset(hosts)
+        self.host_regex = self._combine(host_patterns)
+        self.url_regex = self._combine(url_patterns)
+
+    @staticmethod
+    def _combine(patterns):
+        """
+        Combines our (anchored) patterns into a single regex; None is
+        returned if there are none.
+        """
+        if not patterns:
+            return None
+
+        return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+
+    def match(self, url: str, netloc: str) -> bool:
+        """
+        Returns True if the url (or its netloc) matches one of our host or
+        URL rules; "internal" rules are not considered here.
+        """
+        return bool(
+            netloc.lower() in self.hosts
+            or (self.host_regex is not None and self.host_regex.match(netloc))
+            or (self.url_regex is not None and self.url_regex.match(url))
+        )
+
+
 class AppriseURLFilter:
     """
     A URL filtering class that uses pre-parsed and pre-compiled allow/deny lists.
@@ -128,14 +362,21 @@ class AppriseURLFilter:
     A trailing '*' is implied if not already present so that rules operate as a prefix match.
     """
 
-    def __init__(self, allow_list: str, deny_list: str):
+    def __init__(self, allow_list: str, deny_list: str, resolve_ttl: int = 60, resolve_cache_size: int = 1024):
+        # The hosts our "internal" rules resolved
+        self.resolver = AppriseResolveCache(ttl=resolve_ttl, size=resolve_cache_size)
+
         # Pre-compile our rules.
-        # Each rule is stored as a tuple (compiled_regex, kind) where kind is
-        # one of "url", "host", or "internal". compiled_regex is None for
-        # "internal" rules since they resolve/classify instead of matching.
+        # Each rule is stored as a tuple (compiled_regex, kind, token) where
+        # kind is one of "url", "host", or "internal". compiled_regex is None
+        # for "internal" rules since they resolve/classify instead of matching.
         self.allow_rules = self._parse_list(allow_list)
         self.deny_rules = self._parse_list(deny_list)
 
+        # Our rules combined so that each list is checked in a single pass
+        self.allow = AppriseURLRules(self.allow_rules)
+        self.deny = AppriseURLRules(self.deny_rules)
+
     def _parse_list(self, list_str: str):
         """
         Split the list (tokens separated by whitespace or commas) and compile each token.
@@ -144,7 +385,7 @@ class AppriseURLFilter:
           - URL-based tokens: if they start with “http://” or “https://” (explicit)
             or if they contain a “/” (implicit; no scheme given).
           - Host-based tokens: those that do not contain a “/”.
-        Returns a list of tuples (compiled_regex, kind).
+        Returns a list of tuples (compiled_regex, kind, token).
         """
         tokens = re.split(r"[\s,]+", list_str.strip().lower())
         rules = []
@@ -154,7 +395,7 @@ class AppriseURLFilter:
 
             if token == INTERNAL_TOKEN:
                 # Resolved/classified at match time; nothing to compile.
-                rules.append((None, "internal"))
+                rules.append((None, "internal", token))
                 continue
 
             if token.startswith("http://") or token.startswith("https://"):
@@ -172,7 +413,7 @@ class AppriseURLFilter:
                 compiled = self._compile_host_token(token)
                 kind = "host"
 
-            rules.append((compiled, kind))
+            rules.append((compiled, kind, token))
         return rules
 
     def _compile_url_token(self, token: str):
@@ -231,23 +472,23 @@ class AppriseURLFilter:
 
         # Process the path.
         if path in ("", "/"):
-            regex += r"(/.*)?"
+            regex += r"(?:/.*)?"
 
         else:
             if path.endswith("*"):
                 # Remove the trailing "*" and append .*
-                regex += self._wildcard_to_regex(path[:-1]) + "([^/]+/?)"
+                regex += self._wildcard_to_regex(path[:-1]) + "(?:[^/]+/?)"
 
             elif path.endswith("/"):
                 # Remove the trailing "/" and allow an optional slash with extra path.
                 norm = self._wildcard_to_regex(path.rstrip("/"))
-                regex += norm + r"(/.*)?"
+                regex += norm + r"(?:/.*)?"
 
             else:
                 # For a nonempty path that does not end with "/" or "*",
                 # match either an exact match or a prefix (with a following slash).
                 norm = self._wildcard_to_regex(path)
-                regex += norm + r"($|/.*)"
+                regex += norm + r"(?:$|/.*)"
 
         regex += "$"
         return re.compile(regex, re.IGNORECASE)
@@ -290,22 +531,27 @@ class AppriseURLFilter:
 
         return regex
 
-    def _is_internal_target(self, host: str) -> bool:
+    def _internal_target(self, host: str):
         """
-        Resolves the given host and returns True if any resulting address is
-        loopback, private, link-local, reserved, unspecified, multicast, or
-        CGN shared space. A host that can't be resolved (including on
-        timeout) is treated as internal/blocked because it can't be proven safe.
+        Resolves the given host and returns a tuple of whether any resulting
+        address is loopback, private, link-local, reserved, unspecified,
+        multicast, or CGN shared space and the addresses themselves. A host
+        that can't be resolved (including on timeout) is treated as
+        internal/blocked because it can't be proven safe.
         """
-        addresses = _resolve_addresses(host)
+        addresses = self.resolver.resolve(host)
         if not addresses:
-            return True
+            return True, None
 
-        return any(_is_blocked_address(addr) for addr in addresses)
+        return any(_is_blocked_address(addr) for addr in addresses), addresses
 
-    def is_allowed(self, url: str) -> bool:
+    def check(self, url: str):
         """
         Checks a given URL against the deny list first, then the allow list.
+
+        Returns a tuple of whether the URL is allowed and the addresses its
+        host was resolved to (and validated against) by an "internal" rule;
+        these are None if no such rule needed to resolve it.
         """
         try:
             parsed = parse_url(url, strict_port=True, simple=True)
@@ -314,46 +560,42 @@ class AppriseURLFilter:
             # apprise's parse_url() can raise on certain malformed input
             # (e.g. an unbalanced IPv6 bracket) rather than returning None
             # like it does for other garbage; treat it the same way.
-            return False
+            return False, None
 
         if not parsed:
-            return False
+            return False, None
 
         # A parsed result with no usable host can't be matched against
         # anything meaningfully -- treat it as blocked rather than let an
         # empty/None host reach string formatting or DNS resolution below.
         host = parsed.get("host")
         if not host:
-            return False
+            return False, None
 
         # includes port if present
         port = parsed.get("port")
         netloc = f"{host}:{port}" if port is not None else host
 
-        # Check deny rules first.
-        for pattern, kind in self.deny_rules:
-            if kind == "internal":
-                if self._is_internal_target(host):
-                    return False
-
-            elif kind == "url":
-                if pattern.match(url):
-                    return False
+        # Check deny rules first; our (cheap) host and URL rules are checked
+        # before we go as far as resolving the host for an "internal" one.
+        if self.deny.match(url, netloc):
+            return False, None
 
-            elif pattern.match(netloc):
-                return False
+        addresses = None
+        if self.deny.internal:
+            internal, addresses = self._internal_target(host)
+            if internal:
+                return False, None
 
         # Then check allow rules. "internal" has no meaning as a positive
         # match (there's nothing bounded to allow), so it's ignored here.
-        for pattern, kind in self.allow_rules:
-            if kind == "internal":
-                continue
-
-            if kind == "url":
-                if pattern.match(url):
-                    return True
+        if not self.allow.match(url, netloc):
+            return False, None
 
-            elif pattern.match(netloc):
-                return True
+        return True, addresses
 
-        return False
+    def is_allowed(self, url: str) -> bool:
+        """
+        Checks a given URL against the deny list first, then the allow list.
+        """
+        return self.check(url)[0]
@@ -43,7 +43,14 @@ urlpatterns = [
         views.NotifyView.as_view(),
         name="notify",
     ),
+    re_path(
+        r"^notify/(?P<key>[\w_-]{1,128})/batch/?$",
+        views.BatchNotifyView.as_view(),
+        name="notify_batch",
+    ),
     re_path(r"^notify/?$", views.StatelessNotifyView.as_view(), name="s_notify"),
+    re_path(r"^batch/?$", views.StatelessBatchNotifyView.as_view(), name="s_notify_batch"),
+    re_path(r"^job/(?P<job_id>[a-f0-9]{32})/?$", views.JobView.as_view(), name="job"),
     re_path(
         r"^json/urls/(?P<key>[\w_-]{1,128})/?$",
         views.JsonUrlView.as_view(),
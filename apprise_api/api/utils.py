@@ -23,26 +23,44 @@
 # THE SOFTWARE.
 import base64
 import binascii
-from contextlib import suppress
+import bisect
+from collections import OrderedDict
+import concurrent.futures
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import nullcontext, suppress
+import contextvars
 from datetime import datetime
 import errno
+from functools import lru_cache, partial
 import gzip
 import hashlib
+import hmac
+import http.cookiejar
+import itertools
 from json import dumps
 
 # import the logging library
 import logging
+import logging.handlers
 import os
 import re
 import shutil
+import sqlite3
 import tempfile
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+import zlib
 
 import apprise
 from django.conf import settings
 from django.http import HttpRequest
+from django.utils.html import escape
 import requests
 
-from .urlfilter import AppriseURLFilter
+from . import metrics
+from .generation import AppriseGenerationTable
+from .urlfilter import AppriseURLFilter, pinned
 
 # Get an instance of a logger
 logger = logging.getLogger("django")
@@ -54,6 +72,12 @@ logger = logging.getLogger("django")
 # application/x-json
 MIME_IS_JSON = re.compile(r"(text|application)/(x-)?json", re.I)
 
+# Newline delimited JSON (one document per line)
+MIME_IS_NDJSON = re.compile(r"application/(x-)?ndjson", re.I)
+
+# Used to render the log records we capture as text
+LOG_FORMATTER = logging.Formatter(settings.LOGGING["formatters"]["standard"]["format"])
+
 # Parsing of Accept; the following amounts to Accept All
 # */*
 # <blank>
@@ -73,6 +97,71 @@ def is_json_response(request: HttpRequest) -> bool:
     )
 
 
+def is_ndjson_response(request: HttpRequest) -> bool:
+    """Return whether the request asked for a streamed (NDJSON) response.
+
+    Only an explicit Accept of application/x-ndjson (or application/ndjson)
+    qualifies.
+    """
+    return MIME_IS_NDJSON.search(request.headers.get("accept", "")) is not None
+
+
+def is_async_request(request: HttpRequest) -> bool:
+    """Return whether the request asked for asynchronous delivery.
+
+    Either the X-Apprise-Async header or the async query string argument
+    may be used (e.g. ?async=yes).
+    """
+    value = request.headers.get("X-Apprise-Async", request.GET.get("async", "")).strip()
+    return bool(value) and value[0].lower() in ("a", "y", "1", "t", "e", "+")
+
+
+def is_stream_request(request: HttpRequest) -> bool:
+    """Return whether the request asked for its logs to be streamed back.
+
+    An Accept of application/x-ndjson implies this; otherwise either the
+    X-Apprise-Stream header or the stream query string argument may be used
+    (e.g. ?stream=yes).
+    """
+    if is_ndjson_response(request):
+        return True
+
+    value = request.headers.get("X-Apprise-Stream", request.GET.get("stream", "")).strip()
+    return bool(value) and value[0].lower() in ("a", "y", "1", "t", "e", "+")
+
+
+def is_server_timing_request(request: HttpRequest) -> bool:
+    """Return whether the Server-Timing header should be included in our
+    response.
+
+    This is always the case if APPRISE_SERVER_TIMING is set; otherwise the
+    request must provide the APPRISE_SERVER_TIMING_TOKEN in the
+    X-Apprise-Server-Timing header.
+    """
+    if settings.APPRISE_SERVER_TIMING:
+        return True
+
+    token = request.headers.get("X-Apprise-Server-Timing", "")
+    return bool(settings.APPRISE_SERVER_TIMING_TOKEN and token) and hmac.compare_digest(
+        token.encode("utf-8"), settings.APPRISE_SERVER_TIMING_TOKEN.encode("utf-8")
+    )
+
+
+def notify_concurrency(request: HttpRequest) -> int:
+    """Return the number of services a notification may be delivered to at
+    the same time.
+
+    The X-Apprise-Concurrency header may lower (but never raise) the value
+    set by APPRISE_NOTIFY_CONCURRENCY.  A ValueError is raised if the header
+    is not a positive integer.
+    """
+    concurrency = int(request.headers.get("X-Apprise-Concurrency", settings.APPRISE_NOTIFY_CONCURRENCY))
+    if concurrency < 1:
+        raise ValueError("Invalid Concurrency Value")
+
+    return min(concurrency, settings.APPRISE_NOTIFY_CONCURRENCY)
+
+
 class AppriseStoreMode:
     """
     Defines the store modes of configuration
@@ -86,10 +175,28 @@ class AppriseStoreMode:
     # there is nothing further done
     SIMPLE = "simple"
 
+    # Content is written to a single SQLite database by it's key
+    SQLITE = "sqlite"
+
     # When set to disabled; stateful functionality is disabled
     DISABLED = "disabled"
 
 
+class AppriseConfigCodec:
+    """
+    Defines the codecs configuration can be written with (in HASH mode)
+    """
+
+    # This is the default option. Content is gzip compressed
+    GZIP = "gzip"
+
+    # Content is compressed (raw deflate) without the gzip header/trailer
+    ZLIB = "zlib"
+
+    # Content is written uncompressed
+    NONE = "none"
+
+
 class AttachmentPayload:
     """
     Defines the supported Attachment Payload Types
@@ -105,9 +212,35 @@ class AttachmentPayload:
 STORE_MODES = (
     AppriseStoreMode.HASH,
     AppriseStoreMode.SIMPLE,
+    AppriseStoreMode.SQLITE,
     AppriseStoreMode.DISABLED,
 )
 
+CONFIG_CODECS = (
+    AppriseConfigCodec.GZIP,
+    AppriseConfigCodec.ZLIB,
+    AppriseConfigCodec.NONE,
+)
+
+# Gzip files identify themselves; the content written by our other codecs
+# is prefixed with a marker instead so that any file can be read back no
+# matter which codec is currently configured
+GZIP_MAGIC = b"\x1f\x8b"
+CONFIG_CODEC_MARKERS = {
+    AppriseConfigCodec.ZLIB: b"\x00zlib",
+    AppriseConfigCodec.NONE: b"\x00none",
+}
+
+# The store modes our keys can be listed in (see APPRISE_ADMIN)
+KEY_LIST_MODES = (
+    AppriseStoreMode.HASH,
+    AppriseStoreMode.SIMPLE,
+    AppriseStoreMode.SQLITE,
+)
+
+# The characters base64 decoding ignores
+BASE64_DISCARD_RE = re.compile(rb"[^A-Za-z0-9+/=]")
+
 # Access our Attachment Manager Singleton
 A_MGR = apprise.manager_attachment.AttachmentManager()
 
@@ -123,7 +256,12 @@ N_MGR = apprise.manager_plugins.NotificationManager()
 N_MGR.evict_on_disable = True
 
 # Prepare our Attachment URL Filter
-ATTACH_URL_FILTER = AppriseURLFilter(settings.APPRISE_ATTACH_ALLOW_URLS, settings.APPRISE_ATTACH_DENY_URLS)
+ATTACH_URL_FILTER = AppriseURLFilter(
+    settings.APPRISE_ATTACH_ALLOW_URLS,
+    settings.APPRISE_ATTACH_DENY_URLS,
+    resolve_ttl=settings.APPRISE_ATTACH_RESOLVE_CACHE_TTL,
+    resolve_cache_size=settings.APPRISE_ATTACH_RESOLVE_CACHE_SIZE,
+)
 
 
 class Attachment(A_MGR["file"]):
@@ -132,13 +270,33 @@ class Attachment(A_MGR["file"]):
     Attachments
     """
 
-    def __init__(self, filename, path=None, delete=True, **kwargs):
+    def __init__(self, filename, path=None, delete=True, size=None, **kwargs):
         """
         Initialize our attachment
+
+        If the size of our content is known up front (and it is small
+        enough), it is kept in memory (APPRISE_ATTACH_MEMORY_DIR) instead of
+        on disk.
         """
         self._filename = filename
         self.delete = delete
         self._path = None
+
+        # Whether or not our content is kept in memory
+        self.in_memory = False
+
+        if not path and is_memory_attachment(size):
+            try:
+                os.makedirs(settings.APPRISE_ATTACH_MEMORY_DIR, exist_ok=True)
+                d, path = tempfile.mkstemp(dir=settings.APPRISE_ATTACH_MEMORY_DIR)
+                # Close our file descriptor
+                os.close(d)
+                self.in_memory = True
+
+            except OSError:
+                # Fall back to disk
+                path = None
+
         try:
             os.makedirs(settings.APPRISE_ATTACH_DIR, exist_ok=True)
 
@@ -165,6 +323,9 @@ class Attachment(A_MGR["file"]):
         # Update our file size based on the settings value
         self.max_file_size = settings.APPRISE_ATTACH_SIZE
 
+        # Remove us as soon as the request we are a part of is done with us
+        AttachmentScope.track(self)
+
     @property
     def filename(self):
         return self._filename
@@ -176,15 +337,25 @@ class Attachment(A_MGR["file"]):
         """
         return os.stat(self._path).st_size
 
-    def __del__(self):
+    def close(self):
         """
-        De-Construtor is used to tidy up files during garbage collection
+        Removes our attachment from disk (if it is ours to remove); this is
+        safe to call more than once
         """
         if self.delete and self._path:
             # no problem if file is missing
             with suppress(FileNotFoundError):
                 os.remove(self._path)
 
+            self.delete = False
+
+    def __del__(self):
+        """
+        De-Construtor is used to tidy up files during garbage collection
+        (should they not have already been)
+        """
+        self.close()
+
 
 class HTTPAttachment(A_MGR["http"]):
     """
@@ -226,6 +397,14 @@ class HTTPAttachment(A_MGR["http"]):
         # Prepare our item
         super().__init__(name=effective_name, **kwargs)
 
+        # Apprise guards each download with a lock shared by every web
+        # attachment; it only protects the content of this one, so we give
+        # each its own to allow them to be retrieved at the same time
+        self._lock = threading.Lock()
+
+        # Remove us as soon as the request we are a part of is done with us
+        AttachmentScope.track(self)
+
         # Update our file size based on the settings value
         self.max_file_size = settings.APPRISE_ATTACH_SIZE
 
@@ -240,15 +419,367 @@ class HTTPAttachment(A_MGR["http"]):
         """
         return 0 if not self else os.stat(self._path).st_size
 
-    def __del__(self):
+    def close(self):
         """
-        De-Construtor is used to tidy up files during garbage collection
+        Removes our attachment (and anything we retrieved) from disk; this
+        is safe to call more than once
         """
         if self.delete and self._path:
             # no problem if file is missing
             with suppress(FileNotFoundError):
                 os.remove(self._path)
 
+            self.delete = False
+
+        if hasattr(self, "_temp_file"):
+            # Remove what we retrieved
+            self.invalidate()
+
+    def __del__(self):
+        """
+        De-Construtor is used to tidy up files during garbage collection
+        (should they not have already been)
+        """
+        self.close()
+
+
+class AttachmentScope:
+    """
+    Tracks the attachments prepared while handling a request so that they
+    can be removed as soon as we are done with them (instead of whenever
+    they happen to be garbage collected).
+
+        with AttachmentScope() as scope:
+            attach = parse_attachments(payload, files)
+            ...
+
+        scope.close()
+
+    Work that carries on with our attachments once the request is done with
+    them (such as a streamed delivery) holds on to them until it completes:
+
+        scope.hold()
+        try:
+            ...
+        finally:
+            scope.release()
+    """
+
+    # The scope attachments are currently being prepared in
+    _current = contextvars.ContextVar("attachment_scope", default=None)
+
+    def __init__(self):
+        """
+        Prepare our scope
+        """
+        self.attachments = []
+        self._token = None
+
+        # Attachments may be prepared (and tracked) by the threads retrieving
+        # them
+        self._lock = threading.Lock()
+
+        # The work still using our attachments and whether or not we were
+        # closed while it was
+        self._holds = 0
+        self._closing = False
+
+    @classmethod
+    def current(cls):
+        """
+        Returns the current scope (if there is one)
+        """
+        return cls._current.get()
+
+    @classmethod
+    def track(cls, attachment):
+        """
+        Adds the attachment provided to the current scope (if there is one)
+        """
+        scope = cls._current.get()
+        if scope is not None:
+            with scope._lock:
+                scope.attachments.append(attachment)
+
+    def hold(self):
+        """
+        Keeps our attachments from being removed (should we be closed) until
+        release() is called
+        """
+        with self._lock:
+            self._holds += 1
+
+    def release(self):
+        """
+        Lets go of a hold(); our attachments are removed if we were closed
+        in the meantime
+        """
+        with self._lock:
+            self._holds -= 1
+            closing = self._closing and not self._holds
+
+        if closing:
+            self.close()
+
+    def close(self):
+        """
+        Removes all of the attachments we are tracking; this is deferred
+        until every hold() on them was released
+        """
+        with self._lock:
+            if self._holds:
+                self._closing = True
+                return
+
+            attachments, self.attachments = self.attachments, []
+            self._closing = False
+
+        while attachments:
+            attachments.pop().close()
+
+    def closing(self, content):
+        """
+        Yields the (streamed) content provided and removes our attachments
+        once it has been (or the client went away)
+        """
+        try:
+            yield from content
+
+        finally:
+            self.close()
+
+    def __enter__(self):
+        """
+        Attachments prepared from here on are tracked by us
+        """
+        self._token = self._current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Stop tracking attachments
+        """
+        self._current.reset(self._token)
+
+
+class AttachmentCache:
+    """
+    A cache of the web attachments we retrieved so that notifications
+    referencing the same URL share one copy of it.
+
+    The content is stored once (named after its SHA-256 digest) and looked
+    up by the URL it was retrieved from.  An entry is used as is for ttl
+    seconds; after this it is revalidated (through a HEAD request using its
+    ETag and/or Last-Modified) before it is used again.  The least recently
+    used entries are removed once the content we hold exceeds size bytes.
+    """
+
+    def __init__(self, path, ttl, size):
+        """
+        Prepare our cache
+        """
+        self.path = path
+        self.ttl = ttl
+        self.size = size
+
+        # Our entries (by URL) in the order they were last used
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __bool__(self):
+        """
+        Returns True if caching is enabled
+        """
+        return self.ttl > 0 and self.size > 0
+
+    def __len__(self):
+        """
+        Returns the number of URLs cached
+        """
+        return len(self._entries)
+
+    def get(self, url, attachment):
+        """
+        Returns a tuple of the cached attachment of the url provided (or
+        None if it must be retrieved) and the validators to cache it with
+        once it has been.
+
+        The attachment is the HTTPAttachment (not yet retrieved) prepared
+        for the url.
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None, {}
+
+            self._entries.move_to_end(url)
+
+        if entry["expires"] <= time.time():
+            current, validators = self.validate(attachment, entry)
+            if not current:
+                # Our content is out of date
+                self.discard(url)
+                return None, validators
+
+            with self._lock:
+                entry.update(validators, expires=time.time() + self.ttl)
+
+        path = None
+        try:
+            d, path = tempfile.mkstemp(dir=settings.APPRISE_ATTACH_DIR)
+            os.close(d)
+
+            source = os.path.join(self.path, entry["digest"])
+            if not link_file(source, path):
+                shutil.copyfile(source, path)
+
+            # Let our sweeper know our content is still in use
+            os.utime(source)
+
+        except OSError:
+            # Our content is gone (or could not be shared)
+            self.discard(url)
+            if path:
+                with suppress(OSError):
+                    os.remove(path)
+
+            return None, {}
+
+        return (
+            Attachment(
+                # A name identified by the request wins
+                attachment._name or entry["name"],
+                path=path,
+                mimetype=entry["mimetype"],
+            ),
+            {},
+        )
+
+    def validate(self, attachment, entry):
+        """
+        Revalidates our entry with the server that provided it.  Returns a
+        tuple of whether our entry is still current and its validators.
+        """
+        headers = {"User-Agent": attachment.app_id}
+        headers.update(attachment.headers)
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+
+        if entry["modified"]:
+            headers["If-Modified-Since"] = entry["modified"]
+
+        url = f"{attachment.schema}://{attachment.host}"
+        if isinstance(attachment.port, int):
+            url += f":{attachment.port}"
+
+        url += attachment.fullpath
+
+        try:
+            r = requests.head(
+                url,
+                headers=headers,
+                auth=(attachment.user, attachment.password) if attachment.user else None,
+                params=attachment.qsd,
+                verify=attachment.verify_certificate,
+                timeout=attachment.request_timeout,
+                allow_redirects=attachment.redirects,
+            )
+
+        except requests.RequestException:
+            # We can not vouch for our entry
+            return False, {}
+
+        if r.status_code == requests.codes.not_modified:
+            return True, {}
+
+        validators = {
+            "etag": r.headers.get("ETag"),
+            "modified": r.headers.get("Last-Modified"),
+        }
+
+        current = r.status_code == requests.codes.ok and (
+            (validators["etag"] is not None and validators["etag"] == entry["etag"])
+            or (validators["modified"] is not None and validators["modified"] == entry["modified"])
+        )
+        return current, validators
+
+    def put(self, url, attachment, validators=None):
+        """
+        Caches the (retrieved) attachment of the url provided
+        """
+        tmp_path = None
+        try:
+            size = os.stat(attachment.path).st_size
+            if size > self.size:
+                # Too large to be cached
+                return False
+
+            os.makedirs(self.path, exist_ok=True)
+
+            # Copy our content into our cache (named after its digest)
+            digest = hashlib.sha256()
+            d, tmp_path = tempfile.mkstemp(dir=self.path)
+            with open(attachment.path, "rb") as src, os.fdopen(d, "wb") as dst:
+                for chunk in iter(lambda: src.read(65536), b""):
+                    digest.update(chunk)
+                    dst.write(chunk)
+
+            digest = digest.hexdigest()
+            os.replace(tmp_path, os.path.join(self.path, digest))
+
+        except (OSError, TypeError):
+            if tmp_path:
+                with suppress(OSError):
+                    os.remove(tmp_path)
+
+            return False
+
+        validators = validators or {}
+        with self._lock:
+            self._entries[url] = {
+                "digest": digest,
+                "size": size,
+                "name": attachment.name,
+                "mimetype": attachment.mimetype,
+                "etag": validators.get("etag"),
+                "modified": validators.get("modified"),
+                "expires": time.time() + self.ttl,
+            }
+            self._entries.move_to_end(url)
+
+            # Keep within our budget
+            while sum({e["digest"]: e["size"] for e in self._entries.values()}.values()) > self.size:
+                _, entry = self._entries.popitem(last=False)
+                self._release(entry)
+
+        return True
+
+    def discard(self, url):
+        """
+        Removes the url provided from our cache
+        """
+        with self._lock:
+            entry = self._entries.pop(url, None)
+            if entry:
+                self._release(entry)
+
+    def _release(self, entry):
+        """
+        Removes the content of the entry provided if nothing else refers to
+        it (the lock must be held)
+        """
+        if not any(e["digest"] == entry["digest"] for e in self._entries.values()):
+            with suppress(OSError):
+                os.remove(os.path.join(self.path, entry["digest"]))
+
+
+# Our cache of retrieved web attachments
+ATTACH_CACHE = AttachmentCache(
+    settings.APPRISE_ATTACH_CACHE_DIR,
+    settings.APPRISE_ATTACH_CACHE_TTL,
+    settings.APPRISE_ATTACH_CACHE_SIZE,
+)
+
 
 def touchdir(path, mode=0o770, **kwargs):
     """
@@ -289,164 +820,441 @@ def touch(fname, mode=0o666, dir_fd=None, **kwargs):
     return True
 
 
-def parse_attachments(attachment_payload, files_request):
+def fsync_directory(path):
     """
-    Takes the payload provided in a `/notify` call and extracts the
-    attachments out of it.
-
-    Content is written to a temporary directory until the garbage
-    collection kicks in.
+    Flushes the entries (such as a rename) of a directory to disk; this is
+    not supported by every platform/filesystem
     """
-    attachments = []
+    try:
+        fd = os.open(path, os.O_RDONLY)
 
-    if settings.APPRISE_ATTACH_SIZE <= 0:
-        if not (attachment_payload or files_request):
-            # No further processing required
-            return []
+    except OSError:
+        return False
 
-        # Otherwise we need to raise an error
-        raise ValueError("Attachment support has been disabled")
+    try:
+        os.fsync(fd)
 
-    # Determine how many files we have in the request.FILES
-    file_count = 0
-    if hasattr(files_request, "lists"):
-        file_count = sum(len(v) for _, v in files_request.lists())
-    elif isinstance(files_request, dict):
-        # conservative fallback
-        file_count = len(files_request)
+    except OSError:
+        return False
 
-    # Attachment Count
-    count = (len(attachment_payload) if isinstance(attachment_payload, (set, tuple, list)) else 0) + file_count
+    finally:
+        os.close(fd)
 
-    if isinstance(attachment_payload, dict | str | bytes):
-        # Convert and adjust counter
-        attachment_payload = (attachment_payload,)
-        count += 1
+    return True
 
-    if settings.APPRISE_MAX_ATTACHMENTS > 0 and count > settings.APPRISE_MAX_ATTACHMENTS:
-        raise ValueError(f"There is a maximum of {settings.APPRISE_MAX_ATTACHMENTS} attachments")
 
-    if isinstance(attachment_payload, tuple | list | set):
-        for no, entry in enumerate(attachment_payload, start=1):
-            if isinstance(entry, str | bytes):
-                filename = f"attachment.{no:03d}"
+def sweep_attachments(age=None, now=None):
+    """
+    Removes the attachments (and cached web attachments) left behind in
+    APPRISE_ATTACH_DIR and APPRISE_ATTACH_MEMORY_DIR that are older than age
+    seconds (by default APPRISE_ATTACH_SWEEP_AGE); these belong to requests
+    that are long gone but were never cleaned up (such as when a worker is
+    killed).
 
-            elif isinstance(entry, dict):
-                try:
-                    filename = entry.get("filename", "").strip()
+    Returns the number of files removed.
+    """
+    if age is None:
+        age = settings.APPRISE_ATTACH_SWEEP_AGE
 
-                    # Max filename size is 250
-                    if len(filename) > 250:
-                        raise ValueError(f"The filename associated with attachment {no} is too long")
+    cutoff = (time.time() if now is None else now) - age
 
-                    elif not filename:
-                        filename = f"attachment.{no:03d}"
+    removed = 0
+    for path in (settings.APPRISE_ATTACH_DIR, settings.APPRISE_ATTACH_CACHE_DIR, settings.APPRISE_ATTACH_MEMORY_DIR):
+        if not path:
+            continue
 
-                except AttributeError:
-                    # not a string that was provided
-                    raise ValueError(f"An invalid filename was provided for attachment {no}") from None
+        try:
+            entries = list(os.scandir(path))
 
-            else:
-                # you must pass in a base64 string, or a dict containing our
-                # required parameters
-                raise ValueError(f"An invalid filename was provided for attachment {no}")
+        except OSError:
+            # Nothing to sweep
+            continue
 
-            #
-            # Prepare our Attachment
-            #
-            if isinstance(entry, str):
-                if not entry.strip():
-                    # ignore blank entries; these can come from using the
-                    # api/website and submitting without an element defined.
-                    # There is no need have a bad outcome; just decrement our
-                    # counter and move along
-                    count -= 1
+        for entry in entries:
+            try:
+                if not entry.is_file(follow_symlinks=False) or entry.stat(follow_symlinks=False).st_mtime >= cutoff:
                     continue
 
-                if not re.match(r"^https?://.+", entry[:10], re.I):
-                    # We failed to retrieve the product
-                    raise ValueError(f"Failed to load attachment {no} (not web request): {entry}")
+                os.remove(entry.path)
+                removed += 1
+
+            except OSError:
+                # Already gone (or not ours to remove)
+                continue
+
+    if removed:
+        logger.info("Reclaimed %d orphaned attachment(s) from %s", removed, settings.APPRISE_ATTACH_DIR)
+
+    return removed
+
+
+def is_memory_attachment(size):
+    """
+    Returns True if an attachment of the size provided (in bytes) should be
+    kept in memory (APPRISE_ATTACH_MEMORY_DIR) instead of on disk.
+    """
+    return bool(
+        settings.APPRISE_ATTACH_MEMORY_DIR
+        and settings.APPRISE_ATTACH_MEMORY_SIZE > 0
+        and size is not None
+        and size <= settings.APPRISE_ATTACH_MEMORY_SIZE
+    )
+
+
+def store_attachment(filename, chunks, size=None, **kwargs):
+    """
+    Prepares an Attachment and writes the content returned by chunks() (a
+    callable returning an iterable of bytes) to it.
+
+    Small attachments (identified by size) are kept in memory; should our
+    memory backed storage be full they are written to disk instead.
+    """
+    attachment = Attachment(filename, size=size, **kwargs)
+    try:
+        write_attachment(attachment.path, chunks(), filename)
+
+    except ValueError as e:
+        if not (attachment.in_memory and isinstance(e.__cause__, OSError)):
+            raise
+
+        # Our memory backed storage is most likely full (ENOSPC); spill
+        # over to disk instead
+        attachment.close()
+        attachment = Attachment(filename, **kwargs)
+        write_attachment(attachment.path, chunks(), filename)
+
+    return attachment
+
+
+def write_attachment(path, chunks, filename):
+    """
+    Writes the chunks of an attachment to disk as they arrive; a ValueError
+    is raised as soon as they exceed APPRISE_ATTACH_SIZE (instead of once
+    the entire attachment has been written).
+
+    The number of bytes written is returned.
+    """
+    size = 0
+    try:
+        with open(path, "wb") as f:
+            for chunk in chunks:
+                size += len(chunk)
+                if settings.APPRISE_ATTACH_SIZE > 0 and size > settings.APPRISE_ATTACH_SIZE:
+                    raise ValueError(f"attachment {filename}'s filesize is to large")
+
+                f.write(chunk)
+
+    except OSError as e:
+        raise ValueError(f"Could not write attachment {filename} to disk") from e
+
+    return size
+
+
+def decode_base64(content, chunk_size=65536):
+    """
+    Decodes base64 content a chunk at a time; this spares us from holding
+    the entire decoded attachment in memory.
+
+    Just like base64.b64decode(), characters that are not part of the
+    base64 alphabet (such as line breaks) are ignored.  A binascii.Error is
+    raised if the content is not correctly padded.
+    """
+    # Our chunk size must be a multiple of 4 to decode cleanly
+    chunk_size -= chunk_size % 4
+
+    pending = b""
+    for start in range(0, len(content), chunk_size):
+        block = content[start : start + chunk_size]
+        if isinstance(block, str):
+            block = block.encode("ascii")
+
+        block = pending + BASE64_DISCARD_RE.sub(b"", block)
+
+        # Hold back what can not be decoded until more content arrives
+        usable = len(block) - len(block) % 4
+        pending = block[usable:]
+        if usable:
+            yield base64.b64decode(block[:usable])
+
+    if pending:
+        # Whatever remains is not correctly padded
+        yield base64.b64decode(pending)
+
+
+def link_file(source, path):
+    """
+    Hard-links the source file provided to path (replacing it).
+
+    Returns True if the source was linked, otherwise False is returned and
+    the content must be copied instead.
+    """
+    # Link beside our destination and move it into place; this way our
+    # destination is never missing (another request could otherwise claim
+    # its name)
+    link = f"{path}.link"
+    try:
+        os.link(source, link)
+        os.replace(link, path)
+
+    except OSError:
+        # Most likely on another filesystem (EXDEV) or links are not
+        # supported
+        with suppress(OSError):
+            os.remove(link)
+
+        return False
+
+    return True
+
+
+def link_upload(upload, path):
+    """
+    Uploads Django already spooled to disk (TemporaryUploadedFile) are
+    hard-linked into place instead of being copied.
+
+    Returns True if the upload was linked to the path provided, otherwise
+    False is returned and the content must be written instead.
+    """
+    if not hasattr(upload, "temporary_file_path"):
+        # The upload is held in memory
+        return False
+
+    return link_file(upload.temporary_file_path(), path)
+
+
+def fetch_attachment(no, url, filename, name=None):
+    """
+    Retrieves the web attachment (identified by no) found at the url
+    provided.
+
+    If no name is provided, it is derived from the URL (its ?name= or the
+    basename of its path) and otherwise the filename provided is used.
+    """
+    allowed, addresses = ATTACH_URL_FILTER.check(url)
+    if not allowed:
+        # We are not allowed to use this entry
+        raise ValueError(f"Denied attachment {no} (blocked web request): {url}")
+
+    # apprise's own parse_url() already sanitizes ?name= (strips
+    # directory components and only sets the key when non-empty)
+    _parsed = A_MGR["http"].parse_url(url)
+
+    # ?name= wins when present; otherwise derive from the URL path
+    # basename so .../6dba.jpg doesn't get renamed to attachment.001.
+    # Only fall back to attachment.NNN when no name can be found.
+    if name:
+        _parsed["name"] = name
+
+    elif "name" not in _parsed:
+        _path_name = os.path.basename(_parsed.get("fullpath", "").rstrip("/"))
+        if not _path_name:
+            _parsed["name"] = filename
+
+    attachment = HTTPAttachment(**_parsed)
+
+    # Connect to the very addresses our filter validated (if any)
+    with pinned(_parsed.get("host") or "", addresses if settings.APPRISE_ATTACH_PIN_ADDRESSES else None):
+        validators = {}
+        if ATTACH_CACHE:
+            # We may have already retrieved this attachment
+            cached, validators = ATTACH_CACHE.get(url, attachment)
+            if cached is not None:
+                return cached
+
+        if not attachment:
+            # We failed to retrieve the attachment
+            raise ValueError(f"Failed to retrieve attachment {no}: {url}")
+
+    #
+    # Some Validation
+    #
+    if settings.APPRISE_ATTACH_SIZE > 0 and attachment.size > settings.APPRISE_ATTACH_SIZE:
+        raise ValueError(f"attachment {filename}'s filesize is to large")
+
+    if ATTACH_CACHE:
+        ATTACH_CACHE.put(url, attachment, validators)
+
+    return attachment
+
+
+def _close_fetched(future):
+    """
+    Removes the attachment retrieved by the future provided (if any)
+    """
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def fetch_attachments(fetches):
+    """
+    Retrieves our web attachments at the same time (up to
+    APPRISE_ATTACH_FETCH_CONCURRENCY of them); they must all be retrieved
+    within APPRISE_ATTACH_FETCH_TIMEOUT seconds.
+
+    fetches is a list of callables each returning an attachment; the
+    attachments are returned in the same order.  The first error found (in
+    that order) is raised.
+    """
+    if len(fetches) <= 1:
+        # There is nothing to be gained from a thread
+        return [fetch() for fetch in fetches]
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(len(fetches), settings.APPRISE_ATTACH_FETCH_CONCURRENCY),
+        thread_name_prefix="apprise-attach",
+    )
+    try:
+        # Our attachments are tracked by the scope (see AttachmentScope) of
+        # the request they are retrieved for
+        futures = [executor.submit(contextvars.copy_context().run, fetch) for fetch in fetches]
+        _, pending = wait(futures, timeout=settings.APPRISE_ATTACH_FETCH_TIMEOUT or None)
+        if pending:
+            for future in pending:
+                # Remove what is retrieved after we gave up on it
+                future.add_done_callback(_close_fetched)
+
+            raise ValueError(f"Attachments could not be retrieved within {settings.APPRISE_ATTACH_FETCH_TIMEOUT}s")
+
+        return [future.result() for future in futures]
+
+    finally:
+        # Never wait on (or start) requests we no longer need
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def parse_attachments(attachment_payload, files_request):
+    """
+    Takes the payload provided in a `/notify` call and extracts the
+    attachments out of it.
+
+    Content is written to a temporary directory until the garbage
+    collection kicks in.
+    """
+    attachments = []
+
+    if settings.APPRISE_ATTACH_SIZE <= 0:
+        if not (attachment_payload or files_request):
+            # No further processing required
+            return []
+
+        # Otherwise we need to raise an error
+        raise ValueError("Attachment support has been disabled")
+
+    # Determine how many files we have in the request.FILES
+    file_count = 0
+    if hasattr(files_request, "lists"):
+        file_count = sum(len(v) for _, v in files_request.lists())
+    elif isinstance(files_request, dict):
+        # conservative fallback
+        file_count = len(files_request)
+
+    # Attachment Count
+    count = (len(attachment_payload) if isinstance(attachment_payload, (set, tuple, list)) else 0) + file_count
 
-                if not ATTACH_URL_FILTER.is_allowed(entry):
-                    # We are not allowed to use this entry
-                    raise ValueError(f"Denied attachment {no} (blocked web request): {entry}")
+    if isinstance(attachment_payload, dict | str | bytes):
+        # Convert and adjust counter
+        attachment_payload = (attachment_payload,)
+        count += 1
 
-                # apprise's own parse_url() already sanitizes ?name= (strips
-                # directory components and only sets the key when non-empty)
-                _parsed = A_MGR["http"].parse_url(entry)
+    if settings.APPRISE_MAX_ATTACHMENTS > 0 and count > settings.APPRISE_MAX_ATTACHMENTS:
+        raise ValueError(f"There is a maximum of {settings.APPRISE_MAX_ATTACHMENTS} attachments")
 
-                # ?name= wins when present; otherwise derive from the URL path
-                # basename so .../6dba.jpg doesn't get renamed to attachment.001.
-                # Only fall back to attachment.NNN when no name can be found.
-                if "name" not in _parsed:
-                    _path_name = os.path.basename(_parsed.get("fullpath", "").rstrip("/"))
-                    if not _path_name:
-                        _parsed["name"] = filename
+    if isinstance(attachment_payload, tuple | list | set):
+        # The web requests we need to make (by their index in our attachments)
+        fetches = {}
+
+        for no, entry in enumerate(attachment_payload, start=1):
+            if isinstance(entry, str | bytes):
+                filename = f"attachment.{no:03d}"
+
+            elif isinstance(entry, dict):
+                try:
+                    filename = entry.get("filename", "").strip()
+
+                    # Max filename size is 250
+                    if len(filename) > 250:
+                        raise ValueError(f"The filename associated with attachment {no} is too long")
+
+                    elif not filename:
+                        filename = f"attachment.{no:03d}"
+
+                except AttributeError:
+                    # not a string that was provided
+                    raise ValueError(f"An invalid filename was provided for attachment {no}") from None
+
+            else:
+                # you must pass in a base64 string, or a dict containing our
+                # required parameters
+                raise ValueError(f"An invalid filename was provided for attachment {no}")
+
+            #
+            # Prepare our Attachment
+            #
+            if isinstance(entry, str):
+                if not entry.strip():
+                    # ignore blank entries; these can come from using the
+                    # api/website and submitting without an element defined.
+                    # There is no need have a bad outcome; just decrement our
+                    # counter and move along
+                    count -= 1
+                    continue
+
+                if not re.match(r"^https?://.+", entry[:10], re.I):
+                    # We failed to retrieve the product
+                    raise ValueError(f"Failed to load attachment {no} (not web request): {entry}")
 
-                attachment = HTTPAttachment(**_parsed)
-                if not attachment:
-                    # We failed to retrieve the attachment
-                    raise ValueError(f"Failed to retrieve attachment {no}: {entry}")
+                # Retrieved (along with any other web requests) once all of
+                # our attachments are prepared
+                fetches[len(attachments)] = partial(fetch_attachment, no, entry, filename)
+                attachment = None
 
             else:  # web, base64 or raw
-                attachment = Attachment(filename)
                 try:
-                    with open(attachment.path, "wb") as f:
-                        # Write our content to disk
-                        if isinstance(entry, dict) and AttachmentPayload.BASE64 in entry:
-                            # BASE64
-                            f.write(base64.b64decode(entry[AttachmentPayload.BASE64]))
-
-                        elif isinstance(entry, dict) and AttachmentPayload.URL in entry:
-                            if not ATTACH_URL_FILTER.is_allowed(entry[AttachmentPayload.URL]):
-                                # We are not allowed to use this entry
-                                raise ValueError(
-                                    f"Denied attachment {no} (blocked web request): {entry[AttachmentPayload.URL]}"
-                                )
-
-                            # apprise's own parse_url() already sanitizes
-                            # ?name= (same rules as the string-URL path above).
-                            _parsed = A_MGR["http"].parse_url(entry[AttachmentPayload.URL])
-
-                            # User-provided dict filename overrides all URL
-                            # derived names.  If absent, prefer URL ?name=
-                            # then path basename, then attachment.NNN.
-                            _dict_filename = entry.get("filename", "").strip()
-                            if _dict_filename:
-                                _parsed["name"] = _dict_filename
-                            elif "name" not in _parsed:
-                                _path_name = os.path.basename(_parsed.get("fullpath", "").rstrip("/"))
-                                if not _path_name:
-                                    _parsed["name"] = filename
-
-                            attachment = HTTPAttachment(**_parsed)
-                            if not attachment:
-                                # We failed to retrieve the attachment
-                                raise ValueError(f"Failed to retrieve attachment {no}: {entry}")
-
-                        elif isinstance(entry, bytes):
-                            # RAW
-                            f.write(entry)
-
-                        else:
-                            raise ValueError(f"Invalid filetype was provided for attachment {filename}")
-
-                except binascii.Error:
+                    # Write our content to disk
+                    if isinstance(entry, dict) and AttachmentPayload.BASE64 in entry:
+                        # BASE64 (decoded a chunk at a time); our decoded
+                        # content is at most 3/4 the size of what we were
+                        # given
+                        content = entry[AttachmentPayload.BASE64]
+                        attachment = store_attachment(
+                            filename,
+                            partial(decode_base64, content),
+                            size=len(content) * 3 // 4 if isinstance(content, str | bytes) else None,
+                        )
+
+                    elif isinstance(entry, dict) and AttachmentPayload.URL in entry:
+                        # User-provided dict filename overrides all URL
+                        # derived names.
+                        fetches[len(attachments)] = partial(
+                            fetch_attachment,
+                            no,
+                            entry[AttachmentPayload.URL],
+                            filename,
+                            name=entry.get("filename", "").strip(),
+                        )
+                        attachment = None
+
+                    elif isinstance(entry, bytes):
+                        # RAW
+                        attachment = store_attachment(filename, partial(iter, (entry,)), size=len(entry))
+
+                    else:
+                        raise ValueError(f"Invalid filetype was provided for attachment {filename}")
+
+                except (binascii.Error, UnicodeEncodeError):
                     # The file ws not base64 encoded
                     raise ValueError(f"Invalid filecontent was provided for attachment {filename}") from None
 
                 except OSError:
                     raise ValueError(f"Could not write attachment {filename} to disk") from None
 
-                #
-                # Some Validation
-                #
-                if settings.APPRISE_ATTACH_SIZE > 0 and attachment.size > settings.APPRISE_ATTACH_SIZE:
-                    raise ValueError(f"attachment {filename}'s filesize is to large")
-
             # Add our attachment
             attachments.append(attachment)
 
+        # Retrieve our web requests (at the same time)
+        for index, attachment in zip(fetches, fetch_attachments(list(fetches.values())), strict=True):
+            attachments[index] = attachment
+
     #
     # Now handle the request.FILES
     #
@@ -482,20 +1290,20 @@ def parse_attachments(attachment_payload, files_request):
             # disabling mimetype before Attachment() object allows for guessing of type
             wire_mimetype = None
 
-        attachment = Attachment(filename, mimetype=wire_mimetype)
-        try:
-            with open(attachment.path, "wb") as f:
-                # Write our content to disk
-                f.write(meta.read())
+        # The size of our upload is known up front; there is no need to write
+        # anything if it is already too large
+        if settings.APPRISE_ATTACH_SIZE > 0 and meta.size > settings.APPRISE_ATTACH_SIZE:
+            raise ValueError(f"attachment {filename}'s filesize is to large")
 
-        except OSError:
-            raise ValueError(f"Could not write attachment {filename} to disk") from None
+        if is_memory_attachment(meta.size):
+            # Small enough to be kept in memory
+            attachment = store_attachment(filename, meta.chunks, size=meta.size, mimetype=wire_mimetype)
 
-        #
-        # Some Validation
-        #
-        if settings.APPRISE_ATTACH_SIZE > 0 and attachment.size > settings.APPRISE_ATTACH_SIZE:
-            raise ValueError(f"attachment {filename}'s filesize is to large")
+        else:
+            attachment = Attachment(filename, mimetype=wire_mimetype)
+            if not link_upload(meta, attachment.path):
+                # Write our content to disk (a chunk at a time)
+                write_attachment(attachment.path, meta.chunks(), filename)
 
         # Add our attachment
         attachments.append(attachment)
@@ -525,15 +1333,439 @@ SIMPLE_FILE_EXTENSION_MAPPING = {
 SIMPLE_FILE_EXTENSIONS = (SimpleFileExtension.TEXT, SimpleFileExtension.YAML)
 
 
+class AppriseConfigLRU:
+    """
+    A bounded (Least Recently Used) in-memory cache of decoded configuration
+    content.
+
+    Each entry remembers the stat() signature of the file it was read from so
+    that it can be validated before it is handed back; a configuration that
+    was updated or removed (by any worker) is never returned.
+
+    Entries may also record the generation (see AppriseGenerationTable) of
+    their key at the time they were read; such entries are validated against
+    the current generation instead, sparing a stat() call on every use.
+    Content that was not read from a file (no path) can only be validated
+    this way.
+    """
+
+    def __init__(self, size=128):
+        """
+        Initialize our cache; a size of zero (0) disables it entirely
+        """
+        self.size = max(0, int(size))
+
+        # Our cached entries; ordered from least to most recently used
+        self._entries = OrderedDict()
+
+        # Protect our entries from concurrent (greenlet/thread) access
+        self._lock = threading.Lock()
+
+        # Our cache statistics
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def signature(st):
+        """
+        Returns the signature used to detect a change in the file identified
+        by the provided os.stat_result object
+        """
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def get(self, key, generation=None):
+        """
+        Returns the (path, content, fmt) associated with the key if it is
+        cached and the file it was loaded from has not changed since.
+
+        If a generation is provided, it is compared against the one the entry
+        was cached with (if any) instead of checking the file.
+
+        None is returned if there is no (valid) cache entry.
+        """
+        if not self.size:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is not None:
+            path, signature, cached_generation, content, fmt = entry
+            try:
+                if (
+                    cached_generation == generation
+                    if generation is not None and cached_generation is not None
+                    else signature is not None and self.signature(os.stat(path)) == signature
+                ):
+                    with self._lock:
+                        if key in self._entries:
+                            self._entries.move_to_end(key)
+                        self.hits += 1
+                    return (path, content, fmt)
+
+            except OSError:
+                # The file has since been removed (or is no longer
+                # accessible); we will re-probe for it
+                pass
+
+            # Our entry is stale
+            self.discard(key)
+
+        with self._lock:
+            self.misses += 1
+
+        return None
+
+    def put(self, key, path, st, content, fmt, generation=None):
+        """
+        Caches the content read from the path whose os.stat_result (st) and
+        key generation (if any) were acquired prior to the content being read.
+        """
+        if not self.size or (st is None and generation is None):
+            # There would be no way to validate our entry
+            return
+
+        with self._lock:
+            self._entries[key] = (path, self.signature(st) if st is not None else None, generation, content, fmt)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                # Evict our least recently used entry
+                self._entries.popitem(last=False)
+
+    def discard(self, key):
+        """
+        Removes the key from our cache (if present)
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """
+        Removes all cached entries
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Returns our cache statistics
+        """
+        with self._lock:
+            return {
+                "size": self.size,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class AppriseConfigIndex:
+    """
+    A bounded (Least Recently Used) in-memory index of the format each key
+    is stored in.  This spares us from probing the disk for every format a
+    key could be stored in.
+
+    Each entry records the generation (see AppriseGenerationTable) of its key
+    at the time the disk was probed and is only used while it is current.
+    Keys that are not stored are never recorded; they may be written by a
+    process (such as one on another host) that does not share our
+    generations, and must always be probed for.
+    """
+
+    def __init__(self, size=16384):
+        """
+        Initialize our index; a size of zero (0) disables it entirely
+        """
+        self.size = max(0, int(size))
+
+        # Our indexed (generation, fmt) entries; ordered from least to most
+        # recently used
+        self._entries = OrderedDict()
+
+        # Protect our entries from concurrent (greenlet/thread) access
+        self._lock = threading.Lock()
+
+    def get(self, key, generation):
+        """
+        Returns the format the key is stored in or None if this is not known
+        for the generation provided
+        """
+        if not self.size or generation is None:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != generation:
+                return None
+
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key, generation, fmt):
+        """
+        Records the format the key was found to be stored in; the generation
+        must have been acquired prior to probing the disk
+        """
+        if not self.size or generation is None:
+            return
+
+        with self._lock:
+            self._entries[key] = (generation, fmt)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                # Evict our least recently used entry
+                self._entries.popitem(last=False)
+
+    def discard(self, key):
+        """
+        Removes the key from our index (if present)
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+# The longest (in seconds) we wait for another process to release its lock
+# on a SQLite database, and the longest we sleep between two attempts
+SQLITE_BUSY_TIMEOUT = 5.0
+SQLITE_BUSY_DELAY_MAX = 0.05
+
+
+class AppriseSQLite:
+    """
+    A connection to a SQLite database (in WAL mode) shared by the greenlets
+    and threads of our process; a process (such as a forked worker) never
+    uses the connection of another.
+
+    SQLite never waits on a lock held by another process itself (that wait
+    would block every greenlet of a gevent worker); a locked database is
+    attempted again after a short (cooperative) sleep instead.
+    """
+
+    def __init__(self, path, schema, fsync=False):
+        """
+        Our database is created (using the schema provided) on first use
+
+        fsync identifies whether or not our writes must reach the disk
+        before they are reported successful (see APPRISE_CONFIG_FSYNC).
+        """
+        self.path = path
+        self.schema = schema
+        self.fsync = fsync
+
+        # Our connection (one per process) and the process it belongs to
+        self._conn = None
+        self._pid = None
+
+        # Our connection is shared by our greenlets/threads
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        """
+        Returns our connection to the database (preparing it if required);
+        this must be called while holding our lock
+        """
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+
+        # A connection must never be shared with a forked process; our new
+        # process simply prepares its own
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=0, isolation_level=None, check_same_thread=False)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            # In WAL mode, a NORMAL sync can only lose our most recent writes
+            # (never corrupt the database) should the system crash
+            conn.execute("PRAGMA synchronous={}".format("FULL" if self.fsync else "NORMAL"))
+            conn.execute(self.schema)
+
+        except sqlite3.Error:
+            conn.close()
+            raise
+
+        self._conn = conn
+        self._pid = os.getpid()
+        return conn
+
+    def execute(self, query, params=()):
+        """
+        Executes our query and returns a tuple of (rows, rowcount) where rows
+        is the list of rows it produced and rowcount is the number of rows it
+        modified.  A sqlite3.Error (or an OSError should our directory not be
+        accessible) is raised on failure.
+
+        Our results are gathered while we hold our lock; the cursor of our
+        shared connection must never be consumed outside of it.
+        """
+        deadline = time.monotonic() + SQLITE_BUSY_TIMEOUT
+        delay = 0.001
+        while True:
+            try:
+                with self._lock:
+                    cursor = self._connect().execute(query, params)
+                    try:
+                        return (cursor.fetchall(), cursor.rowcount)
+
+                    finally:
+                        cursor.close()
+
+            except sqlite3.OperationalError as e:
+                if "locked" not in str(e) or time.monotonic() >= deadline:
+                    raise
+
+            # Another process holds a lock on our database; we sleep (without
+            # holding our own lock) so that the rest of our process (every
+            # greenlet of a gevent worker) carries on in the meantime
+            time.sleep(delay)
+            delay = min(delay * 2, SQLITE_BUSY_DELAY_MAX)
+
+    def close(self):
+        """
+        Closes our connection to the database (if open)
+        """
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def keys(self, table, prefix="", offset=0, limit=None):
+        """
+        Returns a (sorted) page of the keys found in the table; only the keys
+        starting with the prefix are considered.  A sqlite3.Error (or an
+        OSError) is raised on failure
+        """
+        query = "SELECT key FROM {}".format(table)
+        params = []
+        if prefix:
+            # Our keys are compared against the bounds of our prefix (which
+            # makes use of our index) instead of using a LIKE (which can not)
+            query += " WHERE key >= ? AND key < ?"
+            params.extend((prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)))
+
+        # A limit of -1 is no limit at all
+        query += " ORDER BY key LIMIT ? OFFSET ?"
+        params.extend((-1 if limit is None else limit, offset))
+
+        rows, _ = self.execute(query, params)
+        return [row[0] for row in rows]
+
+
+class AppriseConfigKeys:
+    """
+    The (sorted) index of the keys we have stored; it is maintained as
+    configuration is written and removed so that keys can be listed in
+    the modes that store them in a way that can not be listed (HASH).
+
+    Our keys are stored as they are (unlike the salted hash they are stored
+    by), so an index is only ever kept when keys must be listed.
+    """
+
+    def __init__(self, path, fsync=False):
+        """
+        Our index is stored in the (SQLite) database identified by path
+        """
+        self.sqlite = AppriseSQLite(
+            path, "CREATE TABLE IF NOT EXISTS keys (key TEXT PRIMARY KEY) WITHOUT ROWID", fsync=fsync
+        )
+
+    def add(self, key):
+        """
+        Adds the key to our index; returns False if we failed to
+        """
+        try:
+            self.sqlite.execute("INSERT OR IGNORE INTO keys (key) VALUES (?)", (key,))
+
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Could not index configuration key in {}: {}".format(self.sqlite.path, str(e)))
+            return False
+
+        return True
+
+    def discard(self, key):
+        """
+        Removes the key from our index; returns False if we failed to
+        """
+        try:
+            self.sqlite.execute("DELETE FROM keys WHERE key = ?", (key,))
+
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Could not remove configuration key from {}: {}".format(self.sqlite.path, str(e)))
+            return False
+
+        return True
+
+    def keys(self, prefix="", offset=0, limit=None):
+        """
+        Returns a (sorted) list of the keys in our index; see
+        AppriseConfigCache.keys()
+        """
+        try:
+            return self.sqlite.keys("keys", prefix=prefix, offset=offset, limit=limit)
+
+        except (sqlite3.Error, OSError) as e:
+            logger.error("Could not list configuration keys in {}: {}".format(self.sqlite.path, str(e)))
+            return []
+
+
+def page_keys(keys, prefix="", offset=0, limit=None):
+    """
+    Returns a page of the (sorted) list of keys provided; only the keys
+    starting with the prefix are considered
+    """
+    # Our keys are sorted; those sharing our prefix are grouped together
+    start = bisect.bisect_left(keys, prefix) if prefix else 0
+    matches = itertools.takewhile(lambda key: key.startswith(prefix), itertools.islice(keys, start, None))
+    return list(itertools.islice(matches, offset, None if limit is None else offset + limit))
+
+
 class AppriseConfigCache:
     """
     Designed to make it easy to store/read contact back from disk in a cache
     type structure that is fast.
+
+    This class is also the interface of our storage engines; put(), get()
+    and clear() take care of our in-memory caching (and of letting our other
+    workers know about a change) while the content itself is handled by
+    _write(), _read() and _remove().  Along with keys() and path(), these are
+    all an engine needs to provide.  Content is written to one file per key
+    here (the hash and simple modes); see AppriseSQLiteConfigCache for
+    another.
     """
 
-    def __init__(self, cache_root, salt="apprise", mode=AppriseStoreMode.HASH):
+    def __init__(
+        self,
+        cache_root,
+        salt="apprise",
+        mode=AppriseStoreMode.HASH,
+        cache_size=0,
+        generation_file=None,
+        codec=AppriseConfigCodec.GZIP,
+        compress_level=9,
+        fsync=False,
+        list_keys=False,
+        index_size=16384,
+    ):
         """
         Works relative to the cache_root
+
+        codec identifies how content is written in HASH mode (see
+        AppriseConfigCodec) and compress_level (0-9) how hard it is
+        compressed; content written with any codec can always be read back.
+
+        fsync identifies whether or not content must reach the disk before a
+        write is reported successful (so that it survives a crash).
+
+        cache_size identifies the number of decoded configurations to keep
+        in memory (see AppriseConfigLRU); zero (0) disables this.
+
+        index_size identifies the number of keys whose format is kept in
+        memory (see AppriseConfigIndex); zero (0) disables this.
+
+        generation_file identifies the generation table (shared with all of
+        the other workers) used to announce configuration changes; see
+        AppriseGenerationTable.
+
+        list_keys identifies whether or not our keys must be listed (see
+        APPRISE_ADMIN); in HASH mode, this keeps an index of them on disk.
         """
         self.root = cache_root
         self.salt = salt.encode()
@@ -542,6 +1774,35 @@ class AppriseConfigCache:
             self.mode = AppriseStoreMode.DISABLED
             logger.error("APPRISE_STATEFUL_MODE {} is not supported; reverted to {}.".format(mode, self.mode))
 
+        self.codec = codec.strip().lower()
+        if self.codec not in CONFIG_CODECS:
+            self.codec = AppriseConfigCodec.GZIP
+            logger.error("APPRISE_CONFIG_CODEC {} is not supported; reverted to {}.".format(codec, self.codec))
+        self.compress_level = min(9, max(0, int(compress_level)))
+        self.fsync = fsync
+
+        # Our in-memory cache of decoded configuration
+        self.lru = AppriseConfigLRU(cache_size)
+
+        # The format each of our keys is stored in
+        self.index = AppriseConfigIndex(index_size)
+
+        # Our cross-worker configuration generations
+        self.generations = AppriseGenerationTable(generation_file if self.mode != AppriseStoreMode.DISABLED else None)
+
+        # Our keys can not be recovered from the (hashed) files they are
+        # stored in; we keep an index of them instead should they need to be
+        # listed
+        self.key_index = (
+            AppriseConfigKeys(os.path.join(self.root, "keys.db"), fsync=self.fsync)
+            if list_keys and self.mode == AppriseStoreMode.HASH
+            else None
+        )
+
+        # The signature of our (SIMPLE mode) directory and the keys found in
+        # it the last time we listed them
+        self._listing = None
+
     def put(self, key, content, fmt):
         """
         Based on the key specified, content is written to disk (compressed)
@@ -558,6 +1819,97 @@ class AppriseConfigCache:
             # Do nothing
             return False
 
+        result = self._write(key, content, fmt)
+        if result and self.key_index is not None:
+            self.key_index.add(key)
+
+        # Our keys must be listed again
+        self._listing = None
+
+        # Drop any content we have cached for this key and let our other
+        # workers know to do the same (even a failed write may have changed
+        # what was stored)
+        self.lru.discard(key)
+        self.index.discard(key)
+        self.generations.bump(key)
+
+        return result
+
+    def get(self, key):
+        """
+        Based on the key specified, content is written to disk (compressed)
+
+        key:     is an alphanumeric string needed to write and read back this
+                 file being written.
+
+        The function returns a tuple of (content, fmt) where the content
+        is the uncompressed content found in the file and fmt is the
+        content representation (of type apprise.ConfigFormat).
+
+        If no data was found, then (None, None) is returned.
+        """
+
+        if self.mode == AppriseStoreMode.DISABLED:
+            # Do nothing
+            return (None, "")
+
+        # There isn't a lot of error handling done here as it is presumed most
+        # of the checking has been done higher up.
+
+        # Files stored in SIMPLE mode may be edited by hand (without our
+        # knowledge); these are always validated against the disk instead
+        generation = self.generations.get(key) if self.mode != AppriseStoreMode.SIMPLE else None
+
+        # Serve our content from memory if it hasn't changed
+        cached = self.lru.get(key, generation=generation)
+        if cached is not None:
+            return cached[1:]
+
+        content, fmt, path, st = self._read(key, generation)
+        if content is not None:
+            # Cache our content for the next time it is requested
+            self.lru.put(key, path, st, content, fmt, generation=generation)
+
+        # return our read content
+        return (content, fmt)
+
+    def clear(self, key, formats=None):
+        """
+        Removes any content associated with the specified key should it
+        exist.
+
+        None is returned if there was nothing to clear
+        True is returned if content was cleared
+        False is returned if an internal error prevented data from being
+              cleared
+        """
+        if self.mode == AppriseStoreMode.DISABLED:
+            # Do nothing
+            return None
+
+        # Drop any content we have cached for this key
+        self.lru.discard(key)
+        self.index.discard(key)
+        self._listing = None
+
+        response = self._remove(key, formats)
+        if response is not None:
+            # Let our other workers know our content changed
+            self.generations.bump(key)
+
+            if self.key_index is not None and (formats is None or self._read(key)[0] is None):
+                # Nothing is stored by our key any longer
+                self.key_index.discard(key)
+
+        return response
+
+    def _write(self, key, content, fmt):
+        """
+        Stores the content (of the format provided) associated with the key;
+        any content of another format is replaced.
+
+        Returns True if the content was stored, otherwise False.
+        """
         # First two characters are reserved for cache level directory writing.
         path, filename = self.path(key)
         try:
@@ -568,154 +1920,155 @@ class AppriseConfigCache:
             logger.error("Could not create directory {}".format(path))
             return False
 
-        # Write our file to a temporary file
-        d, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=path)
-        # Close the file handle provided by mkstemp()
-        # We're reopening it, and it can't be renamed while open on Windows
-        os.close(d)
-
         if self.mode == AppriseStoreMode.HASH:
-            try:
-                with gzip.open(tmp_path, "wb") as f:
-                    # Write our content to disk
-                    f.write(content.encode())
+            # The format our key is currently stored in (if we know it)
+            stored = self.index.get(key, self.generations.get(key))
 
-            except OSError:
-                # Handle failure
-                os.remove(tmp_path)
-                return False
+            if self.codec == AppriseConfigCodec.GZIP:
+                # Written through gzip below
+                content = content.encode()
+
+            elif self.codec == AppriseConfigCodec.ZLIB:
+                compressor = zlib.compressobj(self.compress_level, zlib.DEFLATED, -zlib.MAX_WBITS)
+                content = CONFIG_CODEC_MARKERS[self.codec] + compressor.compress(content.encode()) + compressor.flush()
+
+            else:  # AppriseConfigCodec.NONE
+                content = CONFIG_CODEC_MARKERS[self.codec] + content.encode()
 
         else:  # AppriseStoreMode.SIMPLE
+            # Files may be added or removed by hand; we always tidy
+            stored = None
+
             # Update our file extenion based on our fmt
             fmt = SIMPLE_FILE_EXTENSION_MAPPING[fmt]
-            try:
-                with open(tmp_path, "wb") as f:
-                    # Write our content to disk
-                    f.write(content.encode())
+            content = content.encode()
 
-            except OSError:
-                # Handle failure
-                os.remove(tmp_path)
-                return False
-
-        # If we reach here we successfully wrote the content. We now safely
-        # move our configuration into place. The following writes our content
-        # to disk
-        shutil.move(tmp_path, os.path.join(path, "{}.{}".format(filename, fmt)))
-
-        # perform tidy of any other lingering files of other type in case
-        # configuration changed from TEXT -> YAML or YAML -> TEXT
-        if self.mode == AppriseStoreMode.HASH:
-            if self.clear(key, set(apprise.CONFIG_FORMATS) - {fmt}) is False:
-                # We couldn't remove an existing entry; clear what we just
-                # created
-                self.clear(key, {fmt})
-                # fail
-                return False
+        # Write our content to a temporary file (through the descriptor
+        # mkstemp() provides us) so that it is never seen half written
+        try:
+            d, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=path)
 
-        elif self.clear(key, set(SIMPLE_FILE_EXTENSIONS) - {fmt}) is False:
-            # We couldn't remove an existing entry; clear what we just
-            # created
-            self.clear(key, {fmt})
-            # fail
+        except OSError:
+            logger.error("Could not create a temporary file in {}".format(path))
             return False
 
-        return True
+        try:
+            with os.fdopen(d, "wb") as f:
+                if self.mode == AppriseStoreMode.HASH and self.codec == AppriseConfigCodec.GZIP:
+                    with gzip.open(f, "wb", compresslevel=self.compress_level) as gz:
+                        # Write our content to disk
+                        gz.write(content)
 
-    def get(self, key):
-        """
-        Based on the key specified, content is written to disk (compressed)
+                else:
+                    # Write our content to disk
+                    f.write(content)
 
-        key:     is an alphanumeric string needed to write and read back this
-                 file being written.
+                if self.fsync:
+                    # Our content must reach the disk before it is put in
+                    # place
+                    f.flush()
+                    os.fsync(f.fileno())
 
-        The function returns a tuple of (content, fmt) where the content
-        is the uncompressed content found in the file and fmt is the
-        content representation (of type apprise.ConfigFormat).
+            # If we reach here we successfully wrote the content. We now
+            # atomically move our configuration into place.
+            os.replace(tmp_path, os.path.join(path, "{}.{}".format(filename, fmt)))
 
-        If no data was found, then (None, None) is returned.
-        """
+        except OSError:
+            # Handle failure
+            with suppress(OSError):
+                os.remove(tmp_path)
 
-        if self.mode == AppriseStoreMode.DISABLED:
-            # Do nothing
-            return (None, "")
+            return False
 
-        # There isn't a lot of error handling done here as it is presumed most
-        # of the checking has been done higher up.
+        # perform tidy of any other lingering files of other type in case
+        # configuration changed from TEXT -> YAML or YAML -> TEXT; there is
+        # nothing to tidy if we know our key was stored in this format
+        if stored != fmt:
+            others = set(apprise.CONFIG_FORMATS if self.mode == AppriseStoreMode.HASH else SIMPLE_FILE_EXTENSIONS) - {
+                fmt
+            }
+            if self._remove(key, others) is False:
+                # We couldn't remove an existing entry; clear what we just
+                # created
+                self._remove(key, {fmt})
+                # fail
+                return False
 
-        # First two characters are reserved for cache level directory writing.
-        path, filename = self.path(key)
+        if self.fsync:
+            # Make our rename (and any removal) durable too
+            fsync_directory(path)
 
-        # prepare our format to return
-        fmt = None
+        return True
 
-        # Test the only possible hashed files we expect to find
-        if self.mode == AppriseStoreMode.HASH:
-            text_file = os.path.join(path, "{}.{}".format(filename, apprise.ConfigFormat.TEXT.value))
-            yaml_file = os.path.join(path, "{}.{}".format(filename, apprise.ConfigFormat.YAML.value))
+    def _read(self, key, generation=None):
+        """
+        Reads the content associated with the key; the generation provided
+        is the one acquired before anything was read (or None).
 
-        else:  # AppriseStoreMode.SIMPLE
-            text_file = os.path.join(path, "{}.{}".format(filename, SimpleFileExtension.TEXT))
-            yaml_file = os.path.join(path, "{}.{}".format(filename, SimpleFileExtension.YAML))
+        Returns a tuple of (content, fmt, path, st) where path and st (an
+        os.stat_result) identify what our content was read from; they are
+        used to validate our content once it is cached (and may be None).
+
+        If no data was found, then (None, "", None, None) is returned and
+        on failure (None, None, None, None) is.
+        """
+        # First two characters are reserved for cache level directory writing.
+        path, filename = self.path(key)
 
-        if os.path.isfile(text_file):
-            fmt = apprise.ConfigFormat.TEXT.value
-            path = text_file
+        # We may already know which format our key is stored in
+        fmt = self.index.get(key, generation)
+        indexed = fmt is not None
+        if fmt is None:
+            # Test the only possible files we expect to find
+            for _fmt in (apprise.ConfigFormat.TEXT.value, apprise.ConfigFormat.YAML.value):
+                if os.path.isfile(self._filepath(path, filename, _fmt)):
+                    fmt = _fmt
+                    break
 
-        elif os.path.isfile(yaml_file):
-            fmt = apprise.ConfigFormat.YAML.value
-            path = yaml_file
+            else:
+                # Not found; we set the fmt to something other than none as
+                # an indication for the upstream handling to know that we
+                # didn't fail on error
+                return (None, "", None, None)
 
-        else:
-            # Not found; we set the fmt to something other than none as
-            # an indication for the upstream handling to know that we didn't
-            # fail on error
-            return (None, "")
+        path = self._filepath(path, filename, fmt)
 
         # Initialize our content
         content = None
-        if self.mode == AppriseStoreMode.HASH:
-            try:
-                with gzip.open(path, "rb") as f:
-                    # Write our content to disk
-                    content = f.read().decode()
+        try:
+            # Acquire our file signature before reading it; should the file
+            # change while we read it, the next lookup simply reloads it.
+            st = os.stat(path)
 
-            except OSError:
-                # all none return means to let upstream know we had a hard
-                # failure
-                return (None, None)
+            if self.mode == AppriseStoreMode.HASH:
+                content = self._decode(path)
 
-        else:  # AppriseStoreMode.SIMPLE
-            try:
+            else:  # AppriseStoreMode.SIMPLE
                 with open(path, "rb") as f:
-                    # Write our content to disk
                     content = f.read().decode()
 
-            except OSError:
-                # all none return means to let upstream know we had a hard
-                # failure
-                return (None, None)
+        except (OSError, ValueError, zlib.error) as e:
+            self.index.discard(key)
+            if indexed and getattr(e, "errno", None) == errno.ENOENT:
+                # Our content was removed without our knowledge (such as by
+                # hand); probe the disk for it instead
+                return self._read(key)
 
-        # return our read content
-        return (content, fmt)
+            # all none return means to let upstream know we had a hard
+            # failure
+            return (None, None, None, None)
 
-    def clear(self, key, formats=None):
-        """
-        Removes any content associated with the specified key should it
-        exist.
+        self.index.put(key, generation, fmt)
+        return (content, fmt, path, st)
 
-        None is returned if there was nothing to clear
-        True is returned if content was cleared
-        False is returned if an internal error prevented data from being
-              cleared
+    def _remove(self, key, formats=None):
+        """
+        Removes the content (of the formats provided, otherwise all of them)
+        associated with the key; see clear() for what is returned.
         """
         # Default our response None
         response = None
 
-        if self.mode == AppriseStoreMode.DISABLED:
-            # Do nothing
-            return response
-
         if formats is None:
             formats = apprise.CONFIG_FORMATS
 
@@ -744,6 +2097,40 @@ class AppriseConfigCache:
 
         return response
 
+    @staticmethod
+    def _decode(path):
+        """
+        Returns the content read from the path written in HASH mode; the
+        codec it was written with is detected from the file itself.
+
+        An OSError, ValueError or zlib.error is raised if the content could
+        not be read.
+        """
+        with open(path, "rb") as f:
+            marker = f.read(len(CONFIG_CODEC_MARKERS[AppriseConfigCodec.ZLIB]))
+            if marker.startswith(GZIP_MAGIC):
+                f.seek(0)
+                with gzip.open(f, "rb") as gz:
+                    return gz.read().decode()
+
+            if marker == CONFIG_CODEC_MARKERS[AppriseConfigCodec.ZLIB]:
+                return zlib.decompress(f.read(), -zlib.MAX_WBITS).decode()
+
+            if marker == CONFIG_CODEC_MARKERS[AppriseConfigCodec.NONE]:
+                return f.read().decode()
+
+        raise ValueError("Unsupported configuration encoding in {}".format(path))
+
+    def _filepath(self, path, filename, fmt):
+        """
+        Returns the file the content of the format (of type
+        apprise.ConfigFormat) provided is stored in
+        """
+        return os.path.join(
+            path,
+            "{}.{}".format(filename, fmt if self.mode == AppriseStoreMode.HASH else SIMPLE_FILE_EXTENSION_MAPPING[fmt]),
+        )
+
     def path(self, key):
         """
         returns the path and filename content should be written to based on the
@@ -757,33 +2144,491 @@ class AppriseConfigCache:
         else:  # AppriseStoreMode.SIMPLE
             return (self.root, key)
 
-    def keys(self):
+    def close(self):
+        """
+        Closes our key index (if open)
+        """
+        if self.key_index is not None:
+            self.key_index.sqlite.close()
+
+    def index_keys(self, keys):
+        """
+        Adds the keys provided (that have configuration stored) to our key
+        index; keys stored (in HASH mode) before our index existed can not
+        be listed until they are.
+
+        Returns the number of keys that were indexed.
+        """
+        if self.key_index is None:
+            return 0
+
+        indexed = 0
+        for key in keys:
+            path, filename = self.path(key)
+            if any(os.path.isfile(self._filepath(path, filename, fmt)) for fmt in apprise.CONFIG_FORMATS):
+                indexed += 1 if self.key_index.add(key) else 0
+
+        return indexed
+
+    def unlisted(self):
+        """
+        Returns the number of configurations stored (in HASH mode) whose key
+        is not found in our key index (and can therefore not be listed)
+        """
+        if self.key_index is None:
+            return 0
+
+        # The (hashed) filenames of the keys we know of
+        indexed = {self.path(key) for key in self.key_index.keys(limit=None)}
+
+        stored = set()
+        try:
+            for entry in os.scandir(self.root):
+                if not entry.is_dir() or len(entry.name) != 2:
+                    continue
+
+                for filename in os.listdir(entry.path):
+                    name, ext = os.path.splitext(filename)
+                    if ext[1:] in apprise.CONFIG_FORMATS:
+                        stored.add((entry.path, name))
+
+        except OSError:
+            return 0
+
+        return len(stored - indexed)
+
+    def keys(self, prefix="", offset=0, limit=None):
         """
-        Returns a list of keys that are currently stored
+        Returns a (sorted) list of keys that are currently stored
+
+        Only the keys starting with the prefix (if specified) are returned;
+        the offset and limit identify the page of them to return.
         """
-        keys = []
+        if self.mode == AppriseStoreMode.HASH:
+            return self.key_index.keys(prefix=prefix, offset=offset, limit=limit) if self.key_index is not None else []
+
         if self.mode != AppriseStoreMode.SIMPLE:
-            return keys
+            return []
 
-        for filename in sorted(os.listdir(self.root)):
-            if filename.startswith("."):
-                continue
-            path = os.path.join(self.root, filename)
-            if os.path.isfile(path):
-                key_name = os.path.splitext(filename)[0]
-                keys.append(key_name)
+        # Files may be added or removed (even by hand) at any time; we only
+        # list them again when our directory changed
+        try:
+            signature = AppriseConfigLRU.signature(os.stat(self.root))
+
+        except OSError:
+            return []
+
+        listing = self._listing
+        if listing is None or listing[0] != signature:
+            keys = []
+            for filename in sorted(os.listdir(self.root)):
+                if filename.startswith(".") or filename.endswith(".tmp"):
+                    # Hidden files and our (in-flight) temporary ones
+                    continue
+                path = os.path.join(self.root, filename)
+                if os.path.isfile(path):
+                    key_name = os.path.splitext(filename)[0]
+                    keys.append(key_name)
+
+            # Our keys (not their filenames) must be sorted to be paged
+            self._listing = listing = (signature, sorted(keys))
+
+        return page_keys(listing[1], prefix=prefix, offset=offset, limit=limit)
+
+
+class AppriseSQLiteConfigCache(AppriseConfigCache):
+    """
+    Stores our configuration in a single SQLite database (in WAL mode)
+    instead of one file per key; lookups remain fast (and the directory
+    small) no matter how many keys are stored, writes are atomic and our
+    keys can be listed cheaply.
+
+    Keys are stored as they are (as they are in the simple mode) while
+    the content is compressed.
+    """
+
+    # The name of our database (found in our cache_root)
+    filename = "config.db"
+
+    def __init__(self, cache_root, salt="apprise", mode=AppriseStoreMode.SQLITE, **kwargs):
+        super().__init__(cache_root, salt=salt, mode=mode, **kwargs)
+
+        # Our database (found in our cache_root)
+        self.db = os.path.join(self.root, self.filename)
+        self.sqlite = AppriseSQLite(
+            self.db,
+            "CREATE TABLE IF NOT EXISTS config ("
+            "key TEXT PRIMARY KEY, format TEXT NOT NULL, content BLOB NOT NULL, updated REAL NOT NULL"
+            ") WITHOUT ROWID",
+            fsync=self.fsync,
+        )
+
+    def _execute(self, query, params=()):
+        """
+        Executes our query and returns a tuple of (rows, rowcount); see
+        AppriseSQLite.execute()
+        """
+        return self.sqlite.execute(query, params)
+
+    def _write(self, key, content, fmt):
+        """
+        Stores the content (of the format provided) associated with the key
+        """
+        try:
+            self._execute(
+                "INSERT INTO config (key, format, content, updated) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET "
+                "format = excluded.format, content = excluded.content, updated = excluded.updated",
+                (key, fmt, zlib.compress(content.encode()), time.time()),
+            )
+
+        except (sqlite3.Error, OSError) as e:
+            logger.error("Could not write configuration to {}: {}".format(self.db, str(e)))
+            return False
+
+        return True
+
+    def _read(self, key, generation=None):
+        """
+        Reads the content associated with the key; see
+        AppriseConfigCache._read()
+        """
+        try:
+            rows, _ = self._execute("SELECT format, content FROM config WHERE key = ?", (key,))
+            if not rows:
+                # Not found
+                return (None, "", None, None)
+
+            row = rows[0]
+
+            # There is no file signature to validate our cached content with;
+            # it can only be validated using our generation table
+            return (zlib.decompress(row[1]).decode(), row[0], None, None)
+
+        except (sqlite3.Error, OSError, zlib.error, UnicodeDecodeError) as e:
+            logger.error("Could not read configuration from {}: {}".format(self.db, str(e)))
+            return (None, None, None, None)
+
+    def _remove(self, key, formats=None):
+        """
+        Removes the content (of the formats provided, otherwise all of them)
+        associated with the key; see clear() for what is returned.
+        """
+        if formats is None:
+            formats = apprise.CONFIG_FORMATS
+
+        formats = list(formats)
+        try:
+            _, count = self._execute(
+                "DELETE FROM config WHERE key = ? AND format IN ({})".format(", ".join("?" * len(formats))),
+                (key, *formats),
+            )
+
+        except (sqlite3.Error, OSError) as e:
+            logger.error("Could not remove configuration from {}: {}".format(self.db, str(e)))
+            return False
+
+        return True if count > 0 else None
+
+    def path(self, key):
+        """
+        returns our database and the key our content is stored by
+        """
+        return (self.db, key)
+
+    def keys(self, prefix="", offset=0, limit=None):
+        """
+        Returns a (sorted) list of keys that are currently stored; see
+        AppriseConfigCache.keys()
+        """
+        if self.mode == AppriseStoreMode.DISABLED:
+            return []
+
+        try:
+            return self.sqlite.keys("config", prefix=prefix, offset=offset, limit=limit)
+
+        except (sqlite3.Error, OSError) as e:
+            logger.error("Could not list configuration in {}: {}".format(self.db, str(e)))
+            return []
+
+    def close(self):
+        """
+        Closes our connection to the database (if open)
+        """
+        super().close()
+        self.sqlite.close()
 
-        return keys
 
+# Our storage engines (by APPRISE_STATEFUL_MODE); the file based modes are
+# handled by AppriseConfigCache itself
+CONFIG_STORES = {
+    AppriseStoreMode.SQLITE: AppriseSQLiteConfigCache,
+}
 
 # Initialize our singleton
-ConfigCache = AppriseConfigCache(
+ConfigCache = CONFIG_STORES.get(settings.APPRISE_STATEFUL_MODE.strip().lower(), AppriseConfigCache)(
     settings.APPRISE_CONFIG_DIR,
     salt=settings.SECRET_KEY,
     mode=settings.APPRISE_STATEFUL_MODE,
+    cache_size=settings.APPRISE_CONFIG_CACHE_SIZE,
+    index_size=settings.APPRISE_CONFIG_INDEX_SIZE,
+    generation_file=settings.APPRISE_CONFIG_GENERATION_FILE,
+    codec=settings.APPRISE_CONFIG_CODEC,
+    compress_level=settings.APPRISE_CONFIG_COMPRESS_LEVEL,
+    fsync=settings.APPRISE_CONFIG_FSYNC,
+    list_keys=settings.APPRISE_ADMIN,
 )
 
 
+class AppriseLogHandler(logging.handlers.QueueHandler):
+    """
+    Hands each log record over to a queue (or appends it to a list) once it
+    has been prepared; a prepared record has its message already rendered.
+    """
+
+    def enqueue(self, record):
+        if isinstance(self.queue, list):
+            self.queue.append(record)
+
+        else:
+            super().enqueue(record)
+
+
+class AppriseLogCapture:
+    """
+    Captures the log records Apprise produces while in use (much like
+    apprise.LogCapture() does).
+
+    Rather than writing each record out as text (only to have it parsed
+    again later), the records are kept as they are; they are handed to the
+    queue provided as soon as they are produced, or otherwise collected in
+    our records list.  See log_entry() for their rendering.
+    """
+
+    def __init__(self, queue=None, level=None, name="apprise"):
+        """
+        Prepare our log capture
+        """
+        self.level = level
+
+        # The logger level to restore once we're done (if adjusted)
+        self.restore_level = None
+
+        # Acquire a pointer to our logger
+        self.logger = logging.getLogger(name)
+
+        # The records we collected (if not using a queue)
+        self.records = []
+
+        # Use the specified level, otherwise take on the already effective
+        # level of our logger
+        self.handler = AppriseLogHandler(self.records if queue is None else queue)
+        self.handler.setLevel(level if level is not None else self.logger.getEffectiveLevel())
+        self.handler.setFormatter(logging.Formatter("%(message)s"))
+
+    def __enter__(self):
+        """
+        Starts capturing
+        """
+        if self.level is not None and self.logger.getEffectiveLevel() > self.level:
+            # Bump our log level up for the duration of our capture
+            self.restore_level = self.logger.getEffectiveLevel()
+            self.logger.setLevel(self.level)
+
+        self.logger.addHandler(self.handler)
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        """
+        Stops capturing
+        """
+        self.logger.removeHandler(self.handler)
+
+        if self.restore_level is not None:
+            # Restore level
+            self.logger.setLevel(self.restore_level)
+            self.restore_level = None
+
+
+# The number of threads the notification being delivered in this context
+# may start (see AppriseServiceTracker); None imposes no limit of our own
+NOTIFY_WORKERS = contextvars.ContextVar("notify_workers", default=None)
+
+
+class AppriseNotifyExecutor(ThreadPoolExecutor):
+    """
+    The thread pool Apprise notifies its services with; no more threads than
+    the notification being delivered allows (see NOTIFY_WORKERS) are ever
+    started.  The work submitted to us inherits our context so that the
+    pools Apprise nests (one per tag chain) are bounded too.
+    """
+
+    def __init__(self, max_workers=None, *args, **kwargs):
+        if max_workers is None:
+            max_workers = NOTIFY_WORKERS.get()
+
+        super().__init__(max_workers, *args, **kwargs)
+
+    def submit(self, fn, /, *args, **kwargs):
+        return super().submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+class AppriseFutures:
+    """
+    Stands in for the concurrent.futures module Apprise dispatches its
+    notifications with; only its thread pool is replaced (by our own).
+    """
+
+    ThreadPoolExecutor = AppriseNotifyExecutor
+
+    def __getattr__(self, name):
+        return getattr(concurrent.futures, name)
+
+
+# Apprise notifies its services using a thread pool of its own; have it use
+# ours instead so that the threads it starts are bounded
+if getattr(apprise.apprise, "cf", None) is not None:
+    apprise.apprise.cf = AppriseFutures()
+
+
+class AppriseServiceTracker:
+    """
+    Wraps the notify() of each of the services an Apprise object would
+    notify (given the tag) to bound the number of them notified at the same
+    time and to record how long each of them took.
+
+    The number of threads the Apprise object starts to notify them with is
+    bounded as well (see AppriseNotifyExecutor); our semaphore still bounds
+    the services notified across the pools it nests.
+    """
+
+    def __init__(self, a_obj, tag=apprise.common.MATCH_ALL_TAG, concurrency=None):
+        """
+        Prepare our tracking
+        """
+        # The services we track (in the order they were found)
+        self.services = []
+
+        # Bound the number of services notified at the same time
+        self.semaphore = threading.BoundedSemaphore(concurrency) if concurrency else None
+
+        if concurrency == 1:
+            # There is no need to prepare threads to notify one service at
+            # a time
+            a_obj.asset.async_mode = False
+
+        elif concurrency:
+            # Never start more threads than we may notify services with
+            a_obj.notify = self.bound(a_obj.notify, concurrency)
+
+        for server in a_obj.find(tag):
+            service = {
+                "service": server.service_name,
+                "url": server.url(privacy=True),
+                "status": "skipped",
+                "attempts": 0,
+                "latency": 0.0,
+            }
+            self.services.append(service)
+            server.notify = self.wrap(server.notify, service)
+
+    @staticmethod
+    def bound(notify, concurrency):
+        """
+        Returns our wrapper of an Apprise object's notify(); the thread pools
+        it prepares start no more than concurrency threads
+        """
+
+        def _notify(*args, **kwargs):
+            token = NOTIFY_WORKERS.set(concurrency)
+            try:
+                return notify(*args, **kwargs)
+
+            finally:
+                NOTIFY_WORKERS.reset(token)
+
+        return _notify
+
+    def wrap(self, notify, service):
+        """
+        Returns our wrapper of a service's notify()
+        """
+
+        def _notify(*args, **kwargs):
+            with self.semaphore or nullcontext():
+                result = False
+                start = time.monotonic()
+                try:
+                    result = notify(*args, **kwargs)
+
+                finally:
+                    elapsed = time.monotonic() - start
+                    service["attempts"] += 1
+                    service["latency"] = round(service["latency"] + elapsed, 4)
+                    service["status"] = "delivered" if result else "failed"
+                    metrics.observe_service(service["service"], result, elapsed)
+
+                return result
+
+        return _notify
+
+
+def log_entry(record, content_type="text/plain"):
+    """
+    Renders a captured log record for the content type specified:
+      - application/json: a [levelname, asctime, message] list
+      - text/html: an <li> fragment (with the message escaped)
+      - anything else: a line of text (using our standard log format)
+    """
+    if content_type == "application/json":
+        return [record.levelname, LOG_FORMATTER.formatTime(record), record.getMessage().rstrip()]
+
+    elif content_type == "text/html":
+        return (
+            f'<li class="log_{record.levelname}">'
+            f'<div class="log_time">{LOG_FORMATTER.formatTime(record)}</div>'
+            f'<div class="log_level">{record.levelname}</div>'
+            f'<div class="log_msg">{escape(record.getMessage())}</div></li>'
+        )
+
+    return LOG_FORMATTER.format(record) + "\n"
+
+
+def service_retry(notification, url):
+    """
+    Return the configured retry count for a rendered notification URL.
+    """
+    retry = getattr(notification, "retry", 0) or 0
+    if retry:
+        return retry
+
+    try:
+        value = parse_qs(urlsplit(url).query).get("retry", [0])[0]
+        return int(value)
+
+    except (TypeError, ValueError):
+        return 0
+
+
+def service_optional(notification, url):
+    """
+    Return whether a rendered notification URL is marked optional.
+    """
+    optional = getattr(notification, "optional", None)
+    if optional is True:
+        return True
+
+    try:
+        values = parse_qs(urlsplit(url).query).get("optional")
+        if values:
+            return str(values[0]).lower() in {"1", "yes", "true", "on"}
+
+    except (TypeError, ValueError):
+        pass
+
+    return bool(optional)
+
+
 def apply_global_filters():
     #
     # Apply Any Global Filters (if identified)
@@ -820,9 +2665,13 @@ def gen_unique_config_id():
     return h.hexdigest()
 
 
-def send_webhook(payload):
+class AppriseWebhook:
     """
-    POST our webhook results
+    The webhook our notification results are posted to (APPRISE_WEBHOOK_URL).
+
+    The URL is parsed and validated once; every delivery then shares the
+    same pooled (keep-alive) session so that our results collector is not
+    made to perform a new TCP/TLS handshake for each of them.
     """
 
     # Prepare HTTP Headers
@@ -831,47 +2680,92 @@ def send_webhook(payload):
         "Content-Type": "application/json",
     }
 
-    try:
-        if not apprise.utils.parse.VALID_URL_RE.match(settings.APPRISE_WEBHOOK_URL).group("schema"):
-            raise AttributeError()
+    def __init__(self, url):
+        """
+        Parse and validate our webhook URL; an invalid URL is reported here
+        (and nothing is ever posted to it)
+        """
+        self.url = url
+
+        # Our parsed URL (None if it is not valid)
+        self.base = None
 
-    except (AttributeError, TypeError):
-        logger.warning("The Apprise Webhook Result URL is not a valid web based URI")
-        return
+        # Our Query String Dictionary; we use this to track arguments
+        # specified that aren't otherwise part of the URLBase class
+        self.params = {}
 
-    # Parse our URL
-    results = apprise.URLBase.parse_url(settings.APPRISE_WEBHOOK_URL)
-    if not results:
-        logger.warning("The Apprise Webhook Result URL is not parseable")
-        return
+        try:
+            if not apprise.utils.parse.VALID_URL_RE.match(url).group("schema"):
+                raise AttributeError()
 
-    if results["schema"] not in ("http", "https"):
-        logger.warning("The Apprise Webhook Result URL is not using the HTTP protocol")
-        return
+        except (AttributeError, TypeError):
+            logger.warning("The Apprise Webhook Result URL is not a valid web based URI")
+            return
 
-    # Load our URL
-    base = apprise.URLBase(**results)
+        # Parse our URL
+        results = apprise.URLBase.parse_url(url)
+        if not results:
+            logger.warning("The Apprise Webhook Result URL is not parseable")
+            return
 
-    # Our Query String Dictionary; we use this to track arguments
-    # specified that aren't otherwise part of this class
-    params = {k: v for k, v in results.get("qsd", {}).items() if k not in base.template_args}
+        if results["schema"] not in ("http", "https"):
+            logger.warning("The Apprise Webhook Result URL is not using the HTTP protocol")
+            return
 
-    try:
-        requests.post(
-            base.request_url,
-            data=dumps(payload),
-            params=params,
-            headers=headers,
-            auth=base.request_auth,
-            verify=base.verify_certificate,
-            timeout=base.request_timeout,
-        )
+        # Load our URL
+        self.base = apprise.URLBase(**results)
+        self.params = {k: v for k, v in results.get("qsd", {}).items() if k not in self.base.template_args}
+
+        # Our connections are kept alive and shared by our deliveries; we
+        # have no use for (nor want to share) cookies between them
+        self.session = requests.Session()
+        self.session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+
+    def __bool__(self):
+        """
+        Returns True if our webhook URL is valid
+        """
+        return self.base is not None
+
+    def send(self, payload):
+        """
+        POST our payload to our webhook
+        """
+        if not self:
+            return
+
+        try:
+            self.session.post(
+                self.base.request_url,
+                data=dumps(payload),
+                params=self.params,
+                headers=self.headers,
+                auth=self.base.request_auth,
+                verify=self.base.verify_certificate,
+                timeout=self.base.request_timeout,
+            )
+
+        except requests.RequestException as e:
+            logger.warning(
+                "A Connection error occurred sending the Apprise Webhook results to %s.", self.base.url(privacy=True)
+            )
+            logger.debug("Socket Exception: %s", str(e))
 
-    except requests.RequestException as e:
-        logger.warning("A Connection error occurred sending the Apprise Webhook results to %s.", base.url(privacy=True))
-        logger.debug("Socket Exception: %s", str(e))
 
-    return
+@lru_cache(maxsize=1)
+def get_webhook(url):
+    """
+    Returns the AppriseWebhook for the url provided; it is prepared the
+    first time it is used (and again should APPRISE_WEBHOOK_URL ever change)
+    """
+    return AppriseWebhook(url)
+
+
+def send_webhook(payload):
+    """
+    POST our webhook results
+    """
+    get_webhook(settings.APPRISE_WEBHOOK_URL).send(payload)
 
 
 def healthcheck(lazy=True):
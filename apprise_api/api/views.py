@@ -20,25 +20,29 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import wraps
 import json
 import logging
+import queue
 import re
-from urllib.parse import parse_qs, urlsplit
+import threading
 
 import apprise
 from django.conf import settings
 from django.core.exceptions import RequestDataTooBig
 from django.core.serializers.json import DjangoJSONEncoder
-from django.http import HttpResponse, JsonResponse
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.middleware.gzip import GZipMiddleware
 from django.shortcuts import render
-from django.utils.decorators import method_decorator
-from django.utils.html import escape
+from django.urls import reverse
+from django.utils.decorators import decorator_from_middleware, method_decorator
 from django.utils.translation import gettext_lazy as _
 from django.views import View
 from django.views.decorators.cache import never_cache
-from django.views.decorators.gzip import gzip_page
 from error.views import Error421View
 
+from . import metrics
 from .forms import (
     AUTO_DETECT_CONFIG_KEYWORD,
     CONFIG_FORMATS,
@@ -47,16 +51,29 @@ from .forms import (
     NotifyByUrlForm,
     NotifyForm,
 )
+from .jobs import AppriseJobStatus, JobQueue
 from .payload_mapper import remap_fields
 from .utils import (
+    KEY_LIST_MODES,
     MIME_IS_JSON,
+    AppriseLogCapture,
+    AppriseServiceTracker,
     AppriseStoreMode,
+    AttachmentScope,
     ConfigCache,
     apply_global_filters,
     healthcheck,
+    is_async_request,
     is_json_response,
+    is_ndjson_response,
+    is_server_timing_request,
+    is_stream_request,
+    log_entry,
+    notify_concurrency,
     parse_attachments,
     send_webhook,
+    service_optional,
+    service_retry,
 )
 
 # Get an instance of a logger
@@ -67,6 +84,78 @@ logger = logging.getLogger("django")
 # multipart/form-data
 MIME_IS_FORM = re.compile(r"(multipart|application)/(x-www-)?form-(data|urlencoded)", re.I)
 
+
+class StreamingGZipMiddleware(GZipMiddleware):
+    """
+    Compresses our responses with the exception of those that are streamed;
+    compressing them would hold their content back until enough of it was
+    produced and defeat the purpose.
+    """
+
+    def process_response(self, request, response):
+        if response.streaming:
+            return response
+
+        return super().process_response(request, response)
+
+
+gzip_page = decorator_from_middleware(StreamingGZipMiddleware)
+
+
+def server_timing(observe=False):
+    """
+    Times the phases of handling a request (made available through
+    request.timer); they are reported back in a Server-Timing header
+    when it was asked for.  If observe is set, the notification phases are
+    also recorded in our metrics.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def _view(request, *args, **kwargs):
+            request.timer = metrics.RequestTimer(kwargs.get("key"), observe=observe)
+            response = view(request, *args, **kwargs)
+            if is_server_timing_request(request) and request.timer.phases:
+                # Streamed responses only report the phases completed before
+                # their content was produced
+                response["Server-Timing"] = request.timer.server_timing()
+
+            return response
+
+        return _view
+
+    return decorator
+
+
+def attachment_scope(view):
+    """
+    Removes the attachments prepared while handling a request as soon as we
+    are done with them; streamed responses hold on to them until all of
+    their content has been produced.
+    """
+
+    @wraps(view)
+    def _view(request, *args, **kwargs):
+        scope = AttachmentScope()
+        try:
+            with scope:
+                response = view(request, *args, **kwargs)
+
+        except BaseException:
+            scope.close()
+            raise
+
+        if response.streaming:
+            response.streaming_content = scope.closing(response.streaming_content)
+
+        else:
+            scope.close()
+
+        return response
+
+    return _view
+
+
 # Tags separated by space, &, or + are and'ed together
 # Tags separated by commas (even commas wrapped in spaces) are "or'ed" together
 # We start with a regular expression used to clean up provided tag expressions.
@@ -148,41 +237,6 @@ def tag_names(tags):
     return {tag_detail(tag)["name"] for tag in tags}
 
 
-def service_retry(notification, url):
-    """
-    Return the configured retry count for a rendered notification URL.
-    """
-    retry = getattr(notification, "retry", 0) or 0
-    if retry:
-        return retry
-
-    try:
-        value = parse_qs(urlsplit(url).query).get("retry", [0])[0]
-        return int(value)
-
-    except (TypeError, ValueError):
-        return 0
-
-
-def service_optional(notification, url):
-    """
-    Return whether a rendered notification URL is marked optional.
-    """
-    optional = getattr(notification, "optional", None)
-    if optional is True:
-        return True
-
-    try:
-        values = parse_qs(urlsplit(url).query).get("optional")
-        if values:
-            return str(values[0]).lower() in {"1", "yes", "true", "on"}
-
-    except (TypeError, ValueError):
-        pass
-
-    return bool(optional)
-
-
 class JSONEncoder(DjangoJSONEncoder):
     """
     A wrapper to the DjangoJSONEncoder to support
@@ -205,9 +259,11 @@ class ResponseCode:
     """
 
     okay = 200
+    accepted = 202
     no_content = 204
     bad_request = 400
     no_access = 403
+    not_found = 404
     method_not_allowed = 405
     method_not_accepted = 406
     expectation_failed = 417
@@ -217,6 +273,603 @@ class ResponseCode:
     internal_server_error = 500
 
 
+def _enqueue_notification(request, job, attach, json_response):
+    """
+    Shared implementation for queuing a notification for asynchronous
+    delivery.
+    """
+    job_id = JobQueue.enqueue(job, attach)
+    if not job_id:
+        logger.error(
+            "NOTIFY - %s - Could not queue notification%s",
+            request.META["REMOTE_ADDR"],
+            "" if not job.get("key") else " using KEY: {}".format(job["key"]),
+        )
+
+        status = ResponseCode.internal_server_error
+        msg = _("The notification could not be queued")
+        return (
+            HttpResponse(msg, status=status, content_type="text/plain")
+            if not json_response
+            else JsonResponse(
+                {
+                    "error": msg,
+                },
+                encoder=JSONEncoder,
+                safe=False,
+                status=status,
+            )
+        )
+
+    if settings.APPRISE_JOB_INLINE:
+        # Deliver our notification in the background
+        JobQueue.dispatch(job_id)
+
+    logger.info(
+        "NOTIFY - %s - Queued Notification(s) as JOB: %s%s",
+        request.META["REMOTE_ADDR"],
+        job_id,
+        "" if not job.get("key") else " using KEY: {}".format(job["key"]),
+    )
+
+    status = ResponseCode.accepted
+    response = (
+        HttpResponse(job_id, status=status, content_type="text/plain")
+        if not json_response
+        else JsonResponse(
+            {
+                "error": None,
+                "id": job_id,
+                "status": AppriseJobStatus.QUEUED,
+            },
+            encoder=JSONEncoder,
+            safe=False,
+            status=status,
+        )
+    )
+
+    # Let our caller know where to find the outcome
+    response["Location"] = reverse("job", kwargs={"job_id": job_id})
+    return response
+
+
+def _stream_notification(request, a_obj, notify_kwargs, level, content_type, timer, services=None, key=None):
+    """
+    Shared implementation for delivering a notification while streaming the
+    logs it produces back to the caller as they are produced.
+
+    Each log entry is sent as a line of JSON (NDJSON), an HTML <li> fragment
+    or a line of text (depending on the content type).  The response has
+    already begun by the time the outcome is known, so a 200 is always
+    returned; a final JSON line reports the outcome of an NDJSON stream
+    while HTML and text streams end with an error entry should a
+    notification fail.
+    """
+    records = queue.Queue()
+    outcome = {"result": False}
+
+    # Our attachments are removed once our stream ends (or the client went
+    # away); they must outlive our delivery either way
+    scope = AttachmentScope.current()
+
+    def deliver():
+        """
+        Delivers our notification (in the background)
+        """
+        try:
+            with timer.phase(metrics.PHASE_DELIVERY), AppriseLogCapture(records, level=level):
+                outcome["result"] = a_obj.notify(**notify_kwargs)
+
+        except Exception:
+            logger.exception(
+                "NOTIFY - %s - Unexpected failure delivering notification(s)%s",
+                request.META["REMOTE_ADDR"],
+                "" if not key else f" using KEY: {key}",
+            )
+
+        finally:
+            metrics.observe_request(key, outcome["result"], notify_kwargs.get("attach"))
+
+            # Signal the end of our stream
+            records.put(None)
+
+            if scope is not None:
+                scope.release()
+
+    def render(record):
+        """
+        Renders a single log record; returns the entry (as it is passed along
+        to our webhook) and the chunk to stream
+        """
+        if content_type == "application/x-ndjson":
+            entry = log_entry(record, "application/json")
+            return entry, json.dumps(entry) + "\n"
+
+        entry = log_entry(record, content_type)
+        return entry, entry
+
+    def stream():
+        """
+        Yields our log entries as they are produced
+        """
+        if scope is not None:
+            scope.hold()
+
+        thread = threading.Thread(target=deliver, daemon=True)
+        thread.start()
+
+        # The content passed along to our webhook (if one is defined)
+        output = []
+
+        if content_type == "text/html":
+            yield '<ul class="logs">'
+
+        while (record := records.get()) is not None:
+            entry, chunk = render(record)
+            if settings.APPRISE_WEBHOOK_URL:
+                output.append(entry)
+
+            yield chunk
+
+        thread.join()
+        result = outcome["result"]
+        msg = _("One or more notification could not be sent")
+
+        if content_type == "application/x-ndjson":
+            # Our outcome
+            yield json.dumps({"error": None if result else str(msg), "services": services or []}) + "\n"
+
+        elif not result:
+            record = logging.makeLogRecord({"levelno": logging.ERROR, "levelname": "ERROR", "msg": str(msg)})
+            yield render(record)[1]
+
+        if content_type == "text/html":
+            yield "</ul>"
+
+        if settings.APPRISE_WEBHOOK_URL:
+            webhook_payload = {
+                "source": request.META["REMOTE_ADDR"],
+                "status": 0 if result else 1,
+                "output": output if content_type == "application/x-ndjson" else "".join(output),
+            }
+
+            # Send our webhook (pass or fail)
+            send_webhook(webhook_payload)
+
+        if not result:
+            logger.warning(
+                "NOTIFY - %s - One or more notifications not sent%s",
+                request.META["REMOTE_ADDR"],
+                "" if not key else f" using KEY: {key}",
+            )
+
+        else:
+            logger.info(
+                "NOTIFY - %s - Delivered Notification(s)%s",
+                request.META["REMOTE_ADDR"],
+                "" if not key else f" using KEY: {key}",
+            )
+
+    response = StreamingHttpResponse(stream(), content_type=content_type, status=ResponseCode.okay)
+
+    # Ask any proxy in front of us not to buffer our response
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+def _batch_message(message, tag):
+    """
+    Validates a single message of a batch and returns a tuple of the keyword
+    arguments to notify with and the error message (if the message could not
+    be accepted).
+    """
+    if not isinstance(message, dict):
+        return None, _("Payload lacks minimum requirements")
+
+    attachment = next(
+        (message[k] for k in ("attach", "attachment", "attachments") if message.get(k)),
+        None,
+    )
+
+    _tag = message.get("tag") if message.get("tag") else message.get("tags")
+    if _tag:
+        if isinstance(_tag, str):
+            try:
+                tag = parse_tag_expression(_tag)
+
+            except ValueError:
+                return None, _("Unsupported characters found in tag definition")
+
+        elif isinstance(_tag, list | set | tuple):
+            tag = _tag
+
+        else:  # Could be int, float or some other unsupported type
+            return None, _("Unsupported characters found in tag definition")
+
+    notify_type = message.get("type", apprise.NotifyType.INFO.value)
+    if (not message.get("body") and not attachment) or notify_type not in apprise.NOTIFY_TYPES:
+        return None, _("Payload lacks minimum requirements")
+
+    body_format = message.get("format", apprise.NotifyFormat.TEXT.value)
+    if body_format and body_format not in apprise.NOTIFY_FORMATS:
+        return None, _("An invalid body input format was specified")
+
+    # Our attachments are only prepared once the rest of our message has
+    # been accepted
+    attach = None
+    if attachment:
+        try:
+            attach = parse_attachments(attachment, {})
+
+        except (TypeError, ValueError):
+            return None, _("Bad Attachment")
+
+    return {
+        "body": message.get("body"),
+        "title": message.get("title", ""),
+        "notify_type": notify_type,
+        "body_format": body_format or None,
+        "tag": tag,
+        "attach": attach,
+    }, None
+
+
+def _notify_batch(request, key=None):
+    """
+    Shared implementation for sending a batch of notifications.
+
+    Used by both POST /notify/<key>/batch and POST /batch.  The
+    configuration (or URLs) are loaded and parsed once for the entire batch
+    and its messages are delivered concurrently (up to the limit set by
+    APPRISE_BATCH_CONCURRENCY).
+
+    The outcome of each message is returned in a single JSON document, or
+    streamed (one line per message as it completes) if NDJSON was requested.
+    """
+    # Detect the format our response should be in; batches are always
+    # answered in JSON
+    ndjson_response = is_ndjson_response(request)
+
+    # Used to identify our key in our logs
+    using_key = "" if key is None else f" using KEY: {key}"
+
+    try:
+        # load our JSON content
+        content = json.loads(request.body.decode("utf-8"))
+
+    except RequestDataTooBig:
+        # APPRISE_UPLOAD_MAX_MEMORY_SIZE exceeded its value
+        logger.warning(
+            "NOTIFY - %s - JSON Payload Exceeded %dMB%s",
+            request.META["REMOTE_ADDR"],
+            (settings.APPRISE_UPLOAD_MAX_MEMORY_SIZE / 1048576),
+            using_key,
+        )
+
+        return JsonResponse(
+            {"error": _("JSON Payload provided is to large")},
+            encoder=JSONEncoder,
+            safe=False,
+            status=ResponseCode.fields_too_large,
+        )
+
+    except (AttributeError, ValueError):
+        # could not parse JSON response...
+        logger.warning(
+            "NOTIFY - %s - Invalid JSON Payload provided%s",
+            request.META["REMOTE_ADDR"],
+            using_key,
+        )
+
+        return JsonResponse(
+            {"error": _("Invalid JSON Payload provided")},
+            encoder=JSONEncoder,
+            safe=False,
+            status=ResponseCode.bad_request,
+        )
+
+    if isinstance(content, list):
+        # A list of messages was provided on its own
+        content = {"messages": content}
+
+    messages = content.get("messages") if isinstance(content, dict) else None
+    if not messages or not isinstance(messages, list):
+        logger.warning(
+            "NOTIFY - %s - Batch payload lacks minimum requirements%s",
+            request.META["REMOTE_ADDR"],
+            using_key,
+        )
+
+        return JsonResponse(
+            {"error": _("Payload lacks minimum requirements")},
+            encoder=JSONEncoder,
+            safe=False,
+            status=ResponseCode.bad_request,
+        )
+
+    if len(messages) > settings.APPRISE_BATCH_MAX:
+        logger.warning(
+            "NOTIFY - %s - Batch of %d messages exceeds the limit of %d%s",
+            request.META["REMOTE_ADDR"],
+            len(messages),
+            settings.APPRISE_BATCH_MAX,
+            using_key,
+        )
+
+        return JsonResponse(
+            {"error": _("Too many messages were provided in a single batch")},
+            encoder=JSONEncoder,
+            safe=False,
+            status=ResponseCode.bad_request,
+        )
+
+    # Prepare our keyword arguments (to be passed into an AppriseAsset object)
+    kwargs = {
+        # Load our dynamic plugin path
+        "plugin_paths": settings.APPRISE_PLUGIN_PATHS,
+        # Emoji configuration (values are None, True, or False)
+        "interpret_emojis": settings.APPRISE_INTERPRET_EMOJIS,
+        # HTTP redirect behaviour (values are None, True, or False)
+        "http_redirects": settings.APPRISE_HTTP_REDIRECTS,
+    }
+    if key is not None or settings.APPRISE_STATELESS_STORAGE:
+        kwargs.update(
+            {
+                # Load our persistent storage path
+                "storage_path": settings.APPRISE_STORAGE_DIR,
+                # Our storage URL ID Length
+                "storage_idlen": settings.APPRISE_STORAGE_UID_LENGTH,
+                # Define if we flush to disk as soon as possible or not when required
+                "storage_mode": settings.APPRISE_STORAGE_MODE,
+            }
+        )
+
+    # Acquire our recursion count (if defined)
+    recursion = request.headers.get("X-Apprise-Recursion-Count", 0)
+    try:
+        recursion = int(recursion)
+
+        if recursion < 0:
+            # We do not accept negative numbers
+            raise TypeError("Invalid Recursion Value")
+
+    except (TypeError, ValueError):
+        logger.warning(
+            "NOTIFY - %s - Invalid recursion value (%s) provided",
+            request.META["REMOTE_ADDR"],
+            str(recursion),
+        )
+
+        return JsonResponse(
+            {"error": _("An invalid recursion value was specified")},
+            encoder=JSONEncoder,
+            safe=False,
+            status=ResponseCode.bad_request,
+        )
+
+    if recursion > settings.APPRISE_RECURSION_MAX:
+        logger.warning(
+            "NOTIFY - %s - Recursion limit reached (%d > %d)",
+            request.META["REMOTE_ADDR"],
+            recursion,
+            settings.APPRISE_RECURSION_MAX,
+        )
+
+        return JsonResponse(
+            {"error": _("The recursion limit has been reached")},
+            encoder=JSONEncoder,
+            safe=False,
+            status=ResponseCode.method_not_accepted,
+        )
+
+    # Store our recursion value for our AppriseAsset() initialization
+    kwargs["_recursion"] = recursion
+
+    # Acquire our unique identifier (if defined)
+    uid = request.headers.get("X-Apprise-ID", "").strip()
+    if uid:
+        kwargs["_uid"] = uid
+
+    # Acquire the number of services we may notify at the same time
+    try:
+        concurrency = notify_concurrency(request)
+
+    except (TypeError, ValueError):
+        logger.warning(
+            "NOTIFY - %s - Invalid concurrency value (%s) provided",
+            request.META["REMOTE_ADDR"],
+            request.headers.get("X-Apprise-Concurrency", "")[:12],
+        )
+
+        return JsonResponse(
+            {"error": _("An invalid concurrency value was specified")},
+            encoder=JSONEncoder,
+            safe=False,
+            status=ResponseCode.bad_request,
+        )
+
+    timer = request.timer
+    if key is not None:
+        with timer.phase(metrics.PHASE_CONFIG_LOAD):
+            config, format = ConfigCache.get(key)
+
+        if config is None:
+            if format is not None:
+                # no content to return
+                logger.debug(
+                    "NOTIFY - %s - Empty configuration found using KEY: %s",
+                    request.META["REMOTE_ADDR"],
+                    key,
+                )
+
+                return JsonResponse(
+                    {"error": _("There was no configuration found")},
+                    encoder=JSONEncoder,
+                    safe=False,
+                    status=ResponseCode.no_content,
+                )
+
+            logger.error(
+                "NOTIFY - %s - I/O error accessing configuration using KEY: %s",
+                request.META["REMOTE_ADDR"],
+                key,
+            )
+
+            # Something went very wrong; return 500
+            return JsonResponse(
+                {"error": _("An error occurred accessing configuration")},
+                encoder=JSONEncoder,
+                safe=False,
+                status=ResponseCode.internal_server_error,
+            )
+
+    #
+    # Apply Any Global Filters (if identified)
+    #
+    apply_global_filters()
+
+    # Prepare ourselves a default Asset
+    asset = apprise.AppriseAsset(**kwargs)
+
+    # Prepare our apprise object
+    a_obj = apprise.Apprise(asset=asset)
+
+    if key is None:
+        # Add URLs (fall back to settings.APPRISE_STATELESS_URLS if no urls
+        # were defined)
+        a_obj.add(content.get("urls") or settings.APPRISE_STATELESS_URLS)
+        if not len(a_obj):
+            logger.warning(
+                "NOTIFY - %s - No valid URLs provided",
+                request.META["REMOTE_ADDR"],
+            )
+
+            return JsonResponse(
+                {"error": _("There was no valid URLs provided to notify")},
+                encoder=JSONEncoder,
+                safe=False,
+                status=ResponseCode.no_content,
+            )
+
+    else:
+        # Create an apprise config object and load our configuration
+        ac_obj = apprise.AppriseConfig(asset=asset, recursion=settings.APPRISE_RECURSION_MAX)
+        ac_obj.add_config(config, format=format)
+        a_obj.add(ac_obj)
+
+    # Every message of our batch shares the same services; bound the number
+    # of them notified at the same time (across the whole batch) and track
+    # how long each of them takes; our configuration is parsed as our
+    # services are looked up
+    with timer.phase(metrics.PHASE_PARSE):
+        tracker = AppriseServiceTracker(a_obj, tag=apprise.common.MATCH_ALL_TAG, concurrency=concurrency)
+
+    # Validate each of our messages; those that can not be accepted are
+    # reported on, but never prevent the rest of the batch from being sent
+    with timer.phase(metrics.PHASE_ATTACHMENTS):
+        prepared = [_batch_message(message, None if key is not None else "all") for message in messages]
+
+    def deliver(index, notify_kwargs):
+        """
+        Delivers a single message of our batch
+        """
+        result = False
+        try:
+            result = a_obj.notify(**notify_kwargs)
+
+        except Exception:
+            logger.exception(
+                "NOTIFY - %s - Unexpected failure delivering batch message %d%s",
+                request.META["REMOTE_ADDR"],
+                index,
+                using_key,
+            )
+
+        finally:
+            metrics.observe_request(key, result, notify_kwargs.get("attach"))
+
+        return {
+            "index": index,
+            "status": ResponseCode.okay if result else ResponseCode.failed_dependency,
+            "error": None if result else str(_("One or more notification could not be sent")),
+        }
+
+    def results():
+        """
+        Yields the outcome of each message of our batch as it completes
+        """
+        outcome = []
+        for index, (_kwargs, error) in enumerate(prepared):
+            if error:
+                outcome.append({"index": index, "status": ResponseCode.bad_request, "error": str(error)})
+                yield outcome[-1]
+
+        pending = [(index, _kwargs) for index, (_kwargs, error) in enumerate(prepared) if not error]
+        if pending:
+            with (
+                timer.phase(metrics.PHASE_DELIVERY),
+                ThreadPoolExecutor(max_workers=min(settings.APPRISE_BATCH_CONCURRENCY, len(pending))) as executor,
+            ):
+                for future in as_completed([executor.submit(deliver, *entry) for entry in pending]):
+                    outcome.append(future.result())
+                    yield outcome[-1]
+
+        outcome.sort(key=lambda entry: entry["index"])
+        delivered = sum(1 for entry in outcome if entry["status"] == ResponseCode.okay)
+
+        if settings.APPRISE_WEBHOOK_URL:
+            webhook_payload = {
+                "source": request.META["REMOTE_ADDR"],
+                "status": 0 if delivered == len(outcome) else 1,
+                "output": outcome,
+            }
+
+            # Send our webhook (pass or fail)
+            send_webhook(webhook_payload)
+
+        logger.info(
+            "NOTIFY - %s - Delivered %d of %d batch message(s)%s",
+            request.META["REMOTE_ADDR"],
+            delivered,
+            len(outcome),
+            using_key,
+        )
+
+    if ndjson_response:
+        # Stream the outcome of each message as soon as it is known
+        return StreamingHttpResponse(
+            (json.dumps(entry, cls=JSONEncoder) + "\n" for entry in results()),
+            content_type="application/x-ndjson",
+            status=ResponseCode.okay,
+        )
+
+    outcome = sorted(results(), key=lambda entry: entry["index"])
+    if any(entry["status"] != ResponseCode.okay for entry in outcome):
+        # If at least one message couldn't be sent; change up the response
+        # to a 424 error code
+        return JsonResponse(
+            {
+                "error": _("One or more notification could not be sent"),
+                "results": outcome,
+                "services": tracker.services,
+            },
+            encoder=JSONEncoder,
+            safe=False,
+            status=ResponseCode.failed_dependency,
+        )
+
+    return JsonResponse(
+        {
+            "error": None,
+            "results": outcome,
+            "services": tracker.services,
+        },
+        encoder=JSONEncoder,
+        safe=False,
+        status=ResponseCode.okay,
+    )
+
+
 def _get_config_response(request, key):
     """
     Shared implementation for returning stored configuration for a key.
@@ -516,7 +1169,7 @@ class ConfigListView(View):
             # ever - this only restores JSON access, not who may use it).
             return Error421View.as_view()(request)
 
-        if not (settings.APPRISE_ADMIN and settings.APPRISE_STATEFUL_MODE == AppriseStoreMode.SIMPLE):
+        if not (settings.APPRISE_ADMIN and settings.APPRISE_STATEFUL_MODE in KEY_LIST_MODES):
             msg = _("The site has been configured to deny this request")
             status = ResponseCode.no_access
             return (
@@ -532,19 +1185,53 @@ class ConfigListView(View):
                 )
             )
 
+        # Our keys may be searched (by prefix) and paged through
+        prefix = request.GET.get("prefix", "").strip()
+        try:
+            offset = int(request.GET.get("offset", 0))
+            limit = int(request.GET["limit"]) if request.GET.get("limit") else settings.APPRISE_ADMIN_PAGE_SIZE
+            if offset < 0 or limit < 1:
+                raise ValueError()
+
+        except ValueError:
+            msg = _("An invalid offset and/or limit was specified")
+            status = ResponseCode.bad_request
+            return (
+                HttpResponse(msg, status=status, content_type="text/plain")
+                if not json_response
+                else JsonResponse(
+                    {
+                        "error": msg,
+                    },
+                    encoder=JSONEncoder,
+                    safe=False,
+                    status=status,
+                )
+            )
+
+        # Acquire one more key than requested so we know if there are more
+        keys = ConfigCache.keys(prefix=prefix, offset=offset, limit=limit + 1)
+        more = len(keys) > limit
+        if more:
+            keys = keys[:limit]
+
         status = ResponseCode.okay
         return (
             render(
                 request,
                 self.template_name,
                 {
-                    "keys": ConfigCache.keys(),
+                    "keys": keys,
+                    "prefix": prefix,
+                    "limit": limit,
+                    "prev_offset": max(0, offset - limit) if offset else None,
+                    "next_offset": offset + limit if more else None,
                 },
                 status=status,
             )
             if not json_response
             else JsonResponse(
-                ConfigCache.keys(),
+                keys,
                 encoder=JSONEncoder,
                 safe=False,
                 status=status,
@@ -552,7 +1239,7 @@ class ConfigListView(View):
         )
 
 
-@method_decorator(never_cache, name="dispatch")
+@method_decorator((never_cache, server_timing()), name="dispatch")
 class AddView(View):
     """
     A Django view used to store Apprise configuration
@@ -598,19 +1285,21 @@ class AddView(View):
         content = {}
         if not json_payload:
             content = {}
-            form = AddByConfigForm(request.POST)
-            if form.is_valid():
-                content.update(form.cleaned_data)
+            with request.timer.phase(metrics.PHASE_BODY):
+                form = AddByConfigForm(request.POST)
+                if form.is_valid():
+                    content.update(form.cleaned_data)
 
-            form = AddByUrlForm(request.POST)
-            if form.is_valid():
-                content.update(form.cleaned_data)
+                form = AddByUrlForm(request.POST)
+                if form.is_valid():
+                    content.update(form.cleaned_data)
 
         else:  # JSON Payload
             # Prepare our default response
             try:
                 # load our JSON content
-                content = json.loads(request.body.decode("utf-8"))
+                with request.timer.phase(metrics.PHASE_BODY):
+                    content = json.loads(request.body.decode("utf-8"))
 
             except RequestDataTooBig:
                 # APPRISE_UPLOAD_MAX_MEMORY_SIZE exceeded its value; this is usually
@@ -688,7 +1377,9 @@ class AddView(View):
         a_obj = apprise.Apprise()
         if "urls" in content:
             # Load our content
-            a_obj.add(content["urls"])
+            with request.timer.phase(metrics.PHASE_PARSE):
+                a_obj.add(content["urls"])
+
             if not len(a_obj):
                 # No URLs were loaded
                 logger.warning(
@@ -712,11 +1403,14 @@ class AddView(View):
                     )
                 )
 
-            if not ConfigCache.put(
-                key,
-                "\r\n".join([s.url() for s in a_obj]),
-                apprise.ConfigFormat.TEXT.value,
-            ):
+            with request.timer.phase(metrics.PHASE_CONFIG_SAVE):
+                saved = ConfigCache.put(
+                    key,
+                    "\r\n".join([s.url() for s in a_obj]),
+                    apprise.ConfigFormat.TEXT.value,
+                )
+
+            if not saved:
                 logger.warning(
                     "ADD - %s - configuration could not be saved using KEY: %s",
                     request.META["REMOTE_ADDR"],
@@ -794,7 +1488,10 @@ class AddView(View):
                 fmt = None
 
             # Load our configuration
-            if not ac_obj.add_config(content["config"], format=fmt):
+            with request.timer.phase(metrics.PHASE_PARSE):
+                loaded = ac_obj.add_config(content["config"], format=fmt)
+
+            if not loaded:
                 # The format could not be detected
                 logger.warning(
                     "ADD - %s - The configuration format could not be auto-detected using KEY: %s",
@@ -816,10 +1513,12 @@ class AddView(View):
                     )
                 )
 
-            # Add our configuration
-            a_obj.add(ac_obj)
+            # Add our configuration (it is parsed as it is counted)
+            with request.timer.phase(metrics.PHASE_PARSE):
+                a_obj.add(ac_obj)
+                loaded = len(a_obj)
 
-            if not len(a_obj):
+            if not loaded:
                 # No specified URL(s) were loaded due to
                 # mis-configuration on the caller's part
                 logger.warning(
@@ -842,7 +1541,10 @@ class AddView(View):
                     )
                 )
 
-            if not ConfigCache.put(key, content["config"], fmt=ac_obj[0].config_format.value):
+            with request.timer.phase(metrics.PHASE_CONFIG_SAVE):
+                saved = ConfigCache.put(key, content["config"], fmt=ac_obj[0].config_format.value)
+
+            if not saved:
                 # Something went very wrong; return 500
                 logger.error(
                     "ADD - %s - Configuration could not be saved using KEY: %s",
@@ -1028,7 +1730,7 @@ class GetView(View):
         return _get_config_response(request, key)
 
 
-@method_decorator((gzip_page, never_cache), name="dispatch")
+@method_decorator((gzip_page, never_cache, server_timing(observe=True), attachment_scope), name="dispatch")
 class NotifyView(View):
     """
     A Django view for sending a notification in a stateful manner
@@ -1058,7 +1760,10 @@ class NotifyView(View):
             if rules:
                 # Create a copy
                 data = request.POST.copy()
-                if not remap_fields(rules, data):
+                with request.timer.phase(metrics.PHASE_REMAP):
+                    mapped = remap_fields(rules, data)
+
+                if not mapped:
                     status = ResponseCode.bad_request
                     msg = _("Payload field mapping failed using KEY: {}").format(key)
                     return (
@@ -1078,18 +1783,23 @@ class NotifyView(View):
                 # Just create a pointer
                 data = request.POST
 
-            form = NotifyForm(data=data, files=request.FILES)
-            if form.is_valid():
-                content.update(form.cleaned_data)
+            with request.timer.phase(metrics.PHASE_BODY):
+                form = NotifyForm(data=data, files=request.FILES)
+                if form.is_valid():
+                    content.update(form.cleaned_data)
 
         else:  # JSON Payload
             # Prepare our default response
             try:
                 # load our JSON content
-                content = json.loads(request.body.decode("utf-8"))
+                with request.timer.phase(metrics.PHASE_BODY):
+                    content = json.loads(request.body.decode("utf-8"))
 
                 # Apply content rules
-                if rules and not remap_fields(rules, content):
+                with request.timer.phase(metrics.PHASE_REMAP):
+                    mapped = not rules or remap_fields(rules, content)
+
+                if not mapped:
                     status = ResponseCode.bad_request
                     msg = _("Payload field mapping failed using KEY: {}").format(key)
                     return (
@@ -1204,7 +1914,8 @@ class NotifyView(View):
 
         if "attachment" in content or request.FILES:
             try:
-                attach = parse_attachments(content.get("attachment"), request.FILES)
+                with request.timer.phase(metrics.PHASE_ATTACHMENTS):
+                    attach = parse_attachments(content.get("attachment"), request.FILES)
 
             except (TypeError, ValueError) as e:
                 # Invalid entry found in list
@@ -1381,7 +2092,9 @@ class NotifyView(View):
 
         # If we get here, we have enough information to generate a notification
         # with.
-        config, format = ConfigCache.get(key)
+        timer = request.timer
+        with timer.phase(metrics.PHASE_CONFIG_LOAD):
+            config, format = ConfigCache.get(key)
         if config is None:
             # The returned value of config and format tell a rather cryptic
             # story; this portion could probably be updated in the future.
@@ -1516,6 +2229,32 @@ class NotifyView(View):
         if uid:
             kwargs["_uid"] = uid
 
+        # Acquire the number of services we may notify at the same time
+        try:
+            concurrency = notify_concurrency(request)
+
+        except (TypeError, ValueError):
+            logger.warning(
+                "NOTIFY - %s - Invalid concurrency value (%s) provided",
+                request.META["REMOTE_ADDR"],
+                request.headers.get("X-Apprise-Concurrency", "")[:12],
+            )
+
+            status = ResponseCode.bad_request
+            msg = _("An invalid concurrency value was specified")
+            return (
+                HttpResponse(msg, status=status, content_type="text/plain")
+                if not json_response
+                else JsonResponse(
+                    {
+                        "error": msg,
+                    },
+                    encoder=JSONEncoder,
+                    safe=False,
+                    status=status,
+                )
+            )
+
         #
         # Apply Any Global Filters (if identified)
         #
@@ -1598,27 +2337,56 @@ class NotifyView(View):
             # fall back to WARNING so LogCapture receives a valid integer.
             level = logging.WARNING
 
-        # Initialize our response object
-        response = None
+        if JobQueue.root and is_async_request(request):
+            # Queue our notification for background delivery
+            return _enqueue_notification(
+                request,
+                {
+                    "source": request.META["REMOTE_ADDR"],
+                    "key": key,
+                    "config": config,
+                    "format": format,
+                    "asset": kwargs,
+                    "level": level,
+                    "body": content.get("body"),
+                    "title": content.get("title", ""),
+                    "type": content.get("type", apprise.NotifyType.INFO.value),
+                    "tag": (content.get("tag") or None),
+                },
+                attach,
+                json_response,
+            )
 
-        esc = "<!!-!ESC!-!!>"
+        # Bound the number of services we notify at the same time (and
+        # track how long each of them takes); our configuration is parsed
+        # as our services are looked up
+        with timer.phase(metrics.PHASE_PARSE):
+            tracker = AppriseServiceTracker(a_obj, tag=(content.get("tag") or None), concurrency=concurrency)
 
-        if json_response:
-            fmt = f'["%(levelname)s","%(asctime)s","{esc}%(message)s{esc}"]'
+        if is_stream_request(request):
+            # Stream our logs back as they are produced
+            return _stream_notification(
+                request,
+                a_obj,
+                {
+                    "body": content.get("body"),
+                    "title": content.get("title", ""),
+                    "notify_type": content.get("type", apprise.NotifyType.INFO.value),
+                    "tag": (content.get("tag") or None),
+                    "attach": attach,
+                },
+                level,
+                "application/x-ndjson" if json_response or is_ndjson_response(request) else content_type,
+                timer,
+                services=tracker.services,
+                key=key,
+            )
 
-        else:
-            # Format is only updated if the content_type is html
-            fmt = (
-                '<li class="log_%(levelname)s">'
-                '<div class="log_time">%(asctime)s</div>'
-                '<div class="log_level">%(levelname)s</div>'
-                f'<div class="log_msg">{esc}%(message)s{esc}</div></li>'
-                if content_type == "text/html"
-                else settings.LOGGING["formatters"]["standard"]["format"]
-            )
-
-        # Now specify our format (and over-ride the default):
-        with apprise.LogCapture(level=level, fmt=fmt) as logs:
+        # Initialize our response object
+        response = None
+
+        # Capture the logs produced while we notify
+        with timer.phase(metrics.PHASE_DELIVERY), AppriseLogCapture(level=level) as logs:
             # Perform our notification at this point
             result = a_obj.notify(
                 content.get("body"),
@@ -1628,34 +2396,20 @@ class NotifyView(View):
                 attach=attach,
             )
 
-        if json_response:
-            esc = re.escape(esc)
-            entries = re.findall(
-                r'\r*\n?(?P<head>\["[^"]+","[^"]+",)"{}(?P<to_escape>.+?)'
-                r'{}"(?P<tail>\]\r*\n?$)(?=$|\r*\n?\["[^"]+","[^"]+","{})'.format(esc, esc, esc),
-                logs.getvalue(),
-                re.DOTALL | re.MULTILINE,
-            )
+        metrics.observe_request(key, result, attach)
 
-            # Prepare ourselves a JSON Response
-            response = json.loads("[{}]".format(",".join([e[0] + json.dumps(e[1].rstrip()) + e[2] for e in entries])))
+        with timer.phase(metrics.PHASE_RENDER):
+            if json_response:
+                response = [log_entry(record, "application/json") for record in logs.records]
 
-        elif content_type == "text/html":
-            # Iterate over our entries so that we can prepare to escape
-            # things to be presented as HTML
-            esc = re.escape(esc)
-            entries = re.findall(
-                r'\r*\n?(?P<head><li class="log_.+?){}(?P<to_escape>.+?)'
-                r'{}(?P<tail></div></li>\r*\n?$)(?=$|\r*\n?<li class="log_.+{})'.format(esc, esc, esc),
-                logs.getvalue(),
-                re.DOTALL | re.MULTILINE,
-            )
-
-            # Wrap logs in `<ul>` tag and escape our message body:
-            response = '<ul class="logs">{}</ul>'.format("".join([e[0] + escape(e[1]) + e[2] for e in entries]))
+            elif content_type == "text/html":
+                # Wrap logs in `<ul>` tag (our messages are escaped)
+                response = '<ul class="logs">{}</ul>'.format(
+                    "".join([log_entry(record, "text/html") for record in logs.records])
+                )
 
-        else:  # content_type == 'text/plain'
-            response = logs.getvalue()
+            else:  # content_type == 'text/plain'
+                response = "".join([log_entry(record) for record in logs.records])
 
         if settings.APPRISE_WEBHOOK_URL:
             webhook_payload = {
@@ -1689,6 +2443,7 @@ class NotifyView(View):
                     {
                         "error": msg,
                         "details": response,
+                        "services": tracker.services,
                     },
                     encoder=JSONEncoder,
                     safe=False,
@@ -1712,6 +2467,7 @@ class NotifyView(View):
                 {
                     "error": None,
                     "details": response,
+                    "services": tracker.services,
                 },
                 encoder=JSONEncoder,
                 safe=False,
@@ -1720,7 +2476,7 @@ class NotifyView(View):
         )
 
 
-@method_decorator((gzip_page, never_cache), name="dispatch")
+@method_decorator((gzip_page, never_cache, server_timing(observe=True), attachment_scope), name="dispatch")
 class StatelessNotifyView(View):
     """
     A Django view for sending a stateless notification
@@ -1750,7 +2506,10 @@ class StatelessNotifyView(View):
             if rules:
                 # Create a copy
                 data = request.POST.copy()
-                if not remap_fields(rules, data, form=NotifyByUrlForm()):
+                with request.timer.phase(metrics.PHASE_REMAP):
+                    mapped = remap_fields(rules, data, form=NotifyByUrlForm())
+
+                if not mapped:
                     status = ResponseCode.bad_request
                     msg = _("Payload field mapping failed")
                     return (
@@ -1770,18 +2529,23 @@ class StatelessNotifyView(View):
                 # Just create a pointer
                 data = request.POST
 
-            form = NotifyByUrlForm(data=data, files=request.FILES)
-            if form.is_valid():
-                content.update(form.cleaned_data)
+            with request.timer.phase(metrics.PHASE_BODY):
+                form = NotifyByUrlForm(data=data, files=request.FILES)
+                if form.is_valid():
+                    content.update(form.cleaned_data)
 
         else:  # JSON Payload
             # Prepare our default response
             try:
                 # load our JSON content
-                content = json.loads(request.body.decode("utf-8"))
+                with request.timer.phase(metrics.PHASE_BODY):
+                    content = json.loads(request.body.decode("utf-8"))
 
                 # Apply content rules
-                if rules and not remap_fields(rules, content, form=NotifyByUrlForm()):
+                with request.timer.phase(metrics.PHASE_REMAP):
+                    mapped = not rules or remap_fields(rules, content, form=NotifyByUrlForm())
+
+                if not mapped:
                     status = ResponseCode.bad_request
                     msg = _("Payload field mapping failed")
                     return (
@@ -1985,7 +2749,8 @@ class StatelessNotifyView(View):
 
         if "attachment" in content or request.FILES:
             try:
-                attach = parse_attachments(content.get("attachment"), request.FILES)
+                with request.timer.phase(metrics.PHASE_ATTACHMENTS):
+                    attach = parse_attachments(content.get("attachment"), request.FILES)
 
             except (TypeError, ValueError) as e:
                 # Invalid entry found in list
@@ -2148,6 +2913,32 @@ class StatelessNotifyView(View):
         if uid:
             kwargs["_uid"] = uid
 
+        # Acquire the number of services we may notify at the same time
+        try:
+            concurrency = notify_concurrency(request)
+
+        except (TypeError, ValueError):
+            logger.warning(
+                "NOTIFY - %s - Invalid concurrency value (%s) provided",
+                request.META["REMOTE_ADDR"],
+                request.headers.get("X-Apprise-Concurrency", "")[:12],
+            )
+
+            status = ResponseCode.bad_request
+            msg = _("An invalid concurrency value was specified")
+            return (
+                HttpResponse(msg, status=status, content_type="text/plain")
+                if not json_response
+                else JsonResponse(
+                    {
+                        "error": msg,
+                    },
+                    encoder=JSONEncoder,
+                    safe=False,
+                    status=status,
+                )
+            )
+
         #
         # Apply Any Global Filters (if identified)
         #
@@ -2160,7 +2951,9 @@ class StatelessNotifyView(View):
         a_obj = apprise.Apprise(asset=asset)
 
         # Add URLs
-        a_obj.add(content.get("urls"))
+        timer = request.timer
+        with timer.phase(metrics.PHASE_PARSE):
+            a_obj.add(content.get("urls"))
         if not len(a_obj):
             logger.warning(
                 "NOTIFY - %s - No valid URLs provided",
@@ -2243,27 +3036,51 @@ class StatelessNotifyView(View):
             # fall back to WARNING so LogCapture receives a valid integer.
             level = logging.WARNING
 
-        # Initialize our response object
-        response = None
+        if JobQueue.root and is_async_request(request):
+            # Queue our notification for background delivery
+            return _enqueue_notification(
+                request,
+                {
+                    "source": request.META["REMOTE_ADDR"],
+                    "urls": content.get("urls"),
+                    "asset": kwargs,
+                    "level": level,
+                    "body": content.get("body"),
+                    "title": content.get("title", ""),
+                    "type": content.get("type", apprise.NotifyType.INFO.value),
+                    "tag": (content.get("tag") or "all"),
+                },
+                attach,
+                json_response,
+            )
+
+        # Bound the number of services we notify at the same time (and
+        # track how long each of them takes)
+        tracker = AppriseServiceTracker(a_obj, tag=(content.get("tag") or "all"), concurrency=concurrency)
 
-        esc = "<!!-!ESC!-!!>"
+        if is_stream_request(request):
+            # Stream our logs back as they are produced
+            return _stream_notification(
+                request,
+                a_obj,
+                {
+                    "body": content.get("body"),
+                    "title": content.get("title", ""),
+                    "notify_type": content.get("type", apprise.NotifyType.INFO.value),
+                    "tag": (content.get("tag") or "all"),
+                    "attach": attach,
+                },
+                level,
+                "application/x-ndjson" if json_response or is_ndjson_response(request) else content_type,
+                timer,
+                services=tracker.services,
+            )
 
-        if json_response:
-            fmt = f'["%(levelname)s","%(asctime)s","{esc}%(message)s{esc}"]'
+        # Initialize our response object
+        response = None
 
-        else:
-            # Format is only updated if the content_type is html
-            fmt = (
-                '<li class="log_%(levelname)s">'
-                '<div class="log_time">%(asctime)s</div>'
-                '<div class="log_level">%(levelname)s</div>'
-                f'<div class="log_msg">{esc}%(message)s{esc}</div></li>'
-                if content_type == "text/html"
-                else settings.LOGGING["formatters"]["standard"]["format"]
-            )
-
-        # Now specify our format (and over-ride the default):
-        with apprise.LogCapture(level=level, fmt=fmt) as logs:
+        # Capture the logs produced while we notify
+        with timer.phase(metrics.PHASE_DELIVERY), AppriseLogCapture(level=level) as logs:
             # Perform our notification at this point
             result = a_obj.notify(
                 content.get("body"),
@@ -2273,34 +3090,20 @@ class StatelessNotifyView(View):
                 attach=attach,
             )
 
-        if json_response:
-            esc = re.escape(esc)
-            entries = re.findall(
-                r'\r*\n?(?P<head>\["[^"]+","[^"]+",)"{}(?P<to_escape>.+?)'
-                r'{}"(?P<tail>\]\r*\n?$)(?=$|\r*\n?\["[^"]+","[^"]+","{})'.format(esc, esc, esc),
-                logs.getvalue(),
-                re.DOTALL | re.MULTILINE,
-            )
+        metrics.observe_request(None, result, attach)
 
-            # Prepare ourselves a JSON Response
-            response = json.loads("[{}]".format(",".join([e[0] + json.dumps(e[1].rstrip()) + e[2] for e in entries])))
+        with timer.phase(metrics.PHASE_RENDER):
+            if json_response:
+                response = [log_entry(record, "application/json") for record in logs.records]
 
-        elif content_type == "text/html":
-            # Iterate over our entries so that we can prepare to escape
-            # things to be presented as HTML
-            esc = re.escape(esc)
-            entries = re.findall(
-                r'\r*\n?(?P<head><li class="log_.+?){}(?P<to_escape>.+?)'
-                r'{}(?P<tail></div></li>\r*\n?$)(?=$|\r*\n?<li class="log_.+{})'.format(esc, esc, esc),
-                logs.getvalue(),
-                re.DOTALL | re.MULTILINE,
-            )
-
-            # Wrap logs in `<ul>` tag and escape our message body:
-            response = '<ul class="logs">{}</ul>'.format("".join([e[0] + escape(e[1]) + e[2] for e in entries]))
+            elif content_type == "text/html":
+                # Wrap logs in `<ul>` tag (our messages are escaped)
+                response = '<ul class="logs">{}</ul>'.format(
+                    "".join([log_entry(record, "text/html") for record in logs.records])
+                )
 
-        else:  # content_type == 'text/plain'
-            response = logs.getvalue()
+            else:  # content_type == 'text/plain'
+                response = "".join([log_entry(record) for record in logs.records])
 
         if settings.APPRISE_WEBHOOK_URL:
             webhook_payload = {
@@ -2334,6 +3137,7 @@ class StatelessNotifyView(View):
                     {
                         "error": msg,
                         "details": response,
+                        "services": tracker.services,
                     },
                     encoder=JSONEncoder,
                     safe=False,
@@ -2355,6 +3159,7 @@ class StatelessNotifyView(View):
                 {
                     "error": None,
                     "details": response,
+                    "services": tracker.services,
                 },
                 encoder=JSONEncoder,
                 safe=False,
@@ -2363,7 +3168,68 @@ class StatelessNotifyView(View):
         )
 
 
+@method_decorator((never_cache, server_timing(observe=True), attachment_scope), name="dispatch")
+class BatchNotifyView(View):
+    """
+    A Django view for sending a batch of notifications in a stateful manner
+    """
+
+    def post(self, request, key):
+        """
+        Handle a POST request
+        """
+        return _notify_batch(request, key=key)
+
+
+@method_decorator((never_cache, server_timing(observe=True), attachment_scope), name="dispatch")
+class StatelessBatchNotifyView(View):
+    """
+    A Django view for sending a batch of stateless notifications
+    """
+
+    def post(self, request):
+        """
+        Handle a POST request
+        """
+        return _notify_batch(request)
+
+
 @method_decorator((gzip_page, never_cache), name="dispatch")
+class JobView(View):
+    """
+    A Django view that reports on a notification queued for asynchronous
+    delivery
+    """
+
+    def get(self, request, job_id):
+        """
+        Handle a GET request
+        """
+        response = JobQueue.status(job_id) if JobQueue.root else None
+        if response is None:
+            status = ResponseCode.not_found
+            msg = _("There was no job found")
+            return JsonResponse(
+                {
+                    "error": msg,
+                },
+                encoder=JSONEncoder,
+                safe=False,
+                status=status,
+            )
+
+        # Our captured logs (once delivered)
+        response.setdefault("details", [])
+
+        return JsonResponse(
+            response,
+            encoder=JSONEncoder,
+            safe=False,
+            status=ResponseCode.okay,
+        )
+
+
+@method_decorator((gzip_page, never_cache, server_timing()), name="dispatch")
 class JsonUrlView(View):
     """
     A Django view that lists all loaded tags and URLs for a given key
@@ -2409,7 +3275,10 @@ class JsonUrlView(View):
         # Optionally filter on tags. Use comma to identify more then one
         tag = request.GET.get("tag", "all")
 
-        config, format = ConfigCache.get(key)
+        timer = request.timer
+        with timer.phase(metrics.PHASE_CONFIG_LOAD):
+            config, format = ConfigCache.get(key)
+
         if config is None:
             # The returned value of config and format tell a rather cryptic
             # story; this portion could probably be updated in the future.
@@ -2441,13 +3310,17 @@ class JsonUrlView(View):
         # Create an apprise config object
         ac_obj = apprise.AppriseConfig(recursion=settings.APPRISE_RECURSION_MAX)
 
-        # Load our configuration
-        ac_obj.add_config(config, format=format)
+        with timer.phase(metrics.PHASE_PARSE):
+            # Load our configuration
+            ac_obj.add_config(config, format=format)
 
-        # Add our configuration
-        a_obj.add(ac_obj)
+            # Add our configuration
+            a_obj.add(ac_obj)
+
+            # Our configuration is only parsed once it is first needed
+            notifications = list(a_obj.find(tag))
 
-        for notification in a_obj.find(tag):
+        for notification in notifications:
             details = sorted(
                 [tag_detail(t) for t in notification.tags],
                 key=lambda item: (item["name"], item["priority"]),
@@ -199,6 +199,36 @@ APPRISE_CONFIG_DIR = os.environ.get("APPRISE_CONFIG_DIR", os.path.join(BASE_DIR,
 # The location to store Apprise Persistent Storage files
 APPRISE_STORAGE_DIR = os.environ.get("APPRISE_STORAGE_DIR", os.path.join(APPRISE_CONFIG_DIR, "store"))
 
+# The location notifications accepted for asynchronous delivery are queued
+# in (until they are delivered and their retention period expires); setting
+# this to an empty string disables asynchronous delivery altogether.
+APPRISE_JOB_DIR = os.environ.get("APPRISE_JOB_DIR", os.path.join(APPRISE_CONFIG_DIR, "jobs"))
+
+# The number of seconds the outcome of an asynchronous notification remains
+# available from the /job/{ID} endpoint once it has been delivered
+APPRISE_JOB_RETENTION = abs(int(os.environ.get("APPRISE_JOB_RETENTION", 86400)))
+
+# The number of asynchronous notifications delivered at the same time (per
+# process)
+APPRISE_JOB_CONCURRENCY = max(1, int(os.environ.get("APPRISE_JOB_CONCURRENCY", 4)))
+
+# Asynchronous notifications are delivered by the (web) worker that accepted
+# them.  Set this to no to leave their delivery entirely to the dedicated
+# delivery process (see the jobworker management command) instead.
+APPRISE_JOB_INLINE = os.environ.get("APPRISE_JOB_INLINE", "yes")[0].lower() in ("a", "y", "1", "t", "e", "+")
+
+# The number of seconds to wait before attempting to deliver an asynchronous
+# notification to a service that failed (and has retries left) again; this
+# doubles with every attempt made (up to an hour).
+APPRISE_JOB_RETRY_DELAY = abs(float(os.environ.get("APPRISE_JOB_RETRY_DELAY", 30)))
+
+# The maximum number of messages that can be sent in a single batch request
+APPRISE_BATCH_MAX = max(1, int(os.environ.get("APPRISE_BATCH_MAX", 500)))
+
+# The number of messages (of a single batch request) delivered at the same
+# time
+APPRISE_BATCH_CONCURRENCY = max(1, int(os.environ.get("APPRISE_BATCH_CONCURRENCY", 4)))
+
 # Default number of days to prune persistent storage
 APPRISE_STORAGE_PRUNE_DAYS = int(os.environ.get("APPRISE_STORAGE_PRUNE_DAYS", 30))
 
@@ -221,6 +251,34 @@ APPRISE_ATTACH_DIR = os.environ.get("APPRISE_ATTACH_DIR", os.path.join(BASE_DIR,
 # The maximum file attachment size allowed by the API (defined in MB)
 APPRISE_ATTACH_SIZE = int(os.environ.get("APPRISE_ATTACH_SIZE", 200)) * 1048576
 
+# Attachments up to this size (defined in KB) are kept in memory (written to
+# the tmpfs found at APPRISE_ATTACH_MEMORY_DIR) instead of APPRISE_ATTACH_DIR;
+# larger ones (or those whose size is not known up front) are written to
+# disk.  Setting this to zero disables this.
+APPRISE_ATTACH_MEMORY_SIZE = abs(int(os.environ.get("APPRISE_ATTACH_MEMORY_SIZE", 1024))) * 1024
+
+# The (memory backed) location small attachments are kept
+APPRISE_ATTACH_MEMORY_DIR = os.environ.get(
+    "APPRISE_ATTACH_MEMORY_DIR", os.path.join("/dev/shm", "apprise") if os.path.isdir("/dev/shm") else ""
+)
+
+# The number of seconds a retrieved web attachment is reused for (by other
+# notifications referencing the same URL) before it is revalidated with the
+# server that provided it.  Setting this to zero disables the cache.
+APPRISE_ATTACH_CACHE_TTL = abs(int(os.environ.get("APPRISE_ATTACH_CACHE_TTL", 0)))
+
+# The maximum size (defined in MB) of the web attachments we cache
+APPRISE_ATTACH_CACHE_SIZE = abs(int(os.environ.get("APPRISE_ATTACH_CACHE_SIZE", 100))) * 1048576
+
+# The location cached web attachments are kept
+APPRISE_ATTACH_CACHE_DIR = os.environ.get("APPRISE_ATTACH_CACHE_DIR", os.path.join(APPRISE_ATTACH_DIR, "cache"))
+
+# Attachments are removed as soon as the request they belong to is done with
+# them; those left behind (such as when a worker is killed) are removed by
+# our sweeper (the attachsweep command) once they are older than this many
+# seconds.
+APPRISE_ATTACH_SWEEP_AGE = abs(int(os.environ.get("APPRISE_ATTACH_SWEEP_AGE", 3600)))
+
 # A provided list that identify all of the URLs/Hosts/IPs that Apprise can
 # retrieve remote attachments from.
 #
@@ -259,6 +317,27 @@ APPRISE_ATTACH_DENY_URLS = os.environ.get("APPRISE_ATTACH_REJECT_URL", "127.0.*
 # The Allow list which is processed after the Deny list above
 APPRISE_ATTACH_ALLOW_URLS = os.environ.get("APPRISE_ATTACH_ALLOW_URL", "*").lower()
 
+# The number of seconds the addresses a host resolved to (when checking it
+# against the "internal" token above) are remembered for; hosts that could
+# not be resolved are only remembered for a few seconds.  Setting this to
+# zero disables the cache.
+APPRISE_ATTACH_RESOLVE_CACHE_TTL = abs(int(os.environ.get("APPRISE_ATTACH_RESOLVE_CACHE_TTL", 60)))
+
+# The maximum number of hosts whose addresses are remembered
+APPRISE_ATTACH_RESOLVE_CACHE_SIZE = abs(int(os.environ.get("APPRISE_ATTACH_RESOLVE_CACHE_SIZE", 1024)))
+
+# Web attachments whose host was resolved (and validated) by the "internal"
+# token above are retrieved from those very same addresses; their host is
+# not resolved a second time (and can not resolve somewhere else in between)
+APPRISE_ATTACH_PIN_ADDRESSES = os.environ.get("APPRISE_ATTACH_PIN_ADDRESSES", "yes")[0].lower() in (
+    "a",
+    "y",
+    "1",
+    "t",
+    "e",
+    "+",
+)
+
 
 # The maximum size in bytes that a request body may be before raising an error
 # (defined in MB)
@@ -308,9 +387,65 @@ APPRISE_STATELESS_STORAGE = os.environ.get("APPRISE_STATELESS_STORAGE", "no")[0]
 # Defines the stateful mode; possible values are:
 # - hash (default): content is hashed and zipped
 # - simple: content is just written straight to disk 'as-is'
+# - sqlite: content is compressed and stored in a single SQLite database
+#   (config.db) found in the APPRISE_CONFIG_DIR
 # - disabled: disable all stateful functionality
 APPRISE_STATEFUL_MODE = os.environ.get("APPRISE_STATEFUL_MODE", "hash")
 
+# Defines how configuration is written when the stateful mode is set to hash;
+# possible values are:
+# - gzip (default): content is gzip compressed
+# - zlib: content is compressed (raw deflate) without the gzip framing
+# - none: content is written uncompressed
+# Configuration written with any of these can always be read back, so this
+# can be changed at any time.
+APPRISE_CONFIG_CODEC = os.environ.get("APPRISE_CONFIG_CODEC", "gzip")
+
+# The compression level (1 being the fastest and 9 the smallest) used by the
+# gzip and zlib codecs above
+APPRISE_CONFIG_COMPRESS_LEVEL = int(os.environ.get("APPRISE_CONFIG_COMPRESS_LEVEL", 9))
+
+# Ensures configuration written to disk (in any stateful mode) reaches the
+# disk before it is reported as saved; this makes it survive a system crash
+# at the cost of a slower write.  Configuration is always replaced atomically
+# (it is never left half written) whether or not this is set.
+APPRISE_CONFIG_FSYNC = os.environ.get("APPRISE_CONFIG_FSYNC", "no")[0].lower() in (
+    "a",
+    "y",
+    "1",
+    "t",
+    "e",
+    "+",
+)
+
+# The number of decoded configurations each worker keeps in memory so that
+# repeated notifications to the same {KEY} do not have to re-read (and
+# decompress) them from disk.  Entries are validated (see
+# APPRISE_CONFIG_GENERATION_FILE below) on every use so that changes made by
+# any worker are always honoured.
+# Setting this to zero (0) disables the in-memory configuration cache.
+APPRISE_CONFIG_CACHE_SIZE = abs(int(os.environ.get("APPRISE_CONFIG_CACHE_SIZE", 128)))
+
+# The number of {KEY}s each worker remembers the format (text or yaml) of so
+# that their configuration is opened directly instead of being probed for.
+# Entries are only used while APPRISE_CONFIG_GENERATION_FILE (below) reports
+# no change to their {KEY}.
+# Setting this to zero (0) disables the index.
+APPRISE_CONFIG_INDEX_SIZE = abs(int(os.environ.get("APPRISE_CONFIG_INDEX_SIZE", 16384)))
+
+# A small file (memory mapped by every worker) used to announce configuration
+# changes between workers; a worker that adds or removes a configuration
+# bumps a counter here that the others check before using what they cached.
+# This spares a stat() of the configuration file on every notification when
+# running in the hash mode (and allows the sqlite mode to cache at all).
+#
+# The file must be shared by all processes that write to APPRISE_CONFIG_DIR
+# (e.g. /dev/shm/apprise-api.gen when they all run on the same host).  It is
+# not set by default since a configuration directory shared between several
+# hosts would otherwise have each of them serve what it cached indefinitely;
+# cached configuration is then validated against the disk instead.
+APPRISE_CONFIG_GENERATION_FILE = os.environ.get("APPRISE_CONFIG_GENERATION_FILE", "")
+
 # Our Apprise Deny List
 # - By default we disable all non-remote calling services
 # - You do not need to identify every schema supported by the service you
@@ -332,9 +467,21 @@ APPRISE_ALLOW_SERVICES = os.environ.get("APPRISE_ALLOW_SERVICES", "")
 # 1 level of recursion
 APPRISE_RECURSION_MAX = int(os.environ.get("APPRISE_RECURSION_MAX", 1))
 
+# The maximum number of services a single notification is delivered to at
+# the same time; a request can lower (but never raise) this using the
+# X-Apprise-Concurrency header.  Set this to 1 to notify each service one
+# after another.
+APPRISE_NOTIFY_CONCURRENCY = max(1, int(os.environ.get("APPRISE_NOTIFY_CONCURRENCY", 8)))
+
 # Provided optional plugin paths to scan for custom schema definitions
 APPRISE_PLUGIN_PATHS = os.environ.get("APPRISE_PLUGIN_PATHS", os.path.join(BASE_DIR, "var", "plugin")).split(",")
 
+# The number of web attachments (of a single request) retrieved at the same
+# time, and the number of seconds we allow for all of them to be retrieved.
+# Setting the timeout to zero disables it.
+APPRISE_ATTACH_FETCH_CONCURRENCY = max(1, int(os.environ.get("APPRISE_ATTACH_FETCH_CONCURRENCY", 4)))
+APPRISE_ATTACH_FETCH_TIMEOUT = abs(float(os.environ.get("APPRISE_ATTACH_FETCH_TIMEOUT", 60)))
+
 # Define the number of attachments that can exist as part of a payload
 # Setting this to zero disables the limit
 APPRISE_MAX_ATTACHMENTS = int(os.environ.get("APPRISE_MAX_ATTACHMENTS", 6))
@@ -360,7 +507,7 @@ APPRISE_API_ONLY = os.environ.get("APPRISE_API_ONLY", "no")[0].lower() in (
 )
 
 # Allow Admin mode:
-# - showing a list of configuration keys (when STATEFUL_MODE is set to simple)
+# - showing a list of configuration keys (unless STATEFUL_MODE is set to disabled)
 APPRISE_ADMIN = os.environ.get("APPRISE_ADMIN", "no")[0].lower() in (
     "a",
     "y",
@@ -370,6 +517,28 @@ APPRISE_ADMIN = os.environ.get("APPRISE_ADMIN", "no")[0].lower() in (
     "+",
 )
 
+# The number of configuration keys listed (per page) by default
+APPRISE_ADMIN_PAGE_SIZE = max(1, int(os.environ.get("APPRISE_ADMIN_PAGE_SIZE", 100)))
+
+# Server-Timing:
+# - report the time spent handling each phase of a request (parsing,
+#   loading configuration, delivery, etc) back through a Server-Timing
+#   response header.
+# - The default value of this is 'no'
+APPRISE_SERVER_TIMING = os.environ.get("APPRISE_SERVER_TIMING", "no")[0].lower() in (
+    "a",
+    "y",
+    "1",
+    "t",
+    "e",
+    "+",
+)
+
+# A token that (when set) lets an individual request ask for the
+# Server-Timing header by providing it in the X-Apprise-Server-Timing header;
+# this works even if APPRISE_SERVER_TIMING is not set.
+APPRISE_SERVER_TIMING_TOKEN = os.environ.get("APPRISE_SERVER_TIMING_TOKEN", "")
+
 # Allow Interpret Emojis override
 APPRISE_INTERPRET_EMOJIS = (
     None
@@ -24,6 +24,7 @@
 
 # To create a valid debug settings.py we need to intentionally pollute our
 # file with all of the content found in the master configuration.
+import os
 from tempfile import TemporaryDirectory
 
 from .. import *  # noqa F403
@@ -37,5 +38,10 @@ ALLOWED_HOSTS = []
 # A temporary directory to work in for unit testing
 APPRISE_CONFIG_DIR = TemporaryDirectory().name
 
+# Our asynchronous notifications are queued alongside our configuration
+APPRISE_JOB_DIR = os.path.join(APPRISE_CONFIG_DIR, "jobs")
+
+APPRISE_ATTACH_MEMORY_DIR = os.path.join(APPRISE_CONFIG_DIR, "memory")
+
 # Setup our runner
 TEST_RUNNER = "core.settings.pytest.runner.PytestTestRunner"